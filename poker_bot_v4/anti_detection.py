@@ -5,13 +5,13 @@ POKER BOT V4.0 - ANTI-DETECTION
 """
 
 import time
-import random
 import math
 import logging
 from typing import Optional, Tuple
 from dataclasses import dataclass
 
 from constants import Street, ActionType, MistakeType
+from rng import RandomLike, make_random
 
 log = logging.getLogger("AntiDetection")
 
@@ -30,8 +30,9 @@ class TimingConfig:
 class HumanTimer:
     """İnsan benzeri zamanlama simülatörü."""
     
-    def __init__(self, config: Optional[TimingConfig] = None):
+    def __init__(self, config: Optional[TimingConfig] = None, rng: RandomLike = None):
         self.config = config or TimingConfig()
+        self.rng = make_random(rng)
         self.tilt_level = 0.0
         self.session_start = time.time()
         self.recent_losses = 0
@@ -68,12 +69,12 @@ class HumanTimer:
         
         # Tilt etkisi
         if self.tilt_level > 0.5:
-            if random.random() < 0.5:
+            if self.rng.random() < 0.5:
                 mu *= self.config.tilt_fast_factor
             else:
                 mu *= self.config.tilt_slow_factor
         
-        delay = random.lognormvariate(math.log(mu), sigma)
+        delay = self.rng.lognormvariate(math.log(mu), sigma)
         delay = max(self.config.min_delay, min(delay, self.config.max_delay))
         
         return round(delay, 2)
@@ -91,8 +92,9 @@ class HumanTimer:
 class MistakeMaker:
     """Kasıtlı hata yapıcı."""
     
-    def __init__(self, mistake_probability: float = 0.03):
+    def __init__(self, mistake_probability: float = 0.03, rng: RandomLike = None):
         self.mistake_prob = mistake_probability
+        self.rng = make_random(rng)
         self.mistakes_made = 0
         self.total_decisions = 0
     
@@ -100,11 +102,11 @@ class MistakeMaker:
         """Bu karar için hata yapılmalı mı?"""
         self.total_decisions += 1
         
-        if random.random() < self.mistake_prob:
+        if self.rng.random() < self.mistake_prob:
             return True
         
         if self.total_decisions - self.mistakes_made > 100:
-            return random.random() < 0.1
+            return self.rng.random() < 0.1
         
         return False
     
@@ -122,7 +124,7 @@ class MistakeMaker:
         
         choices = list(weights.keys())
         probs = list(weights.values())
-        return random.choices(choices, weights=probs)[0]
+        return self.rng.choices(choices, weights=probs)[0]
     
     def apply_mistake(
         self, 
@@ -135,7 +137,7 @@ class MistakeMaker:
         
         if mistake_type == MistakeType.OVERBET_BLUFF:
             if original_action.action in [ActionType.BET, ActionType.RAISE]:
-                new_amount = original_action.amount * random.uniform(1.5, 2.0)
+                new_amount = original_action.amount * self.rng.uniform(1.5, 2.0)
                 return PokerAction(
                     original_action.action, 
                     new_amount,
@@ -144,7 +146,7 @@ class MistakeMaker:
         
         elif mistake_type == MistakeType.UNDERBET_VALUE:
             if original_action.action in [ActionType.BET, ActionType.RAISE]:
-                new_amount = original_action.amount * random.uniform(0.5, 0.7)
+                new_amount = original_action.amount * self.rng.uniform(0.5, 0.7)
                 return PokerAction(
                     original_action.action,
                     max(new_amount, pot * 0.2),
@@ -187,13 +189,14 @@ class MistakeMaker:
 class BettingPatternVariator:
     """Betting pattern'leri çeşitlendirici."""
     
-    def __init__(self, variance_factor: float = 0.15):
+    def __init__(self, variance_factor: float = 0.15, rng: RandomLike = None):
         self.variance = variance_factor
+        self.rng = make_random(rng)
         self.history = []
     
     def vary_bet_size(self, base_amount: float, pot: float) -> float:
         """Bet miktarına rastgele varyans ekler."""
-        multiplier = random.uniform(1 - self.variance, 1 + self.variance)
+        multiplier = self.rng.uniform(1 - self.variance, 1 + self.variance)
         varied = base_amount * multiplier
         varied = self._round_to_human(varied)
         return max(varied, pot * 0.2)
@@ -227,11 +230,13 @@ class AntiDetectionSystem:
         self,
         timing_config: Optional[TimingConfig] = None,
         mistake_probability: float = 0.03,
-        variance_factor: float = 0.15
+        variance_factor: float = 0.15,
+        rng: RandomLike = None
     ):
-        self.timer = HumanTimer(timing_config)
-        self.mistake_maker = MistakeMaker(mistake_probability)
-        self.bet_variator = BettingPatternVariator(variance_factor)
+        self.rng = make_random(rng)
+        self.timer = HumanTimer(timing_config, self.rng)
+        self.mistake_maker = MistakeMaker(mistake_probability, self.rng)
+        self.bet_variator = BettingPatternVariator(variance_factor, self.rng)
         self.enabled = True
         log.info("Anti-Detection System initialized")
     
@@ -0,0 +1,158 @@
+"""
+POKER BOT V4.0 - BATCH EVALUATOR
+================================
+NumPy ile vektörize el değerlendirme.
+LookupEvaluator ile aynı tabloları kullanır; N x (5-7) kart indeksi
+matrisini tek çağrıda N rank'a çevirir.
+"""
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+from lookup_evaluator import (
+    LookupEvaluator, _CARD_KEYS, _SUIT_BASE, _FLUSH_BITS, _FLUSH_SUIT, _RANK_KEY_MASK
+)
+
+
+class BatchEvaluator:
+    """
+    Vektörize lookup değerlendiricisi.
+
+    Suit'siz eller sıralı anahtar dizisinde searchsorted ile, flush'lar
+    8192 elemanlı maske tablosundan okunur. Skalar evaluator ile birebir
+    aynı rank'ları üretir.
+    """
+
+    _card_keys: Optional[np.ndarray] = None
+    _unsuited_keys: Optional[np.ndarray] = None
+    _unsuited_ranks: Optional[np.ndarray] = None
+    _flush_ranks: Optional[np.ndarray] = None
+
+    def __init__(self):
+        if BatchEvaluator._card_keys is None:
+            BatchEvaluator._build_tables()
+
+    @classmethod
+    def _build_tables(cls) -> None:
+        """Skalar tabloları NumPy dizilerine çevirir."""
+        lookup = LookupEvaluator()
+        items = sorted(lookup._unsuited.items())
+
+        cls._card_keys = np.array(_CARD_KEYS, dtype=np.int64)
+        cls._unsuited_keys = np.array([k for k, _ in items], dtype=np.int64)
+        cls._unsuited_ranks = np.array([r for _, r in items], dtype=np.int32)
+        cls._flush_ranks = np.array(lookup._flush, dtype=np.int32)
+
+    def evaluate(self, cards: np.ndarray) -> np.ndarray:
+        """
+        Kart indeksi matrisini değerlendirir.
+
+        Args:
+            cards: (N, 5-7) boyutlu 0-51 kart indeksleri
+
+        Returns:
+            (N,) boyutlu int32 rank dizisi (1-7462)
+        """
+        cards = np.asarray(cards)
+        if cards.ndim != 2 or not 5 <= cards.shape[1] <= 7:
+            raise ValueError(f"(N, 5-7) boyutlu kart matrisi gerekli: {cards.shape}")
+        cards = cards.astype(np.int64, copy=False)
+
+        # Tek anahtar: rank sayaçları + suit sayaçları (skalar evaluator ile aynı)
+        keys = self._card_keys[cards].sum(axis=1) + _SUIT_BASE
+        ranks = self._unsuited_ranks[
+            np.searchsorted(self._unsuited_keys, keys & _RANK_KEY_MASK)
+        ]
+
+        # Flush: sadece 5+ aynı suit içeren satırlar için rank maskesi
+        flush_bits = keys & _FLUSH_BITS
+        rows = np.flatnonzero(flush_bits)
+        if rows.size:
+            flush_suit = np.zeros(rows.size, dtype=np.int64)
+            for bit, suit in _FLUSH_SUIT.items():
+                flush_suit[flush_bits[rows] == bit] = suit
+            flush_cards = cards[rows]
+            bits = np.where(
+                (flush_cards & 3) == flush_suit[:, None],
+                np.left_shift(1, flush_cards >> 2), 0
+            )
+            ranks[rows] = self._flush_ranks[np.bitwise_or.reduce(bits, axis=1)]
+
+        return ranks
+
+
+_shared: Optional[BatchEvaluator] = None
+
+
+def evaluate_batch(cards: np.ndarray) -> np.ndarray:
+    """(N, 5-7) kart matrisini paylaşılan BatchEvaluator ile değerlendirir."""
+    global _shared
+    if _shared is None:
+        _shared = BatchEvaluator()
+    return _shared.evaluate(cards)
+
+
+def sample_without_replacement(
+    deck: Sequence[int],
+    n_rows: int,
+    k: int,
+    rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """
+    Her satırda desteden k farklı kart çeker.
+
+    Returns:
+        (n_rows, k) boyutlu kart indeksi matrisi
+    """
+    rng = rng or np.random.default_rng()
+    deck = np.asarray(deck, dtype=np.int64)
+    if k == 0:
+        return np.empty((n_rows, 0), dtype=np.int64)
+    keys = rng.random((n_rows, len(deck)))
+    picks = np.argpartition(keys, k - 1, axis=1)[:, :k]
+    return deck[picks]
+
+
+def deal_without_replacement(
+    deck: Sequence[int],
+    n_rows: int,
+    k: int,
+    rng: Optional[np.random.Generator] = None,
+    dead: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Kısmi Fisher-Yates ile her satıra k kart dağıtır.
+
+    Destenin tamamı karıştırılmaz; sadece dağıtılan k pozisyon takas
+    edilir. dead verilirse (n_rows, r) satır bazlı kartlar önce destenin
+    sonuna alınıp dağıtımdan çıkarılır (satır içinde tekrarsız olmalı).
+
+    Returns:
+        (n_rows, k) boyutlu kart indeksi matrisi
+    """
+    rng = rng or np.random.default_rng()
+    deck = np.asarray(deck, dtype=np.int64)
+    rows = np.arange(n_rows)
+    cards = np.tile(deck, (n_rows, 1))
+    size = len(deck)
+
+    if dead is not None and dead.shape[1]:
+        position = np.zeros((n_rows, int(deck.max()) + 1), dtype=np.int64)
+        position[:, deck] = np.arange(size)
+        for j in range(dead.shape[1]):
+            size -= 1
+            card = dead[:, j]
+            slot = position[rows, card]
+            tail = cards[:, size].copy()
+            cards[rows, slot] = tail
+            cards[:, size] = card
+            position[rows, tail] = slot
+            position[rows, card] = size
+
+    for j in range(k):
+        pick = j + rng.integers(0, size - j, n_rows)
+        picked = cards[rows, pick]
+        cards[rows, pick] = cards[:, j]
+        cards[:, j] = picked
+    return cards[:, :k]
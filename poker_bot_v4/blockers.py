@@ -0,0 +1,118 @@
+"""
+POKER BOT V4.0 - BLOCKERS
+=========================
+Kart çıkarma (card removal) analizi: hero'nun hole kartlarının rakip
+range'indeki value ve bluff kombinasyonlarını ne kadar azalttığı.
+
+Board başına rakibin 1326 kombinasyonunun el kategorisi bir kez toplu
+değerlendirilir; her spot sonra sadece maske karşılaştırması ve
+bincount'tur (mikrosaniyeler).
+"""
+
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from constants import HandCategory, BLOCKER_MIN_SHARE
+from data_classes import BlockerAnalysis, Card
+from batch_evaluator import evaluate_batch
+from lookup_evaluator import _category_starts
+from ranges import COMBO_CARDS, COMBO_MASKS, as_range
+
+# Value: two pair ve üstü, bluff: made hand olmayan (high card)
+VALUE_CATEGORIES = tuple(c for c in HandCategory if c.value >= HandCategory.TWO_PAIR.value)
+BLUFF_CATEGORIES = (HandCategory.HIGH_CARD,)
+
+_NUM_CATEGORIES = len(HandCategory) + 1  # bincount indeksi = HandCategory.value
+
+
+def _combo_categories(board: Sequence[int]) -> np.ndarray:
+    """Her kombinasyonun board'daki kategori değeri (board ile çakışan = 0)."""
+    board_mask = 0
+    for c in board:
+        board_mask |= 1 << c
+    live = (COMBO_MASKS & board_mask) == 0
+    hands = np.hstack([
+        COMBO_CARDS[live],
+        np.broadcast_to(np.array(board, dtype=np.int64), (int(live.sum()), len(board)))
+    ])
+    starts, categories = _category_starts()
+    values = np.array([c.value for c in categories])
+    ranks = evaluate_batch(hands)
+    result = np.zeros(len(COMBO_CARDS), dtype=np.int64)
+    result[live] = values[np.searchsorted(starts, ranks, side='right') - 1]
+    return result
+
+
+class BlockerAnalyzer:
+    """
+    Hero kartlarının rakip range'ine etkisi.
+
+    Son board'un kombinasyon kategorileri saklanır; aynı board'da farklı
+    eller / range'ler sadece vektörize maske işlemi maliyetindedir.
+    """
+
+    def __init__(self, min_share: float = BLOCKER_MIN_SHARE):
+        self.min_share = min_share
+        self._board: Tuple[Optional[Tuple[int, ...]], Optional[np.ndarray]] = (None, None)
+
+    def analyze(
+        self, hole: Sequence[int], board: Sequence[int], villain_range=None
+    ) -> BlockerAnalysis:
+        """
+        Hero'nun her kartının rakip kategorilerinden çıkardığı kombinasyonlar.
+
+        Args:
+            hole: Hero'nun 2 kart indeksi
+            board: 3-5 board kart indeksi (preflop'ta boş analiz döner)
+            villain_range: Range, kısa notasyon, notasyon kümesi /
+                {notasyon: ağırlık} sözlüğü veya None (tüm eller)
+
+        Returns:
+            BlockerAnalysis; blocked, payının en az min_share'i bloke
+            edilen value kategorilerinin adlarıdır (örn. ['Flush'])
+        """
+        if len(board) < 3:
+            return BlockerAnalysis()
+
+        categories = self._categories(board)
+        weights = as_range(villain_range).weights * (categories > 0)
+        range_counts = np.bincount(categories, weights=weights, minlength=_NUM_CATEGORIES)
+
+        card_deltas: Dict[str, Dict[HandCategory, float]] = {}
+        hero_mask = 0
+        for card in hole:
+            hero_mask |= 1 << card
+            blocked = (COMBO_MASKS >> card) & 1 == 1
+            card_deltas[str(Card.from_index(card))] = _by_category(
+                np.bincount(categories[blocked], weights=weights[blocked], minlength=_NUM_CATEGORIES)
+            )
+        blocked = (COMBO_MASKS & hero_mask) != 0
+        deltas = np.bincount(categories[blocked], weights=weights[blocked], minlength=_NUM_CATEGORIES)
+
+        value = [c.value for c in VALUE_CATEGORIES]
+        bluff = [c.value for c in BLUFF_CATEGORIES]
+        return BlockerAnalysis(
+            range_combos=_by_category(range_counts),
+            category_deltas=_by_category(deltas),
+            card_deltas=card_deltas,
+            value_combos=float(range_counts[value].sum()),
+            value_removed=float(deltas[value].sum()),
+            bluff_combos=float(range_counts[bluff].sum()),
+            bluff_removed=float(deltas[bluff].sum()),
+            blocked=[
+                c.name.replace('_', ' ').title() for c in VALUE_CATEGORIES
+                if deltas[c.value] > 0 and deltas[c.value] >= self.min_share * range_counts[c.value]
+            ]
+        )
+
+    def _categories(self, board: Sequence[int]) -> np.ndarray:
+        key = tuple(sorted(board))
+        if self._board[0] != key:
+            self._board = (key, _combo_categories(key))
+        return self._board[1]
+
+
+def _by_category(counts: np.ndarray) -> Dict[HandCategory, float]:
+    """bincount dizisini sıfır olmayan {kategori: sayı} sözlüğüne çevirir."""
+    return {HandCategory(int(v)): float(counts[v]) for v in np.flatnonzero(counts)}
@@ -16,6 +16,7 @@ from data_classes import (
 from hand_evaluator import HandEvaluator, BoardAnalyzer
 from strategy import PreflopStrategy, PostflopStrategy
 from anti_detection import AntiDetectionSystem, TimingConfig
+from rng import spawn
 
 # Logging setup
 logging.basicConfig(
@@ -43,6 +44,9 @@ class BotConfig:
     mistake_probability: float = 0.03
     timing_variance: float = 0.15
     
+    # Tekrarlanabilirlik: None = her bileşen bağımsız rastgele akış
+    seed: Optional[int] = None
+    
     # Debug
     verbose: bool = False
 
@@ -56,17 +60,19 @@ class PokerBot:
     def __init__(self, config: Optional[BotConfig] = None):
         self.config = config or BotConfig()
         
-        # Bileşenler
-        self.evaluator = HandEvaluator()
+        # Bileşenler (seed verildiyse her biri ondan türetilmiş ayrı akışla)
+        evaluator_rng, strategy_rng, anti_detection_rng = spawn(self.config.seed, 3)
+        self.evaluator = HandEvaluator(rng=evaluator_rng)
         self.board_analyzer = BoardAnalyzer()
         self.preflop_strategy = PreflopStrategy()
-        self.postflop_strategy = PostflopStrategy()
+        self.postflop_strategy = PostflopStrategy(rng=strategy_rng)
         
         # Anti-Detection
         if self.config.use_anti_detection:
             self.anti_detection = AntiDetectionSystem(
                 mistake_probability=self.config.mistake_probability,
-                variance_factor=self.config.timing_variance
+                variance_factor=self.config.timing_variance,
+                rng=anti_detection_rng
             )
         else:
             self.anti_detection = None
@@ -89,6 +89,11 @@ RANK_VALUES: Dict[str, int] = {
     '9': 9, 'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14
 }
 
+# Kart indeksleri: index = rank_index * 4 + suit_index (0-51)
+RANK_INDEX: Dict[str, int] = {r: i for i, r in enumerate(RANKS)}
+SUIT_INDEX: Dict[str, int] = {s: i for i, s in enumerate(SUITS)}
+NUM_CARDS = 52
+
 # Ace-low straight için alternatif değer
 RANK_VALUES_LOW_ACE: Dict[str, int] = {
     '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8,
@@ -103,6 +108,29 @@ MAX_PLAYERS = 6
 # --- MONTE CARLO SETTINGS ---
 MONTE_CARLO_ITERATIONS = 1000  # Simülasyon sayısı (performans/doğruluk dengesi)
 SIMULATION_TIMEOUT = 2.0       # Maksimum hesaplama süresi (saniye)
+EXACT_ENUMERATION_LIMIT = 50000  # Bu sayıya kadar showdown tam sayılır (turn + river)
+PARALLEL_SHARD_SIZE = 50000      # Paralel Monte Carlo shard başına iterasyon
+EQUITY_TARGET_STD_ERROR = 0.005  # Adaptif Monte Carlo hedef standart hatası
+EQUITY_CONFIDENCE = 0.95         # Güven aralığı seviyesi
+EQUITY_BATCH_SIZE = 1000         # Adaptif örneklemede kontrol aralığı
+EQUITY_MAX_SAMPLES = 200000      # Adaptif örneklemede üst sınır
+RANGE_EQUITY_MAX_BOARDS = 1500   # Range vs range: bu sayıya kadar runout tam sayılır, üstü örneklenir
+RANGE_EQUITY_CHUNK_CELLS = 200000  # Range vs range: chunk başına runout x (hero + villain) eleman (cache boyutu)
+PREFLOP_EQUITY_FILE = "preflop_equity.npy"  # 169 x 169 preflop equity matrisi
+PREFLOP_BUILD_BOARDS = 100000    # Matris üretiminde örneklenen board sayısı
+ANALYSIS_CACHE_SIZE = 4096       # evaluate_hand / analyze LRU cache varsayılan boyutu
+TEXTURE_TABLE_FILE = "texture_table.npz"  # Kanonik board texture tablosu
+POTENTIAL_HISTOGRAM_BINS = 10    # Equity dağılımı histogram aralık sayısı
+POTENTIAL_CACHE_SIZE = 1024      # Hand potential sonuç cache boyutu
+BLOCKER_MIN_SHARE = 0.15         # Bir value kategorisinin en az bu payı bloke ediliyorsa blocker sayılır
+SIM_STACK_BB = 100.0             # Self-play simülasyonunda başlangıç stack'i (bb)
+SIM_SHARD_SIZE = 2000            # Simülasyon shard başına el sayısı
+SIM_MAX_RAISES = 8               # Sokak başına raise sınırı (üstü call'a çevrilir)
+SIM_ALLIN_SAMPLES = 1000         # All-in EV: bu sayıya kadar runout tam sayılır, üstü örneklenir
+HISTORY_CHUNK_SIZE = 50000       # Hand history deposunda chunk dosyası başına el sayısı
+HISTORY_MANIFEST_FILE = "manifest.json"  # Depo dizinindeki chunk listesi
+LEAK_REPORT_FILE = "leak_report.npz"    # Depo dizininde artımlı rapor toplamları
+LEAK_LINE_MAX_ACTIONS = 12       # Line anahtarında tutulan hero aksiyonu sayısı (üstü kesilir)
 
 # --- STRATEGY CONSTANTS ---
 
@@ -5,18 +5,54 @@ Oyun durumu ve el değerlendirmesi için veri yapıları.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Set, Tuple, Any
+from typing import List, Optional, Dict, Set, Tuple, Any, Callable
 from constants import (
     Position, Street, ActionType, BoardTexture, 
-    HandCategory, DrawType
+    HandCategory, DrawType,
+    RANKS, SUITS, RANK_INDEX, SUIT_INDEX, NUM_CARDS
 )
 
-@dataclass
 class Card:
-    """Tek bir kartı temsil eder."""
-    rank: str  # '2'-'9', 'T', 'J', 'Q', 'K', 'A'
-    suit: str  # 'c', 'd', 'h', 's'
-    
+    """
+    Tek bir kartı temsil eder.
+
+    Kart 0-51 arası indeks olarak tutulur (rank_index * 4 + suit_index).
+    52 örnek bir kez oluşturulur ve paylaşılır; Card('A', 'h') her zaman
+    aynı nesneyi döndürür, bu yüzden kartlar değiştirilemez.
+    """
+    __slots__ = ('index', 'rank_bit', 'suit_bit', 'mask')
+
+    _instances: List['Card'] = []
+
+    def __new__(cls, rank: str, suit: str) -> 'Card':
+        try:
+            return cls._instances[RANK_INDEX[rank] * 4 + SUIT_INDEX[suit]]
+        except KeyError:
+            raise ValueError(f"Geçersiz kart: {rank}{suit}") from None
+
+    @classmethod
+    def _create(cls, index: int) -> 'Card':
+        card = object.__new__(cls)
+        object.__setattr__(card, 'index', index)
+        object.__setattr__(card, 'rank_bit', 1 << (index >> 2))  # 13 bitlik rank maskesi
+        object.__setattr__(card, 'suit_bit', 1 << (index & 3))   # 4 bitlik suit maskesi
+        object.__setattr__(card, 'mask', 1 << index)             # 52 bitlik kart maskesi
+        return card
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Card değiştirilemez")
+
+    def __reduce__(self):
+        return (Card.from_index, (self.index,))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Card):
+            return self.index == other.index
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self.index
+
     def __str__(self) -> str:
         return f"{self.rank}{self.suit}"
     
@@ -29,39 +65,75 @@ class Card:
         if len(card_str) != 2:
             raise ValueError(f"Geçersiz kart formatı: {card_str}")
         return cls(rank=card_str[0].upper(), suit=card_str[1].lower())
+
+    @classmethod
+    def from_index(cls, index: int) -> 'Card':
+        """0-51 arası indeksten Card döndürür."""
+        return cls._instances[index]
+
+    @property
+    def rank(self) -> str:
+        return RANKS[self.index >> 2]
+
+    @property
+    def suit(self) -> str:
+        return SUITS[self.index & 3]
     
     @property
     def value(self) -> int:
-        from constants import RANK_VALUES
-        return RANK_VALUES.get(self.rank, 0)
+        return (self.index >> 2) + 2
+
+
+Card._instances = [Card._create(i) for i in range(NUM_CARDS)]
+
 
-@dataclass
 class HoleCards:
-    """Oyuncunun elindeki 2 kart."""
-    card1: Card
-    card2: Card
+    """Oyuncunun elindeki 2 kart (indeks çifti olarak tutulur)."""
+    __slots__ = ('indices', 'mask')
+
+    def __init__(self, card1: Card, card2: Card):
+        self.indices: Tuple[int, int] = (card1.index, card2.index)
+        self.mask: int = card1.mask | card2.mask
     
     def __str__(self) -> str:
         return f"{self.card1}{self.card2}"
+
+    def __repr__(self) -> str:
+        return f"HoleCards(card1={self.card1!r}, card2={self.card2!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, HoleCards):
+            return self.indices == other.indices
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.indices)
+
+    @property
+    def card1(self) -> Card:
+        return Card._instances[self.indices[0]]
+
+    @property
+    def card2(self) -> Card:
+        return Card._instances[self.indices[1]]
     
     @property
     def is_pocket_pair(self) -> bool:
-        return self.card1.rank == self.card2.rank
+        return self.indices[0] >> 2 == self.indices[1] >> 2
     
     @property
     def is_suited(self) -> bool:
-        return self.card1.suit == self.card2.suit
+        return self.indices[0] & 3 == self.indices[1] & 3
     
     @property
     def is_connected(self) -> bool:
         """Kartlar ardışık mı (örn: JT, 98)?"""
-        diff = abs(self.card1.value - self.card2.value)
-        return diff == 1
+        return self.gap == 0
     
     @property
     def gap(self) -> int:
         """Kartlar arasındaki boşluk (örn: J9 -> gap=1)."""
-        return abs(self.card1.value - self.card2.value) - 1
+        return abs((self.indices[0] >> 2) - (self.indices[1] >> 2)) - 1
     
     @property
     def high_card(self) -> Card:
@@ -78,17 +150,41 @@ class HoleCards:
             raise ValueError(f"El 2 kart içermeli: {cards}")
         return cls(Card.from_string(cards[0]), Card.from_string(cards[1]))
 
-@dataclass 
+
 class Board:
-    """Masadaki community kartları."""
-    cards: List[Card] = field(default_factory=list)
+    """Masadaki community kartları (indeks listesi olarak tutulur)."""
+    __slots__ = ('indices',)
+
+    def __init__(self, cards: Optional[List[Card]] = None):
+        self.indices: List[int] = [c.index for c in cards] if cards else []
     
     def __str__(self) -> str:
         return " ".join(str(c) for c in self.cards)
+
+    def __repr__(self) -> str:
+        return f"Board(cards={self.cards!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Board):
+            return self.indices == other.indices
+        return NotImplemented
+
+    @property
+    def cards(self) -> List[Card]:
+        """Kartların Card listesi (kopya; eklemek için add_card kullanın)."""
+        return [Card._instances[i] for i in self.indices]
+
+    @property
+    def mask(self) -> int:
+        """Board kartlarının 52 bitlik maskesi."""
+        m = 0
+        for i in self.indices:
+            m |= 1 << i
+        return m
     
     @property
     def street(self) -> Street:
-        n = len(self.cards)
+        n = len(self.indices)
         if n == 0:
             return Street.PREFLOP
         elif n == 3:
@@ -105,9 +201,9 @@ class Board:
         return cls([Card.from_string(c) for c in cards])
     
     def add_card(self, card: Card) -> None:
-        if len(self.cards) >= 5:
+        if len(self.indices) >= 5:
             raise ValueError("Board zaten 5 kart içeriyor")
-        self.cards.append(card)
+        self.indices.append(card.index)
 
 @dataclass
 class PokerAction:
@@ -122,13 +218,43 @@ class PokerAction:
             return f"{self.action.value} ${self.amount:.2f}"
         return self.action.value
 
+class Freezable:
+    """
+    freeze() sonrası alan ataması AttributeError verir.
+    Cache'te paylaşılan sonuçların yanlışlıkla değiştirilmesini önler.
+    """
+    _frozen = False
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen:
+            raise AttributeError(f"Dondurulmuş {type(self).__name__} değiştirilemez: {name}")
+        object.__setattr__(self, name, value)
+    
+    def freeze(self):
+        """Nesneyi değiştirilemez yapar (list alanlar tuple'a çevrilir)."""
+        for name, value in vars(self).items():
+            if isinstance(value, list):
+                object.__setattr__(self, name, tuple(value))
+        object.__setattr__(self, '_frozen', True)
+        return self
+    
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
 @dataclass
-class HandStrength:
-    """El gücü analizi."""
+class HandStrength(Freezable):
+    """
+    El gücü analizi.
+
+    Nut / yüzdelik / blocker alanları rakibin tüm kombinasyonlarının
+    değerlendirilmesini gerektirir (~0.8 ms); details fonksiyonu bunları
+    ilk okunduklarında bir kez hesaplar (details None ise varsayılanlar).
+    """
     # Temel metrikler
     equity: float = 0.0           # 0-1 arası kazanma şansı
     hand_category: HandCategory = HandCategory.HIGH_CARD
-    hand_rank: int = 0            # Aynı kategori içinde sıralama
+    hand_rank: int = 0            # Kanonik el rank'ı (1-7462, büyük = güçlü)
     
     # Made hand bilgisi
     is_made_hand: bool = False
@@ -137,20 +263,143 @@ class HandStrength:
     # Draw bilgisi
     has_draw: bool = False
     draw_type: DrawType = DrawType.NONE
-    draw_outs: int = 0
+    draw_outs: int = 0            # Straight / flush yapan out sayısı
     draw_equity: float = 0.0      # Draw tamamlanırsa equity
     
-    # Özel durumlar
-    is_nut: bool = False          # Mümkün en iyi el mi?
-    is_second_nut: bool = False
-    blockers: List[str] = field(default_factory=list)  # Bloke ettiği eller
-    
     # Board interaction
     uses_both_cards: bool = False  # İki kartı da kullanıyor mu?
     vulnerable: bool = False       # Kolay geçilebilir mi?
+    
+    # Özel durumlar: () -> (HandRanking, bloke edilen eller)
+    details: Optional[Callable[[], Tuple['HandRanking', List[str]]]] = field(
+        default=None, repr=False, compare=False
+    )
+    
+    @property
+    def is_nut(self) -> bool:
+        """Mümkün en iyi el mi?"""
+        return self._details()[0].is_nut
+    
+    @property
+    def is_second_nut(self) -> bool:
+        return self._details()[0].is_second_nut
+    
+    @property
+    def percentile(self) -> float:
+        """Rakibin olası ellerinin yenilen payı (split = yarım)."""
+        return round(self._details()[0].percentile, 4)
+    
+    @property
+    def blockers(self) -> Tuple[str, ...]:
+        """Bloke ettiği eller."""
+        return self._details()[1]
+    
+    def _details(self) -> Tuple['HandRanking', Tuple[str, ...]]:
+        resolved = vars(self).get('_resolved')
+        if resolved is None:
+            ranking, blocked = self.details() if self.details else (HandRanking(), [])
+            resolved = (ranking, tuple(blocked))
+            # Dondurulmuş (cache'te paylaşılan) nesnede de bir kez yazılır
+            object.__setattr__(self, '_resolved', resolved)
+        return resolved
+
+@dataclass
+class EquityResult:
+    """Güven aralıklı equity sonucu."""
+    equity: float = 0.5           # (kazanma + split/2) / örnek
+    std_error: float = 0.0        # Standart hata (tam sayımda 0)
+    ci_low: float = 0.0           # Güven aralığı alt sınırı
+    ci_high: float = 1.0          # Güven aralığı üst sınırı
+    samples: int = 0              # Kullanılan örnek / showdown sayısı
+    exact: bool = False           # Tam sayım mı?
+    
+    def __str__(self) -> str:
+        if self.exact:
+            return f"{self.equity:.3f} (exact, n={self.samples})"
+        return f"{self.equity:.3f} ± {self.std_error:.4f} [{self.ci_low:.3f}, {self.ci_high:.3f}] (n={self.samples})"
+
+@dataclass
+class MultiwayResult:
+    """Çok oyunculu equity sonucu (oyuncu 0 = hero)."""
+    win: float = 0.0              # Hero'nun tek başına kazandığı pay
+    tie: float = 0.0              # Hero'nun pot paylaştığı pay
+    equities: List[float] = field(default_factory=list)  # Oyuncu başına equity (split payı dahil)
+    samples: int = 0
+    
+    @property
+    def equity(self) -> float:
+        """Hero equity'si."""
+        return self.equities[0] if self.equities else 0.0
+    
+    def __str__(self) -> str:
+        players = ", ".join(f"{e:.3f}" for e in self.equities)
+        return f"win {self.win:.3f} tie {self.tie:.3f} [{players}] (n={self.samples})"
+
+@dataclass
+class OutsAnalysis:
+    """Sonraki kart için kesin out analizi."""
+    outs: int = 0                 # Hero'nun elini geliştiren görünmeyen kart sayısı
+    out_cards: List[int] = field(default_factory=list)  # Out kart indeksleri
+    improvements: Dict[HandCategory, int] = field(default_factory=dict)  # Yeni kategori -> kart sayısı
+    draw_type: DrawType = DrawType.NONE
+    hit_probability: float = 0.0  # River'a kadar en az bir out gelme olasılığı
+    unseen: int = 0               # Görünmeyen kart sayısı
+    draw_outs: int = 0            # Sadece straight / flush yapan out'lar (HandStrength.draw_outs)
+    draw_cards: List[int] = field(default_factory=list)
+    draw_probability: float = 0.0  # River'a kadar en az bir draw out'u gelme olasılığı
+
+@dataclass
+class HandRanking:
+    """Mevcut board'da rakibin tüm olası ellerine karşı sıralama."""
+    hand_rank: int = 0            # Hero'nun kanonik rank'ı
+    better: int = 0               # Hero'yu geçen kombinasyon sayısı
+    ties: int = 0
+    worse: int = 0
+    percentile: float = 0.0       # (worse + ties/2) / toplam
+    is_nut: bool = False
+    is_second_nut: bool = False   # Daha güçlü tam olarak bir el değeri var
+    
+    @property
+    def total(self) -> int:
+        return self.better + self.ties + self.worse
+
+@dataclass
+class HandPotential(Freezable):
+    """River'a kadar equity dağılımı ve el potansiyeli (Billings vd.)."""
+    hand_strength: float = 0.0    # HS: şu anki board'da yenilen pay
+    equity: float = 0.0           # River equity'sinin beklenen değeri
+    ehs: float = 0.0              # HS x (1 - NPot) + (1 - HS) x PPot
+    ehs2: float = 0.0             # River equity'sinin karesinin beklenen değeri
+    ppot: float = 0.0             # Gerideyken öne geçme olasılığı
+    npot: float = 0.0             # Öndeyken geride kalma olasılığı
+    histogram: Tuple[float, ...] = ()  # Runout equity'lerinin [0, 1] aralıklarındaki payı
+    runouts: int = 0              # Sayılan runout sayısı
+
+@dataclass
+class BlockerAnalysis:
+    """Hero kartlarının rakip range'inden çıkardığı kombinasyonlar."""
+    # Rakibin board'daki kategorisi -> ağırlıklı kombinasyon sayısı
+    range_combos: Dict[HandCategory, float] = field(default_factory=dict)
+    category_deltas: Dict[HandCategory, float] = field(default_factory=dict)  # Hero'nun çıkardığı
+    card_deltas: Dict[str, Dict[HandCategory, float]] = field(default_factory=dict)  # Kart başına
+    value_combos: float = 0.0     # Value (two pair+) kombinasyonları (çıkarma öncesi)
+    value_removed: float = 0.0
+    bluff_combos: float = 0.0     # Bluff (high card) kombinasyonları (çıkarma öncesi)
+    bluff_removed: float = 0.0
+    blocked: List[str] = field(default_factory=list)  # Anlamlı ölçüde bloke edilen value kategorileri
+    
+    @property
+    def value_share(self) -> float:
+        """Value kombinasyonlarının bloke edilen payı."""
+        return self.value_removed / self.value_combos if self.value_combos else 0.0
+    
+    @property
+    def bluff_share(self) -> float:
+        """Bluff kombinasyonlarının bloke edilen payı."""
+        return self.bluff_removed / self.bluff_combos if self.bluff_combos else 0.0
 
 @dataclass
-class BoardAnalysis:
+class BoardAnalysis(Freezable):
     """Board dokusu analizi."""
     texture: BoardTexture = BoardTexture.UNKNOWN
     
@@ -304,3 +553,117 @@ class GameState:
         """Minimum legal raise miktarı."""
         last_raise = self.current_bet  # Basitleştirilmiş
         return self.current_bet + max(last_raise, self.big_blind)
+
+@dataclass
+class HandOutcome:
+    """Simülasyon motorunda oynanmış tek bir heads-up el."""
+    profits: Tuple[float, float] = (0.0, 0.0)  # Koltuk başına net kazanç (chip)
+    pot: float = 0.0              # Dağıtılan toplam pot (iade edilen uncalled bet hariç)
+    showdown: bool = False
+    all_in_street: Optional[Street] = None  # Stack'lerin bittiği sokak (yoksa None)
+    button: int = 0               # Button (SB) koltuğu
+    hole_cards: Tuple[Tuple[int, int], ...] = ()  # Koltuk başına kart indeksleri
+    board: Tuple[int, ...] = ()   # Açılan board kartları
+    actions: List[Tuple[int, Street, PokerAction]] = field(default_factory=list)  # (koltuk, sokak, aksiyon)
+
+@dataclass
+class SimulationResult:
+    """Self-play simülasyon sonucu (hero = koltuk 0 politikası)."""
+    hands: int = 0
+    profit: float = 0.0           # Hero'nun toplam kazancı (bb)
+    bb_per_100: float = 0.0
+    std_dev: float = 0.0          # El başına standart sapma (bb)
+    std_error: float = 0.0        # bb/100 standart hatası
+    ci_low: float = 0.0           # bb/100 güven aralığı
+    ci_high: float = 0.0
+    showdowns: int = 0
+    duplicate: bool = False       # Deal'ler koltuklar değiştirilerek iki kez oynandı
+    all_in_ev: bool = False       # All-in showdown'lar equity ile düzeltildi
+    
+    def __str__(self) -> str:
+        return (
+            f"{self.bb_per_100:+.2f} bb/100 ± {self.std_error:.2f} "
+            f"[{self.ci_low:+.2f}, {self.ci_high:+.2f}] (n={self.hands})"
+        )
+
+@dataclass
+class StrategyComparison:
+    """Aynı deal ve RNG akışında iki hero politikasının farkı (candidate - baseline)."""
+    baseline: SimulationResult = field(default_factory=SimulationResult)
+    candidate: SimulationResult = field(default_factory=SimulationResult)
+    difference: float = 0.0       # bb/100
+    std_error: float = 0.0        # Eşleştirilmiş farkın standart hatası (bb/100)
+    ci_low: float = 0.0
+    ci_high: float = 0.0
+    
+    @property
+    def significant(self) -> bool:
+        """Güven aralığı sıfırı dışarıda bırakıyor mu?"""
+        return self.ci_low > 0 or self.ci_high < 0
+    
+    def __str__(self) -> str:
+        return (
+            f"{self.difference:+.2f} bb/100 ± {self.std_error:.2f} "
+            f"[{self.ci_low:+.2f}, {self.ci_high:+.2f}] (n={self.candidate.hands})"
+        )
+
+@dataclass
+class HandRecord:
+    """Hand history'den okunan tek el (hero bakış açısından)."""
+    # hand_id, son sokak, board, pozisyonlar, başlangıç stack'leri, toplam pot
+    # ve sokak başına aksiyonlar (description = aksiyonu yapan oyuncu)
+    state: GameState = field(default_factory=GameState)
+    timestamp: int = 0            # Unix zamanı (saniye, sitenin saat dilimi)
+    hero: str = ""
+    players: int = 2              # Ele kart alan oyuncu sayısı
+    net: float = 0.0              # Hero'nun net kazancı (chip, rake sonrası)
+    rake: float = 0.0
+    showdown: bool = False        # Hero showdown'a kaldı mı?
+    flop_pot: float = 0.0         # Flop başındaki pot (flop yoksa 0)
+    flop_stack: float = 0.0       # Flop başında hero'nun efektif stack'i
+    positions: Dict[str, Position] = field(default_factory=dict)  # Oyuncu adı -> pozisyon
+    
+    @property
+    def hand_id(self) -> str:
+        return self.state.hand_id
+    
+    @property
+    def net_bb(self) -> float:
+        return self.net / self.state.big_blind if self.state.big_blind else 0.0
+
+@dataclass
+class LeakStat:
+    """Hand history raporunda tek bir grubun (pozisyon, texture, SPR, line) sonucu."""
+    label: str = ""
+    hands: int = 0
+    bb_per_100: float = 0.0
+    std_error: float = 0.0        # bb/100 standart hatası
+    showdown_hands: int = 0
+    showdown_bb_per_100: float = 0.0      # Showdown'a kalan ellerin katkısı (tüm eller başına)
+    non_showdown_bb_per_100: float = 0.0  # Showdown'suz ellerin katkısı
+    
+    def __str__(self) -> str:
+        return (
+            f"{self.label:<24} {self.hands:>9} {self.bb_per_100:>+9.2f} ±{self.std_error:<7.2f} "
+            f"SD {self.showdown_bb_per_100:>+8.2f}  non-SD {self.non_showdown_bb_per_100:>+8.2f}"
+        )
+
+@dataclass
+class LeakReport:
+    """Hero'nun hand history'sinden kazanç dağılımı (bb/100)."""
+    total: LeakStat = field(default_factory=LeakStat)
+    by_position: List[LeakStat] = field(default_factory=list)
+    by_texture: List[LeakStat] = field(default_factory=list)   # Flop görülen eller
+    by_spr: List[LeakStat] = field(default_factory=list)       # Flop başındaki SPR
+    by_line: List[LeakStat] = field(default_factory=list)      # El sayısına göre azalan
+    
+    def __str__(self) -> str:
+        sections = [
+            ("Pozisyon", self.by_position), ("Flop texture", self.by_texture),
+            ("SPR", self.by_spr), ("Line", self.by_line)
+        ]
+        lines = [str(self.total)]
+        for title, stats in sections:
+            lines.append(f"\n{title}:")
+            lines.extend(f"  {stat}" for stat in stats)
+        return "\n".join(lines)
@@ -0,0 +1,1048 @@
+"""
+POKER BOT V4.0 - EQUITY ENGINE
+==============================
+Tam sayım (enumeration), adaptif ve paralel Monte Carlo equity hesabı.
+Uzay küçükse (turn, river) tüm rakip elleri ve kalan board kartları
+sayılır; büyük uzaylarda hedef hassasiyete kadar örneklenir veya
+seed'li shard'lar süreç havuzunda koşturulur. Range vs range equity
+her runout için iki range'in tüm kombinasyonlarını birlikte karşılaştırır;
+EquitySession flop sayımını turn ve river için yeniden kullanır;
+çok oyunculu equity her rakip için rastgele el, bilinen el veya range
+kabul eder.
+"""
+
+import os
+import math
+import random
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from itertools import combinations
+from math import comb
+from statistics import NormalDist
+
+from constants import (
+    NUM_CARDS, PARALLEL_SHARD_SIZE, EXACT_ENUMERATION_LIMIT, SIMULATION_TIMEOUT,
+    EQUITY_TARGET_STD_ERROR, EQUITY_CONFIDENCE, EQUITY_BATCH_SIZE, EQUITY_MAX_SAMPLES,
+    RANGE_EQUITY_MAX_BOARDS, RANGE_EQUITY_CHUNK_CELLS, MONTE_CARLO_ITERATIONS, MAX_PLAYERS
+)
+from data_classes import EquityResult, MultiwayResult
+from lookup_evaluator import LookupEvaluator
+from preflop_ranges import range_to_combos
+
+try:
+    import numpy as np
+    from batch_evaluator import evaluate_batch, sample_without_replacement, deal_without_replacement
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+def enumeration_size(num_unseen: int, cards_to_deal: int) -> int:
+    """Heads-up tam sayımdaki showdown sayısı (rakip eli x runout)."""
+    return comb(num_unseen, 2) * comb(num_unseen - 2, cards_to_deal)
+
+
+class ExactEquity:
+    """
+    Heads-up tam sayım equity hesaplayıcı.
+
+    Hero'nun rank'ı her runout için bir kez hesaplanır; rakip elleri
+    NumPy varsa toplu, yoksa lookup evaluator ile tek tek değerlendirilir.
+    """
+
+    def __init__(self):
+        self._lookup = LookupEvaluator()
+
+    def equity(self, hero: Sequence[int], board: Sequence[int]) -> float:
+        """
+        Hero'nun rastgele bir rakip eline karşı tam equity'si.
+
+        Args:
+            hero: Hero'nun 2 kart indeksi
+            board: 0-5 board kart indeksi
+
+        Returns:
+            0.0-1.0 arası equity (kazanma + split/2)
+        """
+        known = set(hero) | set(board)
+        deck = [i for i in range(NUM_CARDS) if i not in known]
+        cards_to_deal = 5 - len(board)
+
+        if NUMPY_AVAILABLE:
+            wins, splits, total = self._count_batch(list(hero), list(board), deck, cards_to_deal)
+        else:
+            wins, splits, total = self._count_scalar(list(hero), list(board), deck, cards_to_deal)
+
+        if total == 0:
+            return 0.5
+        return (wins + splits * 0.5) / total
+
+    def _count_scalar(
+        self, hero: List[int], board: List[int], deck: List[int], cards_to_deal: int
+    ):
+        """Saf Python sayım: (kazanma, split, toplam)."""
+        evaluate = self._lookup.evaluate
+        wins = splits = total = 0
+
+        for runout in combinations(deck, cards_to_deal):
+            full_board = board + list(runout)
+            hero_rank = evaluate(hero + full_board)
+            rest = [c for c in deck if c not in runout]
+            for v1, v2 in combinations(rest, 2):
+                villain_rank = evaluate([v1, v2] + full_board)
+                if hero_rank > villain_rank:
+                    wins += 1
+                elif hero_rank == villain_rank:
+                    splits += 1
+                total += 1
+
+        return wins, splits, total
+
+    def _count_batch(
+        self, hero: List[int], board: List[int], deck: List[int], cards_to_deal: int
+    ):
+        """NumPy sayım: runout x rakip eli çarpımı, kart çakışmaları maskelenir."""
+        villains = np.array(list(combinations(deck, 2)), dtype=np.int64)
+        runout_list = list(combinations(deck, cards_to_deal))
+        runouts = np.array(runout_list, dtype=np.int64).reshape(len(runout_list), cards_to_deal)
+
+        one = np.int64(1)
+        villain_masks = (one << villains).sum(axis=1)
+        runout_masks = (one << runouts).sum(axis=1)
+
+        # Hero rank'ı runout başına bir kez
+        board_rows = np.hstack([np.tile(board, (len(runouts), 1)), runouts]).astype(np.int64)
+        hero_ranks = evaluate_batch(np.hstack([np.tile(hero, (len(runouts), 1)), board_rows]))
+
+        # Çakışmayan (runout, rakip) çiftleri
+        r_idx, v_idx = np.nonzero((runout_masks[:, None] & villain_masks[None, :]) == 0)
+        villain_ranks = evaluate_batch(np.hstack([villains[v_idx], board_rows[r_idx]]))
+        hero_ranks = hero_ranks[r_idx]
+
+        wins = int(np.count_nonzero(hero_ranks > villain_ranks))
+        splits = int(np.count_nonzero(hero_ranks == villain_ranks))
+        return wins, splits, len(r_idx)
+
+
+# --- PARALEL MONTE CARLO ---
+
+# Shard görevi: (hero, board, iterasyon, seed)
+ShardTask = Tuple[Tuple[int, ...], Tuple[int, ...], int, int]
+
+_worker_lookup: Optional[LookupEvaluator] = None
+
+
+def _init_worker() -> None:
+    """Worker süreci başında lookup tablolarını bir kez kurar."""
+    global _worker_lookup
+    _worker_lookup = LookupEvaluator()
+
+
+def sample_showdowns(
+    hero: Sequence[int], board: Sequence[int], deck: Sequence[int], n: int, rng
+) -> Tuple[int, int]:
+    """
+    Rastgele rakip eli ve runout ile n showdown oynar.
+
+    Args:
+        rng: NumPy varsa np.random.Generator, yoksa random.Random
+
+    Returns:
+        (kazanma, split)
+    """
+    to_deal = 7 - len(board)
+
+    if NUMPY_AVAILABLE:
+        drawn = sample_without_replacement(deck, n, to_deal, rng)
+        runout = np.hstack([np.tile(board, (n, 1)).astype(np.int64), drawn[:, 2:]])
+        hero_ranks = evaluate_batch(np.hstack([np.tile(hero, (n, 1)), runout]))
+        villain_ranks = evaluate_batch(np.hstack([drawn[:, :2], runout]))
+        return (
+            int(np.count_nonzero(hero_ranks > villain_ranks)),
+            int(np.count_nonzero(hero_ranks == villain_ranks))
+        )
+
+    global _worker_lookup
+    if _worker_lookup is None:
+        _worker_lookup = LookupEvaluator()
+    evaluate = _worker_lookup.evaluate
+    sample = rng.sample
+    hero, board = list(hero), list(board)
+
+    wins = splits = 0
+    for _ in range(n):
+        drawn = sample(deck, to_deal)
+        sim_board = board + drawn[2:]
+        hero_rank = evaluate(hero + sim_board)
+        villain_rank = evaluate(drawn[:2] + sim_board)
+        if hero_rank > villain_rank:
+            wins += 1
+        elif hero_rank == villain_rank:
+            splits += 1
+    return wins, splits
+
+
+def make_rng(seed: Optional[int] = None):
+    """Örnekleme yoluna uygun RNG (NumPy Generator veya random.Random)."""
+    if NUMPY_AVAILABLE:
+        return np.random.default_rng(seed)
+    return random.Random(seed)
+
+
+def run_shard(task: ShardTask) -> Tuple[int, int, int]:
+    """
+    Tek bir Monte Carlo shard'ı koşturur.
+
+    Aynı görev (seed dahil) her süreçte aynı sonucu verir.
+
+    Returns:
+        (kazanma, split, iterasyon)
+    """
+    hero, board, iterations, seed = task
+    known = set(hero) | set(board)
+    deck = [i for i in range(NUM_CARDS) if i not in known]
+    wins, splits = sample_showdowns(hero, board, deck, iterations, make_rng(seed))
+    return wins, splits, iterations
+
+
+def shard_tasks(
+    hero: Sequence[int],
+    board: Sequence[int],
+    iterations: int,
+    seed: int,
+    shard_size: int = PARALLEL_SHARD_SIZE
+) -> List[ShardTask]:
+    """
+    İterasyonları sabit boyutlu shard'lara böler.
+
+    Shard sayısı ve seed'leri sadece (iterasyon, seed, shard_size)'a bağlıdır;
+    worker sayısı sonucu değiştirmez.
+    """
+    master = random.Random(seed)
+    tasks: List[ShardTask] = []
+    remaining = iterations
+    while remaining > 0:
+        n = min(shard_size, remaining)
+        tasks.append((tuple(hero), tuple(board), n, master.getrandbits(63)))
+        remaining -= n
+    return tasks
+
+
+class ParallelEquity:
+    """
+    Süreç havuzunda seed'li Monte Carlo equity.
+
+    Kullanım:
+        with ParallelEquity(workers=16) as engine:
+            equity = engine.equity(hero.indices, board.indices, 1_000_000, seed=42)
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        shard_size: int = PARALLEL_SHARD_SIZE,
+        executor: Optional[Executor] = None
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self._executor = executor
+        self._owns_executor = False
+
+    def __enter__(self) -> 'ParallelEquity':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Kendi açtığı süreç havuzunu kapatır."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+        self._executor = None
+        self._owns_executor = False
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker
+            )
+            self._owns_executor = True
+        return self._executor
+
+    def run(
+        self, hero: Sequence[int], board: Sequence[int], iterations: int, seed: int = 0
+    ) -> Tuple[int, int, int]:
+        """Shard'ları dağıtır ve (kazanma, split, toplam) sayaçlarını birleştirir."""
+        tasks = shard_tasks(hero, board, iterations, seed, self.shard_size)
+        if self.workers == 1 or len(tasks) == 1:
+            results = map(run_shard, tasks)
+        else:
+            chunksize = max(1, len(tasks) // (self.workers * 4))
+            results = self._get_executor().map(run_shard, tasks, chunksize=chunksize)
+
+        wins = splits = total = 0
+        for w, s, n in results:
+            wins += w
+            splits += s
+            total += n
+        return wins, splits, total
+
+    def equity(
+        self, hero: Sequence[int], board: Sequence[int], iterations: int, seed: int = 0
+    ) -> float:
+        """Hero'nun rastgele rakip eline karşı Monte Carlo equity'si."""
+        wins, splits, total = self.run(hero, board, iterations, seed)
+        if total == 0:
+            return 0.5
+        return (wins + splits * 0.5) / total
+
+
+# --- ADAPTİF HASSASİYET ---
+
+def equity_std_error(wins: int, splits: int, n: int) -> float:
+    """Showdown sonuçları (1 / 0.5 / 0) için equity ortalamasının standart hatası."""
+    if n < 2:
+        return float('inf')
+    mean = (wins + splits * 0.5) / n
+    mean_sq = (wins + splits * 0.25) / n
+    variance = max(mean_sq - mean * mean, 0.0) * n / (n - 1)
+    return math.sqrt(variance / n)
+
+
+def make_equity_result(
+    wins: int, splits: int, n: int, confidence: float = EQUITY_CONFIDENCE
+) -> EquityResult:
+    """Sayaçlardan normal yaklaşımlı güven aralığı ile EquityResult üretir."""
+    if n == 0:
+        return EquityResult()
+    equity = (wins + splits * 0.5) / n
+    std_error = equity_std_error(wins, splits, n)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return EquityResult(
+        equity=equity,
+        std_error=std_error,
+        ci_low=max(0.0, equity - z * std_error),
+        ci_high=min(1.0, equity + z * std_error),
+        samples=n
+    )
+
+
+class AdaptiveEquity:
+    """
+    Hedef standart hataya ulaşınca duran Monte Carlo.
+
+    Kolay spotlar birkaç batch'te biter, başa baş spotlar daha çok örnek
+    alır. Uzay küçükse tam sayım yapılır ve hata 0 döner.
+    """
+
+    def __init__(self):
+        self._exact = ExactEquity()
+
+    def estimate(
+        self,
+        hero: Sequence[int],
+        board: Sequence[int],
+        target_std_error: float = EQUITY_TARGET_STD_ERROR,
+        confidence: float = EQUITY_CONFIDENCE,
+        max_samples: int = EQUITY_MAX_SAMPLES,
+        batch_size: int = EQUITY_BATCH_SIZE,
+        exact_limit: int = EXACT_ENUMERATION_LIMIT,
+        timeout: float = SIMULATION_TIMEOUT,
+        seed: Optional[int] = None
+    ) -> EquityResult:
+        """
+        Equity'yi hedef hassasiyete kadar örnekler.
+
+        Args:
+            hero: Hero'nun 2 kart indeksi
+            board: 0-5 board kart indeksi
+            target_std_error: Durma eşiği (örn. 0.005 = ±%0.5)
+            confidence: Güven aralığı seviyesi
+            max_samples: Örnek üst sınırı
+            batch_size: Hata kontrolleri arasındaki örnek sayısı
+            exact_limit: Tam sayım yapılacak maksimum showdown sayısı
+            timeout: Maksimum süre (saniye)
+            seed: Tekrarlanabilirlik için seed
+
+        Returns:
+            EquityResult (equity, standart hata, güven aralığı, örnek sayısı)
+        """
+        known = set(hero) | set(board)
+        deck = [i for i in range(NUM_CARDS) if i not in known]
+
+        size = enumeration_size(len(deck), 5 - len(board))
+        if size <= exact_limit:
+            equity = self._exact.equity(hero, board)
+            return EquityResult(
+                equity=equity, ci_low=equity, ci_high=equity, samples=size, exact=True
+            )
+
+        rng = make_rng(seed)
+        start_time = time.time()
+        wins = splits = n = 0
+
+        while n < max_samples:
+            k = min(batch_size, max_samples - n)
+            w, s = sample_showdowns(hero, board, deck, k, rng)
+            wins += w
+            splits += s
+            n += k
+            if equity_std_error(wins, splits, n) <= target_std_error:
+                break
+            if time.time() - start_time > timeout:
+                break
+
+        return make_equity_result(wins, splits, n, confidence)
+
+
+# --- RANGE VS RANGE ---
+
+class RangeEquity:
+    """
+    İki range arasında equity (kart çakışmaları dahil).
+
+    Her runout için iki range'in tüm kombinasyonları bir kez
+    değerlendirilir; hero kombinasyonları sıralı villain rank'larına
+    searchsorted ile karşılaştırılır, ortak kartlı çiftler seyrek bir
+    listeyle düzeltilir. Runout sayısı küçükse (flop, turn, river) tam sayılır,
+    preflop'ta runout'lar örneklenir ve her örnek board'da range'ler
+    yine tam karşılaştırılır.
+    """
+
+    def __init__(self):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("RangeEquity için numpy gerekli")
+
+    def equity(
+        self,
+        hero_range,
+        villain_range,
+        board: Sequence[int] = (),
+        max_boards: int = RANGE_EQUITY_MAX_BOARDS,
+        confidence: float = EQUITY_CONFIDENCE,
+        seed: Optional[int] = None
+    ) -> EquityResult:
+        """
+        Hero range'inin villain range'ine karşı equity'si.
+
+        Args:
+            hero_range: Range, notasyon kümesi (örn. get_rfi_range(...)),
+                {notasyon: ağırlık} sözlüğü, bilinen el (kart1, kart2)
+                veya None (tüm eller)
+            villain_range: Aynı formatta rakip range'i
+            board: 0-5 board kart indeksi
+            max_boards: Tam sayım yapılacak maksimum runout sayısı
+            confidence: Güven aralığı seviyesi (örneklemede)
+            seed: Runout örneklemesi için seed
+
+        Returns:
+            EquityResult (tam sayımda exact=True, samples = runout sayısı)
+        """
+        scored = self.runout_scores(hero_range, villain_range, board, max_boards, seed)
+        if scored is None:
+            return EquityResult()
+        _, scores, weights, exact = scored
+
+        total_weight = weights.sum()
+        if total_weight == 0:
+            return EquityResult()
+        equity = float(scores.sum() / total_weight)
+        if exact:
+            return EquityResult(
+                equity=equity, ci_low=equity, ci_high=equity, samples=len(scores), exact=True
+            )
+
+        # Oran tahmincisi için delta yöntemi standart hatası
+        n = len(scores)
+        residuals = scores - equity * weights
+        std_error = float(np.sqrt((residuals ** 2).sum() / (n * (n - 1))) / weights.mean())
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        return EquityResult(
+            equity=equity,
+            std_error=std_error,
+            ci_low=max(0.0, equity - z * std_error),
+            ci_high=min(1.0, equity + z * std_error),
+            samples=n
+        )
+
+    def runout_scores(
+        self,
+        hero_range,
+        villain_range,
+        board: Sequence[int] = (),
+        max_boards: int = RANGE_EQUITY_MAX_BOARDS,
+        seed: Optional[int] = None
+    ):
+        """
+        Runout başına ağırlıklı skor ve ağırlık toplamları.
+
+        Returns:
+            (runout'lar (R, k), skorlar (R,), ağırlıklar (R,), tam sayım mı)
+            veya range'lerden biri boşsa None. Runout r'deki equity
+            skorlar[r] / ağırlıklar[r]'dir.
+        """
+        board = list(board)
+        board_mask = _cards_mask(board)
+        hero_cards, hero_masks, hero_weights = _live_combos(hero_range, board_mask)
+        villain_cards, villain_masks, villain_weights = _live_combos(villain_range, board_mask)
+        if not len(hero_cards) or not len(villain_cards):
+            return None
+
+        # Hero kombinasyonunun villain range'indeki aynı kombinasyonu (yoksa -1);
+        # kart çakışması düzeltmesinde iki kez sayılan çift
+        villain_index = {m: j for j, m in enumerate(villain_masks.tolist())}
+        same = np.array([villain_index.get(m, -1) for m in hero_masks.tolist()], dtype=np.int64)
+
+        deck = [i for i in range(NUM_CARDS) if not board_mask >> i & 1]
+        cards_to_deal = 5 - len(board)
+        num_runouts = comb(len(deck), cards_to_deal)
+        exact = num_runouts <= max_boards
+        if exact:
+            runouts = np.array(
+                list(combinations(deck, cards_to_deal)), dtype=np.int64
+            ).reshape(num_runouts, cards_to_deal)
+        else:
+            runouts = sample_without_replacement(deck, max_boards, cards_to_deal, make_rng(seed))
+
+        boards = np.hstack([
+            np.broadcast_to(np.array(board, dtype=np.int64), (len(runouts), len(board))),
+            runouts
+        ])
+        cells = 3 * (len(hero_cards) + len(villain_cards))
+        chunk = max(1, RANGE_EQUITY_CHUNK_CELLS // cells)
+
+        scores = np.empty(len(boards))
+        weights = np.empty(len(boards))
+        for start in range(0, len(boards), chunk):
+            part = boards[start:start + chunk]
+            runout_masks = np.bitwise_or.reduce(np.left_shift(1, runouts[start:start + chunk]), axis=1) \
+                if cards_to_deal else np.zeros(len(part), dtype=np.int64)
+            hero_ranks, hero_live = _combo_ranks(hero_cards, hero_masks, part, runout_masks)
+            villain_ranks, villain_live = _combo_ranks(villain_cards, villain_masks, part, runout_masks)
+            scores[start:start + chunk], weights[start:start + chunk] = _score_runouts(
+                hero_cards, hero_ranks, hero_live * hero_weights,
+                villain_cards, villain_ranks, villain_live * villain_weights, same
+            )
+
+        return runouts, scores, weights, exact
+
+    def next_card_equity(
+        self, hero_range, villain_range, board: Sequence[int]
+    ) -> Dict[int, float]:
+        """
+        Flop veya turn'de her olası sonraki kart için equity.
+
+        Flop'ta turn kartı c için turn + river runout'ları üzerinden,
+        turn'de river kartı c ile showdown equity'sidir.
+
+        Returns:
+            {kart indeksi: equity} (range'lerin tamamen bloke ettiği kartlar hariç)
+        """
+        if len(board) not in (3, 4):
+            raise ValueError(f"Flop veya turn board gerekli: {len(board)} kart")
+        scored = self.runout_scores(hero_range, villain_range, board, max_boards=comb(NUM_CARDS, 2))
+        if scored is None:
+            return {}
+        runouts, scores, weights, _ = scored
+
+        result: Dict[int, float] = {}
+        for card in np.unique(runouts):
+            hit = (runouts == card).any(axis=1)
+            weight = weights[hit].sum()
+            if weight > 0:
+                result[int(card)] = float(scores[hit].sum() / weight)
+        return result
+
+
+def _cards_mask(cards: Sequence[int]) -> int:
+    """Kart indekslerinden 52 bitlik maske."""
+    mask = 0
+    for c in cards:
+        mask |= 1 << c
+    return mask
+
+
+def _live_combos(hand_range, dead_mask: int):
+    """
+    Range'i board ile çakışmayan (kartlar, maskeler, ağırlıklar) dizilerine açar.
+    hand_range bilinen bir el (kart1, kart2), None (tüm eller) veya
+    ranges.Range olabilir.
+    """
+    if hasattr(hand_range, 'combos'):
+        cards, weights = hand_range.combos()
+        masks = np.left_shift(1, cards).sum(axis=1)
+        live = (masks & dead_mask) == 0
+        return cards[live], masks[live], weights[live]
+    if hand_range is None:
+        weighted = [(c1, c2, 1.0) for c1, c2 in combinations(range(NUM_CARDS), 2)]
+    elif _is_known_hand(hand_range):
+        weighted = [(hand_range[0], hand_range[1], 1.0)]
+    else:
+        weighted = range_to_combos(hand_range)
+    combos = [
+        (c1, c2, w) for c1, c2, w in weighted
+        if not dead_mask & ((1 << c1) | (1 << c2))
+    ]
+    cards = np.array([(c1, c2) for c1, c2, _ in combos], dtype=np.int64).reshape(len(combos), 2)
+    masks = np.left_shift(1, cards).sum(axis=1)
+    weights = np.array([w for _, _, w in combos], dtype=np.float64)
+    return cards, masks, weights
+
+
+def _score_runouts(
+    hero_cards, hero_ranks, hero_weights, villain_cards, villain_ranks, villain_weights, same
+):
+    """
+    Runout başına Σ hero_w · villain_w · (kazanma 1, split 0.5) ve Σ ağırlık;
+    (R, H) / (R, V) rank ve canlı ağırlık matrisleri üzerinden.
+
+    Satır başına villain ağırlıkları rank histogramına toplanır; hero
+    kombinasyonunun yendiği / berabere kaldığı ağırlık kümülatif
+    histogramdan doğrudan okunur. Ortak kartlı çiftler kart bazında
+    çıkarılır: (a, b) ile çakışan villain kombinasyonları a'yı içerenler +
+    b'yi içerenler - aynı kombinasyon; kart grupları sıralanıp searchsorted
+    ile aranır. Satır başına O((H + V) log V), H x V karşılaştırma yok.
+    """
+    num_rows = len(hero_ranks)
+    rows = np.arange(num_rows, dtype=np.int64)[:, None]
+    scale = int(max(hero_ranks.max(initial=0), villain_ranks.max(initial=0))) + 1
+
+    histogram = np.bincount(
+        (rows * scale + villain_ranks).ravel(), weights=villain_weights.ravel(),
+        minlength=num_rows * scale
+    ).reshape(num_rows, scale)
+    cumulative = np.cumsum(histogram, axis=1)
+    tied = histogram[rows, hero_ranks]
+    below = cumulative[rows, hero_ranks] - tied
+    totals = cumulative[:, -1:]
+
+    # Kart grubu = satır * 52 + kart; her villain kombinasyonu iki grupta
+    villain_groups = ((rows * NUM_CARDS)[:, :, None] + villain_cards[None, :, :]).reshape(num_rows, -1)
+    hero_groups = ((rows * NUM_CARDS)[:, :, None] + hero_cards[None, :, :]).reshape(num_rows, -1)
+    card_below, card_tied, card_totals = _group_rank_mass(
+        villain_groups, np.repeat(villain_ranks, 2, axis=1), np.repeat(villain_weights, 2, axis=1),
+        hero_groups, np.repeat(hero_ranks, 2, axis=1), num_rows * NUM_CARDS, scale
+    )
+
+    # Aynı kombinasyon iki kart grubunda da sayıldı (rank eşit: split)
+    same_weights = np.where(same >= 0, villain_weights[:, np.maximum(same, 0)], 0.0)
+    pairs = hero_ranks.shape + (2,)
+    conflict_below = card_below.reshape(pairs).sum(axis=2)
+    conflict_tied = card_tied.reshape(pairs).sum(axis=2) - same_weights
+    conflict_totals = card_totals.reshape(pairs).sum(axis=2) - same_weights
+
+    scores = (hero_weights * (below - conflict_below + 0.5 * (tied - conflict_tied))).sum(axis=1)
+    return scores, (hero_weights * (totals - conflict_totals)).sum(axis=1)
+
+
+def _group_rank_mass(groups, ranks, weights, query_groups, query_ranks, num_groups, scale):
+    """
+    Her sorgu için kendi grubundaki daha düşük rank'lı, eşit rank'lı ve
+    toplam ağırlık. Elemanlar (grup, rank) anahtarıyla tek düz dizide
+    sıralanır; grup başlangıçları bincount ile bulunur.
+    """
+    keys = (groups * scale + ranks).ravel()
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    cumulative = np.concatenate([[0.0], np.cumsum(weights.ravel()[order])])
+
+    group_weights = np.bincount(groups.ravel(), weights=weights.ravel(), minlength=num_groups)
+    group_starts = np.concatenate([[0.0], np.cumsum(group_weights)])[query_groups]
+
+    queries = query_groups * scale + query_ranks
+    left = cumulative[np.searchsorted(keys, queries, side='left')]
+    right = cumulative[np.searchsorted(keys, queries, side='right')]
+    return left - group_starts, right - left, group_weights[query_groups]
+
+
+def _combo_ranks(cards, masks, boards, runout_masks):
+    """
+    Her (board, kombinasyon) için rank ve canlılık matrisi.
+    Runout ile çakışan kombinasyonlar değerlendirilmez (rank 0, canlı değil).
+    """
+    live = (masks[None, :] & runout_masks[:, None]) == 0
+    hands = np.concatenate([
+        np.broadcast_to(boards[:, None, :], (len(boards), len(cards), boards.shape[1])),
+        np.broadcast_to(cards[None, :, :], (len(boards), len(cards), 2))
+    ], axis=2)
+    ranks = np.zeros(live.shape, dtype=np.int32)
+    ranks[live] = evaluate_batch(hands[live])
+    return ranks, live
+
+
+# --- SOKAKLAR ARASI OTURUM ---
+
+class EquitySession:
+    """
+    Bir el boyunca sokaktan sokağa equity.
+
+    Flop'ta tüm turn + river runout'ları bir kez tam sayılır ve runout
+    başına skor / ağırlık saklanır; turn ve river equity'si bu kayıtlardan
+    sadece maske ve toplamla türetilir. Board kök board'u genişletmiyorsa
+    (yeni el) kök yeniden hesaplanır.
+
+        session = EquitySession(hero_cards, villain_range)
+        session.equity(flop)          # tam sayım (~1081 runout)
+        session.equity(flop + [turn]) # türetilir
+    """
+
+    def __init__(self, hero, villain_range=None):
+        """
+        Args:
+            hero: Bilinen el (kart1, kart2) veya range
+            villain_range: Range, notasyon kümesi / {notasyon: ağırlık}
+                sözlüğü, bilinen el veya None (rastgele el)
+        """
+        self.hero = tuple(hero) if _is_known_hand(hero) else hero
+        self.villain_range = villain_range
+        self._engine = RangeEquity()
+        self._root_mask: Optional[int] = None
+        self._runout_masks = None
+        self._scores = None
+        self._weights = None
+        self.computed = 0
+        self.derived = 0
+
+    def equity(self, board: Sequence[int]) -> EquityResult:
+        """
+        Board'daki equity; flop ve sonrası kök kayıtlardan türetilir.
+        Preflop'ta kayıt tutulmaz (RangeEquity örneklemesi).
+        """
+        board = list(board)
+        if len(board) < 3:
+            self.computed += 1
+            return self._engine.equity(self.hero, self.villain_range, board)
+
+        extra = self._extra_cards(board)
+        if self._scores is None:
+            return EquityResult()
+        rows = (self._runout_masks & extra) == extra
+        return self._result(self._scores[rows].sum(), self._weights[rows].sum(), int(rows.sum()))
+
+    def next_card_equity(self, board: Sequence[int]) -> Dict[int, float]:
+        """
+        Flop veya turn'de her olası sonraki kart için equity
+        ({kart indeksi: equity}), kök kayıtlardan.
+        """
+        board = list(board)
+        if len(board) not in (3, 4):
+            raise ValueError(f"Flop veya turn board gerekli: {len(board)} kart")
+        extra = self._extra_cards(board)
+        if self._scores is None:
+            return {}
+
+        board_mask = _cards_mask(board)
+        rows = (self._runout_masks & extra) == extra
+        masks, scores, weights = self._runout_masks[rows], self._scores[rows], self._weights[rows]
+        result: Dict[int, float] = {}
+        for card in range(NUM_CARDS):
+            if board_mask >> card & 1:
+                continue
+            hit = (masks >> card) & 1 == 1
+            weight = weights[hit].sum()
+            if weight > 0:
+                result[card] = float(scores[hit].sum() / weight)
+        return result
+
+    def get_stats(self) -> dict:
+        return {"computed": self.computed, "derived": self.derived}
+
+    def _extra_cards(self, board: List[int]) -> int:
+        """
+        Board'un kök board'a göre yeni kartlarının maskesi; board kökü
+        genişletmiyorsa kök bu board'dan yeniden hesaplanır.
+        """
+        board_mask = _cards_mask(board)
+        root = self._root_mask
+        if root is not None and board_mask & root == root:
+            self.derived += 1
+            return board_mask & ~root
+
+        self.computed += 1
+        self._root_mask = board_mask
+        scored = self._engine.runout_scores(
+            self.hero, self.villain_range, board, max_boards=comb(NUM_CARDS, 2)
+        )
+        if scored is None:
+            self._runout_masks = self._scores = self._weights = None
+            return 0
+        runouts, self._scores, self._weights, _ = scored
+        self._runout_masks = np.left_shift(1, runouts).sum(axis=1) if runouts.shape[1] \
+            else np.zeros(len(runouts), dtype=np.int64)
+        return 0
+
+    @staticmethod
+    def _result(score: float, weight: float, runouts: int) -> EquityResult:
+        if weight == 0:
+            return EquityResult()
+        equity = float(score / weight)
+        return EquityResult(equity=equity, ci_low=equity, ci_high=equity, samples=runouts, exact=True)
+
+
+# --- ÇOK OYUNCULU ---
+
+# Rakip tanımı: None (rastgele el), (kart1, kart2) (bilinen el) veya range
+# (Range, notasyon metni / kümesi / {notasyon: ağırlık} sözlüğü)
+_MULTIWAY_CHUNK = 20000
+_MULTIWAY_MAX_REDRAWS = 1000  # Range'li rakipler için çakışmasız çekiliş deneme sınırı
+
+
+class MultiwayEquity:
+    """
+    N rakipli Monte Carlo equity.
+
+    Range'li rakiplerin kombinasyonları ağırlıkla çekilir (birbiriyle
+    çakışan satırlar yeniden çekilir), rastgele eller ve runout kısmi
+    Fisher-Yates ile kalan desteden dağıtılır. Range'ler birlikte
+    dağıtılamıyorsa (örn. iki rakip de sadece AA, hero'da bir as) ya da
+    yeniden çekiliş _MULTIWAY_MAX_REDRAWS turda bitmiyorsa ValueError.
+    """
+
+    def __init__(self):
+        self._lookup = LookupEvaluator()
+
+    def equity(
+        self,
+        hero: Sequence[int],
+        board: Sequence[int],
+        villains: Sequence,
+        iterations: int = MONTE_CARLO_ITERATIONS,
+        seed: Optional[int] = None
+    ) -> MultiwayResult:
+        """
+        Hero ve her rakip için equity.
+
+        Args:
+            hero: Hero'nun 2 kart indeksi
+            board: 0-5 board kart indeksi
+            villains: Rakip tanımları (None / bilinen el / range)
+            iterations: Simülasyon sayısı
+            seed: Tekrarlanabilirlik için seed
+
+        Returns:
+            MultiwayResult (hero win/tie payı, oyuncu başına equity)
+        """
+        if not 1 <= len(villains) < MAX_PLAYERS:
+            raise ValueError(f"1-{MAX_PLAYERS - 1} rakip desteklenir: {len(villains)}")
+
+        hero, board = list(hero), list(board)
+        known = {i: list(v) for i, v in enumerate(villains) if _is_known_hand(v)}
+        dead = set(hero) | set(board) | {c for hand in known.values() for c in hand}
+        if len(dead) != len(hero) + len(board) + 2 * len(known):
+            raise ValueError("Tekrarlanan kart")
+
+        ranges = {
+            i: _range_table(v, _cards_mask(dead))
+            for i, v in enumerate(villains) if v is not None and i not in known
+        }
+        if any(not len(table[0]) for table in ranges.values()):
+            raise ValueError("Board/bilinen kartlarla çakışmayan kombinasyonu olmayan range")
+        if not _ranges_compatible(ranges):
+            raise ValueError("Range'ler birbiriyle çakışmadan dağıtılamıyor")
+
+        setup = _MultiwaySetup(
+            hero=hero, board=board, known=known, ranges=ranges,
+            random_seats=[i for i, v in enumerate(villains) if v is None],
+            deck=[c for c in range(NUM_CARDS) if c not in dead],
+            players=len(villains) + 1
+        )
+        rng = make_rng(seed)
+
+        win = tie = 0
+        shares = [0.0] * setup.players
+        if NUMPY_AVAILABLE:
+            for start in range(0, iterations, _MULTIWAY_CHUNK):
+                w, t, s = self._simulate_batch(setup, min(_MULTIWAY_CHUNK, iterations - start), rng)
+                win += w
+                tie += t
+                shares = [a + b for a, b in zip(shares, s)]
+        else:
+            win, tie, shares = self._simulate_scalar(setup, iterations, rng)
+
+        n = max(iterations, 1)
+        return MultiwayResult(
+            win=win / n, tie=tie / n,
+            equities=[share / n for share in shares],
+            samples=iterations
+        )
+
+    def _simulate_batch(self, setup: '_MultiwaySetup', n: int, rng):
+        """NumPy yolu: n el toplu dağıtılır ve değerlendirilir."""
+        hands = np.empty((n, setup.players, 2), dtype=np.int64)
+        hands[:, 0] = setup.hero
+        for seat, hand in setup.known.items():
+            hands[:, seat + 1] = hand
+
+        # Range'li rakipler: ağırlıklı çekiliş, çakışan satırlar yeniden
+        range_seats = list(setup.ranges)
+        if range_seats:
+            picks = np.empty((n, len(range_seats)), dtype=np.int64)
+            pending = np.arange(n)
+            for _ in range(_MULTIWAY_MAX_REDRAWS):
+                if not pending.size:
+                    break
+                for j, seat in enumerate(range_seats):
+                    _, _, cumulative = setup.ranges[seat]
+                    picks[pending, j] = np.searchsorted(
+                        cumulative, rng.random(pending.size) * cumulative[-1], side='right'
+                    )
+                masks = np.stack([
+                    setup.ranges[seat][1][picks[pending, j]]
+                    for j, seat in enumerate(range_seats)
+                ], axis=1)
+                union = np.bitwise_or.reduce(masks, axis=1)
+                pending = pending[masks.sum(axis=1) != union]
+            if pending.size:
+                raise ValueError("Range'ler için çakışmasız dağıtım bulunamadı")
+            for j, seat in enumerate(range_seats):
+                hands[:, seat + 1] = setup.ranges[seat][0][picks[:, j]]
+            range_cards = hands[:, [seat + 1 for seat in range_seats]].reshape(n, -1)
+        else:
+            range_cards = None
+
+        to_deal = 5 - len(setup.board)
+        dealt = deal_without_replacement(
+            setup.deck, n, 2 * len(setup.random_seats) + to_deal, rng, dead=range_cards
+        )
+        for j, seat in enumerate(setup.random_seats):
+            hands[:, seat + 1] = dealt[:, 2 * j:2 * j + 2]
+        full_board = np.hstack([
+            np.broadcast_to(np.array(setup.board, dtype=np.int64), (n, len(setup.board))),
+            dealt[:, dealt.shape[1] - to_deal:]
+        ])
+
+        ranks = np.stack([
+            evaluate_batch(np.hstack([hands[:, p], full_board]))
+            for p in range(setup.players)
+        ], axis=1)
+        winners = ranks == ranks.max(axis=1, keepdims=True)
+        num_winners = winners.sum(axis=1)
+        shares = (winners / num_winners[:, None]).sum(axis=0)
+        return (
+            int(np.count_nonzero(winners[:, 0] & (num_winners == 1))),
+            int(np.count_nonzero(winners[:, 0] & (num_winners > 1))),
+            shares.tolist()
+        )
+
+    def _simulate_scalar(self, setup: '_MultiwaySetup', n: int, rng):
+        """Saf Python yolu (numpy yoksa)."""
+        evaluate = self._lookup.evaluate
+        to_deal = 5 - len(setup.board)
+        win = tie = 0
+        shares = [0.0] * setup.players
+
+        for _ in range(n):
+            hands = [setup.hero] + [None] * (setup.players - 1)
+            for seat, hand in setup.known.items():
+                hands[seat + 1] = hand
+
+            used = set()
+            for _ in range(_MULTIWAY_MAX_REDRAWS if setup.ranges else 0):
+                used = set()
+                for seat, (cards, _, cumulative) in setup.ranges.items():
+                    hand = rng.choices(cards, cum_weights=cumulative)[0]
+                    hands[seat + 1] = hand
+                    used.update(hand)
+                if len(used) == 2 * len(setup.ranges):
+                    break
+            else:
+                if setup.ranges:
+                    raise ValueError("Range'ler için çakışmasız dağıtım bulunamadı")
+
+            pool = [c for c in setup.deck if c not in used] if used else setup.deck
+            drawn = rng.sample(pool, 2 * len(setup.random_seats) + to_deal)
+            for j, seat in enumerate(setup.random_seats):
+                hands[seat + 1] = drawn[2 * j:2 * j + 2]
+            full_board = setup.board + drawn[len(drawn) - to_deal:]
+
+            ranks = [evaluate(list(hand) + full_board) for hand in hands]
+            best = max(ranks)
+            winners = [p for p, r in enumerate(ranks) if r == best]
+            for p in winners:
+                shares[p] += 1.0 / len(winners)
+            if winners[0] == 0:
+                if len(winners) == 1:
+                    win += 1
+                else:
+                    tie += 1
+        return win, tie, shares
+
+
+class _MultiwaySetup:
+    """Bir çok oyunculu hesap için sabit dağıtım bilgisi."""
+
+    __slots__ = ('hero', 'board', 'known', 'ranges', 'random_seats', 'deck', 'players')
+
+    def __init__(self, hero, board, known, ranges, random_seats, deck, players):
+        self.hero = hero
+        self.board = board
+        self.known = known
+        self.ranges = ranges
+        self.random_seats = random_seats
+        self.deck = deck
+        self.players = players
+
+
+def _is_known_hand(villain) -> bool:
+    """Rakip tanımı bilinen iki kart mı?"""
+    return isinstance(villain, (tuple, list)) and len(villain) == 2 \
+        and all(isinstance(c, int) for c in villain)
+
+
+def _ranges_compatible(ranges: Dict) -> bool:
+    """
+    Range'li rakiplerin hepsine aynı anda çakışmayan (pozitif ağırlıklı)
+    kombinasyon verilebilir mi? En az kombinasyonlu koltuktan başlayan
+    geri izleme; başarısız (koltuk, kullanılan kartlar) durumları tekrar
+    denenmez.
+    """
+    seats = []
+    for _, masks, cumulative in ranges.values():
+        previous, live = 0.0, set()
+        for mask, total in zip(masks, cumulative):
+            if total > previous:
+                live.add(int(mask))
+            previous = total
+        seats.append(sorted(live))
+    seats.sort(key=len)
+    failed = set()
+
+    def place(seat: int, used: int) -> bool:
+        if seat == len(seats):
+            return True
+        if (seat, used) in failed:
+            return False
+        for mask in seats[seat]:
+            if not mask & used and place(seat + 1, used | mask):
+                return True
+        failed.add((seat, used))
+        return False
+
+    return place(0, 0)
+
+
+def _range_table(hand_range, dead_mask: int):
+    """
+    Range'i örneklemeye hazır (kombinasyonlar, maskeler, kümülatif ağırlık)
+    üçlüsüne çevirir. NumPy yoksa listeler döner.
+    """
+    combos = [
+        (c1, c2, w) for c1, c2, w in range_to_combos(hand_range)
+        if not dead_mask & ((1 << c1) | (1 << c2))
+    ]
+    cumulative = []
+    total = 0.0
+    for _, _, w in combos:
+        total += w
+        cumulative.append(total)
+    cards = [(c1, c2) for c1, c2, _ in combos]
+    masks = [(1 << c1) | (1 << c2) for c1, c2 in cards]
+
+    if NUMPY_AVAILABLE:
+        return (
+            np.array(cards, dtype=np.int64).reshape(len(cards), 2),
+            np.array(masks, dtype=np.int64),
+            np.array(cumulative)
+        )
+    return cards, masks, cumulative
@@ -5,36 +5,257 @@ El gücü hesaplama ve board analizi.
 Monte Carlo simülasyonu ile gerçek equity hesabı.
 """
 
-from typing import List, Dict, Tuple, Optional, Set
+from typing import List, Tuple, Optional, Sequence
 from collections import Counter
-from itertools import combinations
-import random
+from dataclasses import replace
 import time
 
 from constants import (
-    RANKS, SUITS, RANK_VALUES, RANK_VALUES_LOW_ACE,
-    BoardTexture, HandCategory, DrawType,
-    MONTE_CARLO_ITERATIONS, SIMULATION_TIMEOUT
+    RANKS, SUITS, NUM_CARDS,
+    BoardTexture, HandCategory,
+    MONTE_CARLO_ITERATIONS, SIMULATION_TIMEOUT, EXACT_ENUMERATION_LIMIT,
+    EQUITY_TARGET_STD_ERROR, EQUITY_MAX_SAMPLES
 )
 from data_classes import (
-    Card, HoleCards, Board, HandStrength, BoardAnalysis
+    Card, HoleCards, Board, HandStrength, BoardAnalysis, EquityResult, MultiwayResult,
+    OutsAnalysis, HandRanking, HandPotential, BlockerAnalysis
 )
+from lookup_evaluator import LookupEvaluator, rank_category, describe_rank
+from isomorphism import canonicalize, canonical_board
+from result_cache import ResultCache
+from rng import RandomLike, make_random
+from outs import OutsCalculator
+from hand_ranking import HandRanker
+from equity import (
+    ExactEquity, AdaptiveEquity, RangeEquity, MultiwayEquity, EquitySession, enumeration_size
+)
+
+try:
+    import numpy as np
+    from batch_evaluator import evaluate_batch, sample_without_replacement
+    from preflop_equity import get_preflop_table
+    from texture_table import get_texture_table
+    from blockers import BlockerAnalyzer
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 class HandEvaluator:
     """El değerlendirme motoru - Monte Carlo destekli."""
     
-    def __init__(self):
-        self._deck = self._create_deck()
+    def __init__(self, cache_size: int = 0, rng: RandomLike = None):
+        """
+        Args:
+            cache_size: > 0 ise evaluate_hand sonuçları bu boyutta LRU
+                cache'te tutulur (kanonik el/board anahtarıyla)
+            rng: random.Random örneği veya seed; seed verilmeyen Monte
+                Carlo hesapları bu akıştan seed'lenir
+        """
+        self.rng = make_random(rng)
+        self._lookup = LookupEvaluator()
+        self._exact = ExactEquity()
+        self._adaptive = AdaptiveEquity()
+        self._range_equity: Optional[RangeEquity] = None
+        self._potential = None  # hand_potential.PotentialCalculator, ilk çağrıda oluşturulur
+        self._multiway = MultiwayEquity()
+        self._outs = OutsCalculator()
+        self._ranker = HandRanker()
+        self._blockers = BlockerAnalyzer() if NUMPY_AVAILABLE else None
+        self.cache: Optional[ResultCache] = ResultCache(cache_size) if cache_size else None
+        self._last_hand: Tuple[Optional[tuple], Optional[HandStrength]] = (None, None)
+    
+    def _seed(self, seed: Optional[int]) -> int:
+        """Verilen seed, yoksa örneğin RNG akışından türetilen seed."""
+        return seed if seed is not None else self.rng.getrandbits(63)
+    
+    def calculate_equity(
+        self,
+        hole_cards: HoleCards,
+        board: Board,
+        iterations: int = MONTE_CARLO_ITERATIONS,
+        exact_limit: int = EXACT_ENUMERATION_LIMIT,
+        villains: Optional[Sequence] = None,
+        seed: Optional[int] = None
+    ) -> float:
+        """
+        Equity hesaplar: uzay küçükse tam sayım, değilse Monte Carlo.
+        
+        Args:
+            hole_cards: Hero'nun eli
+            board: Mevcut board kartları
+            iterations: Monte Carlo'ya düşülürse simülasyon sayısı
+            exact_limit: Tam sayım yapılacak maksimum showdown sayısı
+                (0 = her zaman Monte Carlo)
+            villains: Çok oyunculu pot için rakip tanımları (None = tek
+                rastgele rakip), bkz. calculate_multiway_equity
+            seed: Çok oyunculu Monte Carlo için seed (None = self.rng akışından)
+            
+        Returns:
+            0.0-1.0 arası equity
+        """
+        if not hole_cards:
+            return 0.5
+        
+        if villains is not None and list(villains) != [None]:
+            result = self.calculate_multiway_equity(hole_cards, board, villains, iterations, seed=seed)
+            return round(result.equity, 3)
+        
+        num_unseen = NUM_CARDS - 2 - len(board.indices)
+        if enumeration_size(num_unseen, 5 - len(board.indices)) <= exact_limit:
+            return round(self._exact.equity(hole_cards.indices, board.indices), 3)
+        
+        return self.calculate_equity_monte_carlo(hole_cards, board, iterations)
+    
+    def estimate_equity(
+        self,
+        hole_cards: HoleCards,
+        board: Board,
+        target_std_error: float = EQUITY_TARGET_STD_ERROR,
+        max_samples: int = EQUITY_MAX_SAMPLES,
+        seed: Optional[int] = None
+    ) -> EquityResult:
+        """
+        Hedef standart hataya kadar örnekleyen equity hesabı.
+        
+        Returns:
+            EquityResult: equity, güven aralığı ve kullanılan örnek sayısı
+        """
+        return self._adaptive.estimate(
+            hole_cards.indices, board.indices,
+            target_std_error=target_std_error,
+            max_samples=max_samples,
+            seed=self._seed(seed)
+        )
+    
+    def calculate_multiway_equity(
+        self,
+        hole_cards: HoleCards,
+        board: Board,
+        villains: Sequence,
+        iterations: int = MONTE_CARLO_ITERATIONS,
+        seed: Optional[int] = None
+    ) -> MultiwayResult:
+        """
+        N rakipli equity (en fazla MAX_PLAYERS oyuncu).
+        
+        Args:
+            hole_cards: Hero'nun eli
+            board: Mevcut board
+            villains: Her rakip için None (rastgele el), HoleCards
+                (bilinen el) veya range (notasyon metni / kümesi / ağırlıklı sözlük)
+            iterations: Simülasyon sayısı
+            seed: Tekrarlanabilirlik için seed
+        
+        Returns:
+            MultiwayResult: hero win/tie payı ve oyuncu başına equity
+        """
+        villains = [
+            tuple(v.indices) if isinstance(v, HoleCards) else v for v in villains
+        ]
+        return self._multiway.equity(
+            hole_cards.indices, board.indices, villains, iterations=iterations, seed=self._seed(seed)
+        )
+    
+    def calculate_preflop_equity(self, hole_cards: HoleCards, villain_range=None) -> float:
+        """
+        Preflop all-in equity (169x169 tablodan, tablo yoksa simülasyon).
+        
+        Args:
+            hole_cards: Hero'nun eli
+            villain_range: Range, notasyon metni, kümesi veya {notasyon: ağırlık} sözlüğü
+                (None = rastgele el)
+        """
+        table = get_preflop_table() if NUMPY_AVAILABLE else None
+        if table is not None:
+            return round(table.hand_vs_range(hole_cards.indices, villain_range), 3)
+        return self.calculate_equity(hole_cards, Board(), villains=[villain_range])
+    
+    def analyze_outs(self, hole_cards: HoleCards, board: Board) -> OutsAnalysis:
+        """Kesin outs, gelişme kategorileri ve isabet olasılığı."""
+        return self._outs.analyze(hole_cards.indices, board.indices)
+    
+    def rank_hand(self, hole_cards: HoleCards, board: Board) -> HandRanking:
+        """Rakibin olası tüm ellerine karşı kesin sıralama (nut, yüzdelik)."""
+        return self._ranker.rank(hole_cards.indices, board.indices)
+    
+    def analyze_blockers(
+        self, hole_cards: HoleCards, board: Board, villain_range=None
+    ) -> BlockerAnalysis:
+        """
+        Hero kartlarının rakip range'indeki value / bluff kombinasyonlarını
+        ne kadar azalttığı (kategori ve kart başına).
+        
+        Args:
+            villain_range: Range, notasyon metni, kümesi veya {notasyon: ağırlık} sözlüğü
+                (None = rastgele el)
+        """
+        if self._blockers is None:
+            raise ImportError("Blocker analizi için numpy gerekli")
+        return self._blockers.analyze(hole_cards.indices, board.indices, villain_range)
     
-    def _create_deck(self) -> List[Card]:
-        """52 kartlık deste oluşturur."""
-        return [Card(r, s) for r in RANKS for s in SUITS]
+    def calculate_draw_equity(
+        self, hole_cards: HoleCards, board: Board, villain_range=None
+    ) -> EquityResult:
+        """
+        Range'e karşı river'a kadar tam equity (flop'ta turn + river).
+        
+        Args:
+            villain_range: Range, notasyon metni, kümesi veya {notasyon: ağırlık} sözlüğü
+                (None = rastgele el)
+        """
+        return self._outs.draw_equity(hole_cards.indices, board.indices, villain_range)
+    
+    def calculate_range_equity(
+        self,
+        hero_range,
+        villain_range,
+        board: Board,
+        seed: Optional[int] = None
+    ) -> EquityResult:
+        """
+        Range vs range equity (örn. RFI range'i vs BB savunma range'i).
+        
+        Args:
+            hero_range: Range, notasyon metni, kümesi veya {notasyon: ağırlık} sözlüğü
+            villain_range: Aynı formatta rakip range'i
+            board: Mevcut board
+            seed: Preflop runout örneklemesi için seed
+        """
+        if self._range_equity is None:
+            self._range_equity = RangeEquity()
+        return self._range_equity.equity(
+            hero_range, villain_range, board.indices, seed=self._seed(seed)
+        )
+    
+    def calculate_hand_potential(
+        self, hole_cards: HoleCards, board: Board, villain_range=None
+    ) -> HandPotential:
+        """
+        River'a kadar equity dağılımı: histogram, EHS, EHS², PPot / NPot.
+        Analiz amaçlıdır; flop'ta board başına ilk çağrı ~0.5 s sürer.
+        
+        Args:
+            villain_range: Range, notasyon metni, kümesi veya {notasyon: ağırlık} sözlüğü
+                (None = rastgele el)
+        """
+        if self._potential is None:
+            from hand_potential import PotentialCalculator
+            self._potential = PotentialCalculator()
+        return self._potential.analyze(hole_cards.indices, board.indices, villain_range)
+    
+    def equity_session(self, hole_cards: HoleCards, villain_range=None) -> EquitySession:
+        """
+        El boyunca kullanılacak equity oturumu: flop sayımı turn ve river
+        equity'si için yeniden kullanılır (bkz. EquitySession).
+        """
+        return EquitySession(hole_cards.indices, villain_range)
     
     def calculate_equity_monte_carlo(
         self, 
         hole_cards: HoleCards, 
         board: Board, 
-        iterations: int = MONTE_CARLO_ITERATIONS
+        iterations: int = MONTE_CARLO_ITERATIONS,
+        vectorized: bool = False
     ) -> float:
         """
         Monte Carlo simülasyonu ile gerçek equity hesaplar.
@@ -43,6 +264,8 @@ class HandEvaluator:
             hole_cards: Hero'nun eli
             board: Mevcut board kartları
             iterations: Simülasyon sayısı
+            vectorized: True ise tüm dağıtımlar NumPy ile tek seferde
+                değerlendirilir (timeout uygulanmaz)
             
         Returns:
             0.0-1.0 arası kazanma ihtimali
@@ -52,37 +275,35 @@ class HandEvaluator:
         
         start_time = time.time()
         
-        # Bilinen kartları belirle
-        known_cards = {str(hole_cards.card1), str(hole_cards.card2)}
-        known_cards.update(str(c) for c in board.cards)
+        # Bilinen kartlar (indeks olarak)
+        hero = list(hole_cards.indices)
+        board_cards = list(board.indices)
+        known_cards = set(hero) | set(board_cards)
         
         # Kalan desteyi oluştur
-        deck = [c for c in self._deck if str(c) not in known_cards]
+        deck = [i for i in range(52) if i not in known_cards]
+        
+        if vectorized:
+            return self._equity_monte_carlo_batch(hero, board_cards, deck, iterations)
         
         wins = 0
         splits = 0
-        cards_to_deal = 5 - len(board.cards)
+        cards_to_deal = 5 - len(board_cards)
+        evaluate = self._lookup.evaluate
         
         for i in range(iterations):
-            # Timeout kontrolü
-            if time.time() - start_time > SIMULATION_TIMEOUT:
+            # Timeout kontrolü (her 256 iterasyonda bir)
+            if not i & 255 and time.time() - start_time > SIMULATION_TIMEOUT:
                 iterations = i  # Gerçek iterasyon sayısını güncelle
                 break
             
-            # Deste karıştır
-            random.shuffle(deck)
-            
-            # Rakibe el ver (Heads-up)
-            villain_cards = [deck[0], deck[1]]
-            villain_hand = HoleCards(villain_cards[0], villain_cards[1])
-            
-            # Board'u tamamla
-            sim_board_cards = board.cards + deck[2:2+cards_to_deal]
-            sim_board = Board(sim_board_cards)
+            # Rakibe el ver (Heads-up) ve board'u tamamla
+            drawn = self.rng.sample(deck, 2 + cards_to_deal)
+            sim_board = board_cards + drawn[2:]
             
             # Elleri değerlendir
-            hero_score = self._get_hand_score(hole_cards, sim_board)
-            villain_score = self._get_hand_score(villain_hand, sim_board)
+            hero_score = evaluate(hero + sim_board)
+            villain_score = evaluate(drawn[:2] + sim_board)
             
             if hero_score > villain_score:
                 wins += 1
@@ -97,103 +318,92 @@ class HandEvaluator:
             
         return round(equity, 3)
     
-    def _get_hand_score(self, hole_cards: HoleCards, board: Board) -> Tuple[int, List[int]]:
-        """7 karttan en iyi 5'liyi bulur ve skor döndürür."""
-        all_cards = [hole_cards.card1, hole_cards.card2] + board.cards
+    def _equity_monte_carlo_batch(
+        self, hero: List[int], board_cards: List[int], deck: List[int], iterations: int
+    ) -> float:
+        """Monte Carlo'nun vektörize hali: dağıtım ve showdown'lar toplu yapılır."""
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy gerekli: pip install numpy")
+        if iterations <= 0:
+            return 0.5
         
-        best_score = (-1, [])
-        for combo in combinations(all_cards, 5):
-            score = self._evaluate_5_card_hand(list(combo))
-            if score > best_score:
-                best_score = score
+        drawn = sample_without_replacement(
+            deck, iterations, 7 - len(board_cards), np.random.default_rng(self._seed(None))
+        )
+        runout = np.hstack([np.tile(board_cards, (iterations, 1)), drawn[:, 2:]])
+        hero_ranks = evaluate_batch(np.hstack([np.tile(hero, (iterations, 1)), runout]))
+        villain_ranks = evaluate_batch(np.hstack([drawn[:, :2], runout]))
         
-        return best_score
-    
-    def _evaluate_5_card_hand(self, cards: List[Card]) -> Tuple[int, List[int]]:
-        """5 kartlık eli değerlendirir."""
-        cards.sort(key=lambda c: c.value, reverse=True)
-        ranks = [c.value for c in cards]
-        suits = [c.suit for c in cards]
-        
-        is_flush = len(set(suits)) == 1
-        
-        # Straight kontrolü
-        is_straight = False
-        unique_ranks = sorted(list(set(ranks)), reverse=True)
-        if len(unique_ranks) == 5:
-            if unique_ranks[0] - unique_ranks[4] == 4:
-                is_straight = True
-            # Wheel (A-2-3-4-5)
-            if set(unique_ranks) == {14, 5, 4, 3, 2}:
-                is_straight = True
-                ranks = [5, 4, 3, 2, 1]
-        
-        rank_counts = Counter(ranks)
-        counts = sorted(rank_counts.values(), reverse=True)
-        sorted_ranks = sorted(rank_counts.keys(), key=lambda r: (rank_counts[r], r), reverse=True)
-        
-        # El kategorisi belirleme
-        if is_straight and is_flush:
-            return (9, ranks)  # Straight Flush
-        if counts == [4, 1]:
-            return (8, sorted_ranks)  # Four of a Kind
-        if counts == [3, 2]:
-            return (7, sorted_ranks)  # Full House
-        if is_flush:
-            return (6, ranks)  # Flush
-        if is_straight:
-            return (5, ranks)  # Straight
-        if counts == [3, 1, 1]:
-            return (4, sorted_ranks)  # Three of a Kind
-        if counts == [2, 2, 1]:
-            return (3, sorted_ranks)  # Two Pair
-        if counts == [2, 1, 1, 1]:
-            return (2, sorted_ranks)  # Pair
-        
-        return (1, ranks)  # High Card
+        wins = np.count_nonzero(hero_ranks > villain_ranks)
+        splits = np.count_nonzero(hero_ranks == villain_ranks)
+        return round((wins + splits * 0.5) / iterations, 3)
     
     def evaluate_hand(self, hole_cards: HoleCards, board: Board, use_monte_carlo: bool = False) -> HandStrength:
         """
         5-7 kart arasından en iyi 5'li eli bulur ve değerlendirir.
         use_monte_carlo=True ise gerçek Monte Carlo equity hesaplar.
+        
+        Cache açıksa deterministik sonuçlar suit izomorfizmi ile kanonik
+        anahtarda tutulur ve dondurulmuş (paylaşılan) nesne döner.
         """
-        all_cards = [hole_cards.card1, hole_cards.card2] + board.cards
+        if self.cache is None or use_monte_carlo:
+            return self._evaluate_hand(hole_cards, board, use_monte_carlo)
+        
+        # Aynı karar noktası tekrarı: kanonikleştirmeye gerek yok
+        raw_key = (hole_cards.indices, tuple(board.indices))
+        if self._last_hand[0] == raw_key:
+            self.cache.record_hit()
+            return self._last_hand[1]
+        
+        canonical_hole, canonical, _ = canonicalize(hole_cards.indices, board.indices)
+        key = (canonical_hole, canonical)
+        strength = self.cache.get(key)
+        if strength is None:
+            strength = self._evaluate_hand(hole_cards, board, False).freeze()
+            self.cache.put(key, strength)
+        self._last_hand = (raw_key, strength)
+        return strength
+    
+    def _evaluate_hand(self, hole_cards: HoleCards, board: Board, use_monte_carlo: bool) -> HandStrength:
+        """evaluate_hand'in cache'siz hesabı."""
+        indices = list(hole_cards.indices) + board.indices
         
-        if len(all_cards) < 5:
+        if len(indices) < 5:
             # Preflop - sadece hole cards değerlendirmesi
             return self._evaluate_preflop(hole_cards)
         
-        # Tüm 5'li kombinasyonları dene
-        best_hand = None
-        best_score = -1
-        uses_both = False
+        # Kanonik rank; kategori ve açıklama rank'tan türetilir
+        score = self._lookup.evaluate(indices)
+        category = rank_category(score)
         
-        for combo in combinations(all_cards, 5):
-            score, category, desc = self._score_five_cards(list(combo))
-            if score > best_score:
-                best_score = score
-                best_hand = (score, category, desc, combo)
-                # Her iki hole card da kullanılıyor mu?
-                uses_both = (hole_cards.card1 in combo and hole_cards.card2 in combo)
+        # Her iki hole card da gerekli mi? (tek kartla aynı rank'a ulaşılamıyorsa)
+        uses_both = True
+        if len(indices) > 5:
+            board_cards = board.indices
+            uses_both = all(
+                self._lookup.evaluate(board_cards + [hole]) < score
+                for hole in hole_cards.indices
+            )
         
-        if best_hand is None:
-            return HandStrength()
+        # Draw analizi (sadece flop/turn'de): her sonraki kart denenir
+        outs = self._outs.analyze(hole_cards.indices, board.indices)
         
-        score, category, desc, combo = best_hand
+        # Nut ve blocker analizi (rakibin tüm olası elleri) sadece okunursa;
+        # Board değişebilir, kartlar kopyalanır
+        hole, board_cards = hole_cards.indices, list(board.indices)
         
-        # Draw analizi (sadece flop/turn'de)
-        draw_type, draw_outs = self._analyze_draws(hole_cards, board)
-        
-        # Nut analizi
-        is_nut = self._is_nut_hand(hole_cards, board, category)
+        def details():
+            ranking = self._ranker.rank(hole, board_cards)
+            blockers = self._blockers.analyze(hole, board_cards).blocked if self._blockers else []
+            return ranking, blockers
         
         # Vulnerability analizi
         vulnerable = self._is_vulnerable(category, board)
         
         # Equity hesabı
-        if use_monte_carlo and len(board.cards) >= 3:
-            # Monte Carlo ile gerçek equity (postflop)
-            equity = self.calculate_equity_monte_carlo(hole_cards, board, iterations=500)
+        if use_monte_carlo and len(board.indices) >= 3:
+            # Gerçek equity (turn/river tam sayım, flop Monte Carlo)
+            equity = self.calculate_equity(hole_cards, board, iterations=500)
         else:
             # Hızlı tahmin
             equity = self._estimate_equity(category, score, board)
@@ -203,18 +413,31 @@ class HandEvaluator:
             hand_category=category,
             hand_rank=score,
             is_made_hand=(category.value >= HandCategory.PAIR.value),
-            made_hand_desc=desc,
-            has_draw=(draw_type != DrawType.NONE),
-            draw_type=draw_type,
-            draw_outs=draw_outs,
-            draw_equity=draw_outs * 0.02 if board.street == Street.TURN else draw_outs * 0.04,
-            is_nut=is_nut,
+            made_hand_desc=describe_rank(score),
+            has_draw=outs.draw_outs > 0,
+            draw_type=outs.draw_type,
+            draw_outs=outs.draw_outs,
+            draw_equity=round(outs.draw_probability, 3),
             uses_both_cards=uses_both,
-            vulnerable=vulnerable
+            vulnerable=vulnerable,
+            details=details
         )
     
     def _evaluate_preflop(self, hole_cards: HoleCards) -> HandStrength:
-        """Preflop el gücü tahmini."""
+        """Preflop el gücü: equity önceden hesaplanmış 169x169 tablodan."""
+        strength = self._classify_preflop(hole_cards)
+        table = get_preflop_table() if NUMPY_AVAILABLE else None
+        if table is not None:
+            strength.equity = round(table.vs_random(hole_cards.indices), 3)
+        return strength
+    
+    def _classify_preflop(self, hole_cards: HoleCards) -> HandStrength:
+        """
+        Preflop el sınıfı (tablo yoksa equity bu kaba tahminlerden gelir).
+        
+        Açıklama suit içermez ("AKs", "AKo"): evaluate_hand cache'i suit
+        izomorfik elleri aynı anahtarda tutar.
+        """
         h = hole_cards
         
         # Premium pairs
@@ -231,206 +454,35 @@ class HandEvaluator:
         # Suited broadways
         high_val = h.high_card.value
         low_val = h.low_card.value
+        name = f"{h.high_card.rank}{h.low_card.rank}"
         
         if h.is_suited:
             if high_val == 14:  # Ax suited
                 if low_val >= 10:  # AKs, AQs, AJs, ATs
-                    return HandStrength(equity=0.67, made_hand_desc=f"{h}s Premium Suited")
+                    return HandStrength(equity=0.67, made_hand_desc=f"{name}s Premium Suited")
                 else:
-                    return HandStrength(equity=0.55, made_hand_desc=f"{h}s Suited Ace")
+                    return HandStrength(equity=0.55, made_hand_desc=f"{name}s Suited Ace")
             elif high_val >= 12 and low_val >= 10:  # KQs, KJs, QJs etc
-                return HandStrength(equity=0.60, made_hand_desc=f"{h}s Suited Broadway")
+                return HandStrength(equity=0.60, made_hand_desc=f"{name}s Suited Broadway")
             elif h.is_connected or h.gap <= 1:  # Suited connectors
-                return HandStrength(equity=0.45, has_draw=True, made_hand_desc=f"{h}s Suited Connector")
+                return HandStrength(equity=0.45, has_draw=True, made_hand_desc=f"{name}s Suited Connector")
         
         # Offsuit broadways
         if high_val == 14 and low_val >= 12:  # AK, AQ
-            return HandStrength(equity=0.62, made_hand_desc=f"{h} Broadway")
+            return HandStrength(equity=0.62, made_hand_desc=f"{name}o Broadway")
         elif high_val >= 12 and low_val >= 10:
-            return HandStrength(equity=0.52, made_hand_desc=f"{h} Offsuit Broadway")
+            return HandStrength(equity=0.52, made_hand_desc=f"{name}o Offsuit Broadway")
         
         # Diğer eller
-        return HandStrength(equity=0.35, made_hand_desc=f"{h} Speculative")
+        return HandStrength(equity=0.35, made_hand_desc=f"{name}{'s' if h.is_suited else 'o'} Speculative")
 
-    def _score_five_cards(self, cards: List[Card]) -> Tuple[int, HandCategory, str]:
-        """
-        5 kartı değerlendirir ve skor döndürür.
-        Skor formatı: CATEGORY * 10^10 + TIE_BREAKERS
-        """
-        ranks = [c.rank for c in cards]
-        suits = [c.suit for c in cards]
-        values = sorted([c.value for c in cards], reverse=True)
-        
-        rank_counts = Counter(ranks)
-        suit_counts = Counter(suits)
-        
-        is_flush = max(suit_counts.values()) == 5
-        is_straight, straight_high = self._check_straight(values)
-        
-        # Royal Flush
-        if is_flush and is_straight and straight_high == 14:
-            return (10 * 10**10, HandCategory.ROYAL_FLUSH, "Royal Flush")
-        
-        # Straight Flush
-        if is_flush and is_straight:
-            return (9 * 10**10 + straight_high, HandCategory.STRAIGHT_FLUSH, 
-                   f"Straight Flush, {self._val_to_rank(straight_high)} high")
-        
-        # Four of a Kind
-        quads = [r for r, c in rank_counts.items() if c == 4]
-        if quads:
-            quad_val = RANK_VALUES[quads[0]]
-            kicker = max(v for v in values if v != quad_val)
-            score = 8 * 10**10 + quad_val * 10**6 + kicker
-            return (score, HandCategory.FOUR_OF_A_KIND, f"Quad {quads[0]}s")
-        
-        # Full House
-        trips = [r for r, c in rank_counts.items() if c == 3]
-        pairs = [r for r, c in rank_counts.items() if c == 2]
-        if trips and pairs:
-            trip_val = RANK_VALUES[trips[0]]
-            pair_val = RANK_VALUES[pairs[0]]
-            score = 7 * 10**10 + trip_val * 10**6 + pair_val
-            return (score, HandCategory.FULL_HOUSE, f"Full House, {trips[0]}s full of {pairs[0]}s")
-        
-        # Flush
-        if is_flush:
-            score = 6 * 10**10 + self._kickers_score(values)
-            return (score, HandCategory.FLUSH, f"Flush, {self._val_to_rank(values[0])} high")
-        
-        # Straight
-        if is_straight:
-            score = 5 * 10**10 + straight_high
-            return (score, HandCategory.STRAIGHT, f"Straight, {self._val_to_rank(straight_high)} high")
-        
-        # Three of a Kind
-        if trips:
-            trip_val = RANK_VALUES[trips[0]]
-            kickers = sorted([v for v in values if v != trip_val], reverse=True)[:2]
-            score = 4 * 10**10 + trip_val * 10**6 + self._kickers_score(kickers)
-            return (score, HandCategory.THREE_OF_A_KIND, f"Trip {trips[0]}s")
-        
-        # Two Pair
-        if len(pairs) >= 2:
-            pair_vals = sorted([RANK_VALUES[p] for p in pairs], reverse=True)[:2]
-            kicker = max(v for v in values if v not in pair_vals)
-            score = 3 * 10**10 + pair_vals[0] * 10**6 + pair_vals[1] * 10**4 + kicker
-            return (score, HandCategory.TWO_PAIR, 
-                   f"Two Pair, {self._val_to_rank(pair_vals[0])}s and {self._val_to_rank(pair_vals[1])}s")
-        
-        # One Pair
-        if pairs:
-            pair_val = RANK_VALUES[pairs[0]]
-            kickers = sorted([v for v in values if v != pair_val], reverse=True)[:3]
-            score = 2 * 10**10 + pair_val * 10**6 + self._kickers_score(kickers)
-            return (score, HandCategory.PAIR, f"Pair of {pairs[0]}s")
-        
-        # High Card
-        score = 1 * 10**10 + self._kickers_score(values)
-        return (score, HandCategory.HIGH_CARD, f"{self._val_to_rank(values[0])} high")
-    
-    def _check_straight(self, values: List[int]) -> Tuple[bool, int]:
-        """Straight kontrolü. Wheel (A2345) dahil."""
-        unique_vals = sorted(set(values), reverse=True)
-        
-        # Normal straight
-        if len(unique_vals) >= 5:
-            for i in range(len(unique_vals) - 4):
-                if unique_vals[i] - unique_vals[i+4] == 4:
-                    return True, unique_vals[i]
-        
-        # Wheel (A2345)
-        if set([14, 5, 4, 3, 2]).issubset(set(values)):
-            return True, 5  # 5-high straight
-        
-        return False, 0
-    
-    def _kickers_score(self, values: List[int]) -> int:
-        """Kicker'ları skorlar (her biri 2 haneli)."""
-        score = 0
-        for i, v in enumerate(values[:5]):
-            score += v * (100 ** (4 - i))
-        return score
-    
-    def _val_to_rank(self, val: int) -> str:
-        """Değeri rank'a çevirir (14 -> 'A')."""
-        for r, v in RANK_VALUES.items():
-            if v == val:
-                return r
-        return '?'
-    
-    def _analyze_draws(self, hole_cards: HoleCards, board: Board) -> Tuple[DrawType, int]:
-        """Draw analizi yapar."""
-        if board.street == Street.RIVER:
-            return DrawType.NONE, 0
-        
-        all_cards = [hole_cards.card1, hole_cards.card2] + board.cards
-        suits = [c.suit for c in all_cards]
-        values = sorted([c.value for c in all_cards])
-        
-        # Flush draw
-        suit_counts = Counter(suits)
-        max_suit_count = max(suit_counts.values())
-        flush_draw = max_suit_count == 4
-        
-        # Straight draw
-        oesd = False  # Open-ended straight draw
-        gutshot = False
-        unique_vals = sorted(set(values))
-        
-        # 4 ardışık kart kontrolü (OESD)
-        for i in range(len(unique_vals) - 3):
-            window = unique_vals[i:i+4]
-            if window[-1] - window[0] == 3:  # 4 ardışık
-                oesd = True
-                break
-            elif window[-1] - window[0] == 4 and len(window) == 4:  # 1 gap = gutshot
-                gutshot = True
-        
-        # Combo draw (flush + straight draw)
-        if flush_draw and oesd:
-            return DrawType.COMBO_DRAW, 15  # ~15 out
-        elif flush_draw:
-            return DrawType.FLUSH_DRAW, 9
-        elif oesd:
-            return DrawType.OESD, 8
-        elif gutshot:
-            return DrawType.GUTSHOT, 4
-        
-        # Backdoor draws (sadece flop'ta)
-        if board.street == Street.FLOP:
-            if max_suit_count == 3:
-                return DrawType.BACKDOOR_FLUSH, 1
-        
-        return DrawType.NONE, 0
-    
-    def _is_nut_hand(self, hole_cards: HoleCards, board: Board, category: HandCategory) -> bool:
-        """Nut el mi kontrolü (basitleştirilmiş)."""
-        if category in [HandCategory.ROYAL_FLUSH, HandCategory.STRAIGHT_FLUSH]:
-            return True
-        if category == HandCategory.FOUR_OF_A_KIND:
-            # Board'da trips varsa nut quad check
-            return True  # Basitleştirilmiş
-        if category == HandCategory.FLUSH:
-            # Ace-high flush mu?
-            all_cards = [hole_cards.card1, hole_cards.card2] + board.cards
-            suit_counts = Counter(c.suit for c in all_cards)
-            flush_suit = max(suit_counts.keys(), key=lambda s: suit_counts[s])
-            flush_cards = [c for c in all_cards if c.suit == flush_suit]
-            if any(c.rank == 'A' for c in flush_cards):
-                if hole_cards.card1.suit == flush_suit and hole_cards.card1.rank == 'A':
-                    return True
-                if hole_cards.card2.suit == flush_suit and hole_cards.card2.rank == 'A':
-                    return True
-        return False
-    
     def _is_vulnerable(self, category: HandCategory, board: Board) -> bool:
         """El kolayca geçilebilir mi?"""
         if category in [HandCategory.PAIR, HandCategory.TWO_PAIR]:
             return True
         if category == HandCategory.THREE_OF_A_KIND:
             # Board'da pair varsa (trips board) vulnerable değil
-            board_ranks = [c.rank for c in board.cards]
+            board_ranks = [i >> 2 for i in board.indices]
             if len(board_ranks) != len(set(board_ranks)):
                 return False  # Board paired - set olması güçlü
             return True  # Open trips - vulnerable
@@ -456,25 +508,76 @@ class HandEvaluator:
 class BoardAnalyzer:
     """Board texture analizi."""
     
+    def __init__(self, cache_size: int = 0, use_table: bool = True):
+        """
+        Args:
+            cache_size: > 0 ise analizler bu boyutta LRU cache'te tutulur
+                (kanonik board anahtarıyla)
+            use_table: Önceden hesaplanmış texture tablosu varsa kullan
+        """
+        self.cache: Optional[ResultCache] = ResultCache(cache_size) if cache_size else None
+        self._table = get_texture_table() if use_table and NUMPY_AVAILABLE else None
+        self._last_board: Tuple[Optional[tuple], Optional[BoardAnalysis]] = (None, None)
+    
     def analyze(self, board: Board) -> BoardAnalysis:
         """Board'u analiz eder ve BoardAnalysis döndürür."""
-        if not board.cards:
+        cards = board.indices
+        if self.cache is None or not cards:
+            return self.analyze_cards(cards)
+        
+        raw_key = tuple(cards)
+        if self._last_board[0] == raw_key:
+            self.cache.record_hit()
+            return self._last_board[1]
+        
+        canonical, _ = canonical_board(cards)
+        analysis = self.cache.get(canonical)
+        if analysis is None:
+            analysis = self.analyze_cards(list(canonical)).freeze()
+            self.cache.put(canonical, analysis)
+        
+        # Suit'e / kart sırasına bağlı alanlar gerçek board'dan
+        flush_suit, highest_card = self._suit_fields(cards)
+        if analysis.flush_suit != flush_suit or analysis.highest_card != highest_card:
+            analysis = replace(analysis, flush_suit=flush_suit, highest_card=highest_card).freeze()
+        self._last_board = (raw_key, analysis)
+        return analysis
+    
+    def analyze_cards(self, cards: List[int]) -> BoardAnalysis:
+        """Kart indeksleri için analiz: tabloda varsa lookup, yoksa hesap."""
+        if self._table is not None and cards:
+            row = self._table.row(cards)
+            if row is not None:
+                analysis = self._table.analysis(row)
+                analysis.flush_suit, analysis.highest_card = self._suit_fields(cards)
+                return analysis
+        return self._analyze(cards)
+    
+    def _suit_fields(self, cards: List[int]) -> Tuple[Optional[str], Card]:
+        """Suit permütasyonuyla değişen alanlar: (flush_suit, highest_card)."""
+        suit_counts = Counter(i & 3 for i in cards)
+        flush_suit = max(suit_counts.keys(), key=lambda s: suit_counts[s])
+        return (
+            SUITS[flush_suit] if suit_counts[flush_suit] >= 2 else None,
+            Card.from_index(cards[0])
+        )
+    
+    def _analyze(self, cards: List[int]) -> BoardAnalysis:
+        """analyze'ın cache'siz hesabı."""
+        if not cards:
             return BoardAnalysis(texture=BoardTexture.UNKNOWN)
         
-        cards = board.cards
-        ranks = [c.rank for c in cards]
-        suits = [c.suit for c in cards]
-        values = sorted([c.value for c in cards], reverse=True)
+        values = sorted([(i >> 2) + 2 for i in cards], reverse=True)
         
         # Suit analizi
-        suit_counts = Counter(suits)
+        suit_counts = Counter(i & 3 for i in cards)
         max_same_suit = max(suit_counts.values())
-        flush_suit = max(suit_counts.keys(), key=lambda s: suit_counts[s])
+        flush_suit, highest_card = self._suit_fields(cards)
         
-        # Pairing analizi
-        rank_counts = Counter(ranks)
-        pairs = [r for r, c in rank_counts.items() if c == 2]
-        trips = [r for r, c in rank_counts.items() if c == 3]
+        # Pairing analizi (yüksek rank önce, kart sırasından bağımsız)
+        rank_counts = Counter(i >> 2 for i in cards)
+        pairs = [RANKS[r] for r, c in sorted(rank_counts.items(), reverse=True) if c == 2]
+        trips = [RANKS[r] for r, c in sorted(rank_counts.items(), reverse=True) if c == 3]
         
         is_paired = len(pairs) > 0
         is_double_paired = len(pairs) >= 2
@@ -544,7 +647,7 @@ class BoardAnalyzer:
             texture=texture,
             flush_possible=flush_possible,
             flush_draw_possible=flush_draw_possible,
-            flush_suit=flush_suit if max_same_suit >= 2 else None,
+            flush_suit=flush_suit,
             same_suit_count=max_same_suit,
             straight_possible=straight_possible,
             straight_draw_possible=straight_draw_possible,
@@ -553,7 +656,7 @@ class BoardAnalyzer:
             is_double_paired=is_double_paired,
             is_trips=is_trips,
             pair_rank=pairs[0] if pairs else None,
-            highest_card=cards[0] if cards else None,
+            highest_card=highest_card,
             broadway_count=broadway_count,
             danger_level=min(danger, 10),
             description=description
@@ -592,7 +695,3 @@ class BoardAnalyzer:
             return BoardTexture.SEMI_WET
         
         return BoardTexture.DRY_RAINBOW
-
-
-# Import için gerekli (dosya başında olmalı ama append ediyoruz)
-from constants import Street
@@ -0,0 +1,295 @@
+"""
+POKER BOT V4.0 - HAND HISTORY PARSER
+====================================
+PokerStars ve GGPoker metin hand history'leri için akış (streaming) parser.
+
+Dosya satır satır okunur; bellekte sadece işlenmekte olan elin satırları
+tutulur. Her el hero bakış açısından HandRecord'a (GameState +
+PokerAction'lar) çevrilir; bozuk veya desteklenmeyen eller atlanıp sayılır.
+"""
+
+import calendar
+import re
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from constants import Position, Street, ActionType, RANKS, SUITS
+from data_classes import Card, HoleCards, Board, GameState, PokerAction, HandRecord
+
+_HEADER = re.compile(r'^(?:PokerStars|Poker) Hand #(\w+):')
+_STAKES = re.compile(r'\(([^\s/()]+)/([^\s/()]+)(?: [A-Z]{3})?\)')
+_DATE = re.compile(r'(\d{4})/(\d{1,2})/(\d{1,2}) (\d{1,2}):(\d{2}):(\d{2})')
+_BUTTON = re.compile(r'Seat #(\d+) is the button')
+_SEAT = re.compile(r'^Seat (\d+): (.+?) \(([^ )]+) in chips')
+_DEALT = re.compile(r'^Dealt to (.+?) \[(\w\w) (\w\w)\]')
+_CARDS = re.compile(r'\[([^\]]*)\]')
+_UNCALLED = re.compile(r'^Uncalled bet \(([^)]+)\) returned to (.+)$')
+_COLLECTED = re.compile(r'^(.+?) collected ([^ ]+) from')
+_TOTAL = re.compile(r'^Total pot ([^ ]+).*?Rake ([^ ]+)')
+_AMOUNT = re.compile(r'[\d,]+(?:\.\d+)?')
+
+_CARD_INDEX = {r + s: Card.from_string(r + s).index for r in RANKS for s in SUITS}
+_STREET_MARKERS = (('FLOP', Street.FLOP), ('TURN', Street.TURN), ('RIVER', Street.RIVER))
+
+# Button'dan sonraki blind'lar hariç koltuklar, sondan başa: CO, MP, UTG...
+_LATE_POSITIONS = (Position.CO, Position.MP, Position.UTG)
+
+
+def _amount(text: str) -> float:
+    """'$1,234.50' gibi metinden sayı."""
+    match = _AMOUNT.search(text)
+    if match is None:
+        raise ValueError(f"Miktar bulunamadı: {text!r}")
+    return float(match.group().replace(',', ''))
+
+
+def table_positions(seats: List[int], button: int) -> Dict[int, Position]:
+    """
+    Koltuk numaralarından pozisyonlar (heads-up'ta button = SB, BTN döner).
+    Button boş koltuktaysa (dead button) ondan önceki ilk oyuncu button sayılır.
+    """
+    seats = sorted(seats)
+    if button not in seats:
+        before = [s for s in seats if s < button]
+        button = before[-1] if before else seats[-1]
+    start = seats.index(button)
+    ordered = seats[start:] + seats[:start]
+
+    positions = {ordered[0]: Position.BTN}
+    if len(ordered) == 2:
+        positions[ordered[1]] = Position.BB
+        return positions
+    positions[ordered[1]] = Position.SB
+    positions[ordered[2]] = Position.BB
+    for i, seat in enumerate(reversed(ordered[3:])):
+        positions[seat] = _LATE_POSITIONS[min(i, len(_LATE_POSITIONS) - 1)]
+    return positions
+
+
+def parse_hand(lines: List[str], hero: Optional[str] = None) -> HandRecord:
+    """
+    Tek elin satırlarını HandRecord'a çevirir.
+
+    Args:
+        lines: Başlık satırıyla başlayan el metni (satır sonları olmadan)
+        hero: Hero'nun adı (None = kartları gösterilen 'Dealt to' oyuncusu)
+
+    Returns:
+        HandRecord; aksiyon miktarları simülatördeki gibi: CALL eklenen
+        chip, BET / RAISE / ALL_IN sokak toplamı (raise-to)
+    """
+    header = _HEADER.match(lines[0])
+    stakes = _STAKES.search(lines[0])
+    date = _DATE.search(lines[0])
+    if header is None or stakes is None:
+        raise ValueError(f"Desteklenmeyen başlık: {lines[0][:80]!r}")
+
+    button = 0
+    seats: Dict[str, int] = {}
+    stacks: Dict[str, float] = {}
+    committed: Dict[str, float] = {}
+    street_bets: Dict[str, float] = {}
+    collected: Dict[str, float] = {}
+    folded = set()
+    actions: Dict[Street, List[PokerAction]] = {s: [] for s in Street}
+    aggressors: List[str] = []
+    board: List[int] = []
+    hole = None
+    street = Street.PREFLOP
+    current = actions[street]
+    summary = False
+    total_pot = rake = None
+    flop_pot = flop_stack = 0.0
+
+    for line in lines[1:]:
+        if summary:
+            total = _TOTAL.match(line)
+            if total:
+                total_pot, rake = _amount(total.group(1)), _amount(total.group(2))
+            continue
+
+        if line.startswith('***'):
+            if 'SUMMARY' in line:
+                summary = True
+            elif 'SHOW' not in line and 'FIRST' not in line and 'SECOND' not in line:
+                for marker, marked_street in _STREET_MARKERS:
+                    if marker in line:
+                        street = marked_street
+                        current = actions[street]
+                        street_bets = {}
+                        board = [_CARD_INDEX[c] for c in ' '.join(_CARDS.findall(line)).split()]
+                        if street == Street.FLOP and hero in stacks:
+                            flop_pot = sum(committed.values())
+                            flop_stack = _effective_stack(hero, stacks, committed, folded)
+                        break
+            continue
+
+        name, _, text = line.rpartition(': ')
+        if name in seats:
+            verb, _, rest = text.partition(' ')
+            if verb == 'posts':
+                amount = _amount(rest)
+                committed[name] += amount
+                if 'ante' not in rest:
+                    street_bets[name] = street_bets.get(name, 0.0) + amount
+                continue
+            if verb == 'folds':
+                folded.add(name)
+                current.append(PokerAction(ActionType.FOLD, 0.0, name))
+                continue
+            if verb == 'checks':
+                current.append(PokerAction(ActionType.CHECK, 0.0, name))
+                continue
+            if verb == 'calls':
+                amount = _amount(rest)
+                committed[name] += amount
+                street_bets[name] = street_bets.get(name, 0.0) + amount
+                current.append(PokerAction(ActionType.CALL, amount, name))
+                continue
+            if verb in ('bets', 'raises'):
+                amounts = _AMOUNT.findall(rest)
+                target = float(amounts[-1].replace(',', ''))
+                if verb == 'bets':
+                    target += street_bets.get(name, 0.0)
+                committed[name] += target - street_bets.get(name, 0.0)
+                street_bets[name] = target
+                kind = ActionType.ALL_IN if 'all-in' in rest else (
+                    ActionType.BET if verb == 'bets' else ActionType.RAISE
+                )
+                current.append(PokerAction(kind, target, name))
+                aggressors.append(name)
+                continue
+
+        if street == Street.PREFLOP and not current:
+            seat = _SEAT.match(line)
+            if seat and 'sitting out' not in line:
+                name = seat.group(2)
+                seats[name] = int(seat.group(1))
+                stacks[name] = _amount(seat.group(3))
+                committed[name] = 0.0
+                collected[name] = 0.0
+                continue
+            table = _BUTTON.search(line)
+            if table:
+                button = int(table.group(1))
+                continue
+            dealt = _DEALT.match(line)
+            if dealt and (hero is None or dealt.group(1) == hero):
+                hero = dealt.group(1)
+                hole = (_CARD_INDEX[dealt.group(2)], _CARD_INDEX[dealt.group(3)])
+                continue
+
+        uncalled = _UNCALLED.match(line)
+        if uncalled and uncalled.group(2) in committed:
+            committed[uncalled.group(2)] -= _amount(uncalled.group(1))
+            continue
+        won = _COLLECTED.match(line)
+        if won and won.group(1) in collected:
+            collected[won.group(1)] += _amount(won.group(2))
+
+    if hero is None or hole is None or hero not in seats:
+        raise ValueError(f"Hero kartları bulunamadı: el #{header.group(1)}")
+
+    positions = table_positions(list(seats.values()), button)
+    villain = _main_villain(hero, seats, committed, folded, aggressors, actions)
+    big_blind = _amount(stakes.group(2))
+    state = GameState(
+        hand_id=header.group(1),
+        street=street,
+        hero_hand=HoleCards(Card.from_index(hole[0]), Card.from_index(hole[1])),
+        board=Board([Card.from_index(c) for c in board]),
+        hero_position=positions[seats[hero]],
+        villain_position=positions[seats[villain]],
+        hero_stack=stacks[hero],
+        villain_stack=stacks[villain],
+        pot=total_pot if total_pot is not None else sum(committed.values()),
+        actions_this_street=list(actions[street]),
+        actions_preflop=actions[Street.PREFLOP],
+        actions_flop=actions[Street.FLOP],
+        actions_turn=actions[Street.TURN],
+        actions_river=actions[Street.RIVER],
+        small_blind=_amount(stakes.group(1)),
+        big_blind=big_blind
+    )
+    return HandRecord(
+        state=state,
+        timestamp=calendar.timegm(tuple(int(g) for g in date.groups()) + (0, 0, 0)) if date else 0,
+        hero=hero,
+        players=len(seats),
+        net=round(collected[hero] - committed[hero], 2),
+        rake=rake or 0.0,
+        showdown=hero not in folded and any(n not in folded for n in seats if n != hero),
+        flop_pot=flop_pot,
+        flop_stack=flop_stack,
+        positions={name: positions[seat] for name, seat in seats.items()}
+    )
+
+
+def _effective_stack(hero, stacks, committed, folded) -> float:
+    """Hero'nun arkasındaki stack ile oyunda kalan en büyük rakip stack'inin minimumu."""
+    behind = {name: stacks[name] - committed[name] for name in stacks}
+    opponents = [behind[n] for n in stacks if n != hero and n not in folded]
+    return min(behind[hero], max(opponents)) if opponents else behind[hero]
+
+
+def _main_villain(hero, seats, committed, folded, aggressors, actions) -> str:
+    """
+    GameState'teki tek rakip: sona kalan en çok yatıran rakip, yoksa son
+    agresör, o da yoksa preflop'ta son aksiyon yapan rakip.
+    """
+    live = [n for n in seats if n != hero and n not in folded]
+    if live:
+        return max(live, key=lambda n: committed[n])
+    for name in reversed(aggressors):
+        if name != hero:
+            return name
+    for action in reversed(actions[Street.PREFLOP]):
+        if action.description != hero:
+            return action.description
+    return next(n for n in seats if n != hero)
+
+
+class HandHistoryParser:
+    """
+    Satır akışından el akışı.
+
+    Kullanım:
+        parser = HandHistoryParser(hero="Hero")
+        for record in parser.parse_file("session.txt"):
+            ...
+    """
+
+    def __init__(self, hero: Optional[str] = None):
+        self.hero = hero
+        self.hands = 0
+        self.skipped = 0
+
+    def parse(self, lines: Iterable[str]) -> Iterator[HandRecord]:
+        """Başlık satırlarına göre elleri ayırır; her el bitince yield eder."""
+        block: List[str] = []
+        for line in lines:
+            line = line.rstrip('\r\n')
+            if _HEADER.match(line):
+                if block:
+                    yield from self._parse_block(block)
+                block = [line]
+            elif line and block:
+                block.append(line)
+        if block:
+            yield from self._parse_block(block)
+
+    def parse_file(self, path: str) -> Iterator[HandRecord]:
+        """Dosyayı satır satır okuyarak parse eder (BOM ve bozuk baytlar tolere edilir)."""
+        with open(path, encoding='utf-8-sig', errors='replace') as f:
+            yield from self.parse(f)
+
+    def _parse_block(self, block: List[str]) -> Iterator[HandRecord]:
+        try:
+            record = parse_hand(block, self.hero)
+        except (ValueError, KeyError, IndexError):
+            self.skipped += 1
+            return
+        self.hands += 1
+        yield record
+
+    def get_stats(self) -> dict:
+        return {"hands": self.hands, "skipped": self.skipped}
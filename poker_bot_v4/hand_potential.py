@@ -0,0 +1,205 @@
+"""
+POKER BOT V4.0 - HAND POTENTIAL
+===============================
+Hero'nun river'a kadar equity dağılımı ve el potansiyeli:
+histogram, EHS, EHS² ve pozitif / negatif potansiyel (PPot / NPot).
+
+Bir board için tüm kombinasyonların her runout'taki rank'ı tek seferde
+toplu değerlendirilip saklanır; aynı board'daki her hero eli (bütün bir
+range) bu matris üzerinden sadece karşılaştırmayla hesaplanır. Sonuçlar
+suit izomorfizmi ile kanonik anahtarda cache'lenir.
+"""
+
+from itertools import combinations
+from math import comb
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from constants import NUM_CARDS, POTENTIAL_HISTOGRAM_BINS, POTENTIAL_CACHE_SIZE
+from data_classes import HandPotential
+from batch_evaluator import evaluate_batch
+from equity import _cards_mask, _combo_ranks, _is_known_hand, _live_combos
+from isomorphism import canonicalize
+from result_cache import ResultCache
+
+
+class _BoardData:
+    """Bir board'daki tüm kombinasyonların şimdiki ve runout rank'ları."""
+
+    __slots__ = ('cards', 'masks', 'column', 'now', 'runout_masks', 'river', 'live')
+
+    def __init__(self, board: Sequence[int]):
+        board = list(board)
+        board_mask = _cards_mask(board)
+        self.cards, self.masks, _ = _live_combos(None, board_mask)
+        self.column = np.full(NUM_CARDS * NUM_CARDS, -1, dtype=np.int64)
+        self.column[self.cards[:, 0] * NUM_CARDS + self.cards[:, 1]] = np.arange(len(self.cards))
+
+        board_row = np.array(board, dtype=np.int64)
+        self.now = evaluate_batch(
+            np.hstack([self.cards, np.broadcast_to(board_row, (len(self.cards), len(board)))])
+        )
+
+        deck = [c for c in range(NUM_CARDS) if not board_mask >> c & 1]
+        cards_to_deal = 5 - len(board)
+        runouts = np.array(
+            list(combinations(deck, cards_to_deal)), dtype=np.int64
+        ).reshape(comb(len(deck), cards_to_deal), cards_to_deal)
+        boards = np.hstack([np.broadcast_to(board_row, (len(runouts), len(board))), runouts])
+        self.runout_masks = np.left_shift(1, runouts).sum(axis=1)
+        self.river, self.live = _combo_ranks(self.cards, self.masks, boards, self.runout_masks)
+
+    def index(self, c1: int, c2: int) -> int:
+        """Kombinasyonun kolon indeksi (board ile çakışıyorsa -1)."""
+        return int(self.column[min(c1, c2) * NUM_CARDS + max(c1, c2)])
+
+
+class PotentialCalculator:
+    """
+    El potansiyeli hesaplayıcı (flop, turn veya river board'u).
+
+    Son kullanılan board'un rank matrisi saklanır; flop'ta ilk çağrı
+    ~1M el değerlendirir, aynı board'daki sonraki eller birkaç ms sürer.
+    """
+
+    def __init__(self, cache_size: int = POTENTIAL_CACHE_SIZE, bins: int = POTENTIAL_HISTOGRAM_BINS):
+        self.bins = bins
+        self.cache = ResultCache(cache_size) if cache_size > 0 else None
+        self._board: Tuple[Optional[Tuple[int, ...]], Optional[_BoardData]] = (None, None)
+
+    def analyze(
+        self, hole: Sequence[int], board: Sequence[int], villain_range=None
+    ) -> HandPotential:
+        """
+        Hero elinin equity dağılımı ve potansiyeli.
+
+        Args:
+            hole: Hero'nun 2 kart indeksi
+            board: 3-5 board kart indeksi
+            villain_range: Range, notasyon kümesi, {notasyon: ağırlık} sözlüğü,
+                bilinen el (kart1, kart2) veya None (rastgele el)
+
+        Returns:
+            HandPotential (cache açıksa dondurulmuş, paylaşılan nesne)
+        """
+        if not 3 <= len(board) <= 5:
+            raise ValueError(f"Flop, turn veya river board gerekli: {len(board)} kart")
+
+        key = self._cache_key(hole, board, villain_range)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        data = self._board_data(board)
+        result = self._potential(data, hole, self._villain_weights(data, villain_range))
+        if key is not None:
+            result.freeze()
+            self.cache.put(key, result)
+        return result
+
+    def analyze_range(
+        self, hero_range, board: Sequence[int], villain_range=None
+    ) -> Dict[Tuple[int, int], HandPotential]:
+        """
+        Hero range'indeki her kombinasyon için potansiyel.
+        Rank matrisi board başına bir kez hesaplanır; izomorf kombinasyonlar
+        cache'ten gelir.
+
+        Returns:
+            {(kart1, kart2): HandPotential} (board ile çakışanlar hariç)
+        """
+        cards, _, _ = _live_combos(hero_range, _cards_mask(board))
+        return {
+            (int(c1), int(c2)): self.analyze((int(c1), int(c2)), board, villain_range)
+            for c1, c2 in cards
+        }
+
+    def _board_data(self, board: Sequence[int]) -> _BoardData:
+        key = tuple(sorted(board))
+        if self._board[0] != key:
+            self._board = (key, _BoardData(key))
+        return self._board[1]
+
+    def _cache_key(self, hole, board, villain_range):
+        """
+        Kanonik (el, board, range) anahtarı. Notasyon range'leri suit
+        simetriktir; bilinen rakip eli ile cache kullanılmaz.
+        """
+        if self.cache is None or _is_known_hand(villain_range):
+            return None
+        if hasattr(villain_range, 'combos'):
+            # Range suit simetrik olmayabilir (ölü kart çıkarılmış): ham anahtar
+            return tuple(sorted(hole)), tuple(sorted(board)), villain_range
+        if villain_range is None:
+            range_key = None
+        elif isinstance(villain_range, str):
+            range_key = villain_range
+        elif isinstance(villain_range, dict):
+            range_key = frozenset(villain_range.items())
+        else:
+            range_key = frozenset(villain_range)
+        canonical_hole, canonical, _ = canonicalize(hole, board)
+        return canonical_hole, canonical, range_key
+
+    @staticmethod
+    def _villain_weights(data: _BoardData, villain_range) -> np.ndarray:
+        """Rakip ağırlıkları, board kombinasyon kolonlarına hizalı."""
+        if villain_range is None:
+            return np.ones(len(data.cards))
+        cards, _, weights = _live_combos(villain_range, 0)
+        column = data.column[cards.min(axis=1) * NUM_CARDS + cards.max(axis=1)]
+        aligned = np.zeros(len(data.cards))
+        np.add.at(aligned, column[column >= 0], weights[column >= 0])
+        return aligned
+
+    def _potential(
+        self, data: _BoardData, hole: Sequence[int], villain_weights: np.ndarray
+    ) -> HandPotential:
+        """Tek hero eli için dağılım ve PPot / NPot."""
+        hero = data.index(*hole)
+        if hero < 0:
+            raise ValueError(f"El board ile çakışıyor: {tuple(hole)}")
+        hero_mask = int(data.masks[hero])
+
+        weights = villain_weights * ((data.masks & hero_mask) == 0)
+        if weights.sum() == 0:
+            return HandPotential()
+        rows = (data.runout_masks & hero_mask) == 0
+        joint = weights[None, :] * data.live[rows]
+        runout_weights = joint.sum(axis=1)
+
+        # Şimdiki durum: -1 geride, 0 eşit, 1 önde
+        now = np.sign(data.now[hero] - data.now)
+        hero_river = data.river[rows, hero][:, None]
+        wins = joint * (hero_river > data.river[rows])
+        ties = joint * (hero_river == data.river[rows])
+
+        hand_strength = float(weights @ (now + 1) / (2 * weights.sum()))
+        runout_equity = (wins.sum(axis=1) + ties.sum(axis=1) / 2) / np.maximum(runout_weights, 1e-12)
+        probabilities = runout_weights / runout_weights.sum()
+
+        # Şimdiki durum (satır) x river durumu (sütun: kayıp, split, kazanç) ağırlıkları
+        win_cols, tie_cols = wins.sum(axis=0), ties.sum(axis=0)
+        final = np.stack([joint.sum(axis=0) - win_cols - tie_cols, tie_cols, win_cols], axis=1)
+        transitions = np.stack([final[now == state].sum(axis=0) for state in (-1, 0, 1)])
+        behind, tied, ahead = transitions.sum(axis=1)
+        ppot_den = behind + tied / 2
+        npot_den = ahead + tied / 2
+        ppot = (transitions[0, 2] + transitions[0, 1] / 2 + transitions[1, 2] / 2) / ppot_den \
+            if ppot_den else 0.0
+        npot = (transitions[2, 0] + transitions[2, 1] / 2 + transitions[1, 0] / 2) / npot_den \
+            if npot_den else 0.0
+
+        histogram, _ = np.histogram(runout_equity, bins=self.bins, range=(0.0, 1.0), weights=probabilities)
+        return HandPotential(
+            hand_strength=hand_strength,
+            equity=float(probabilities @ runout_equity),
+            ehs=float(hand_strength * (1 - npot) + (1 - hand_strength) * ppot),
+            ehs2=float(probabilities @ runout_equity ** 2),
+            ppot=float(ppot),
+            npot=float(npot),
+            histogram=tuple(float(h) for h in histogram),
+            runouts=int(rows.sum())
+        )
@@ -0,0 +1,108 @@
+"""
+POKER BOT V4.0 - HAND RANKING
+=============================
+Hero'nun mevcut board'daki elini rakibin olası tüm kombinasyonlarına
+karşı sıralar: nut / second nut ve kesin el gücü yüzdeliği.
+Kalan ~1.000 kombinasyon NumPy varsa tek toplu değerlendirmeyle,
+yoksa lookup evaluator ile tek tek hesaplanır.
+"""
+
+from itertools import combinations
+from typing import List, Sequence
+
+from constants import NUM_CARDS
+from data_classes import HandRanking
+from lookup_evaluator import LookupEvaluator
+
+try:
+    import numpy as np
+    from batch_evaluator import evaluate_batch
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class HandRanker:
+    """
+    Rakip kombinasyonlarına karşı el sıralaması.
+
+    Nut: hiçbir rakip kombinasyonu hero'yu geçemez (split olabilir).
+    Second nut: hero'yu geçen eller tam olarak tek bir el değeridir
+    (örn. QsJdTc'de K9'u sadece AK straight geçer).
+    """
+
+    _combos = None
+
+    def __init__(self):
+        self._lookup = LookupEvaluator()
+        if NUMPY_AVAILABLE and HandRanker._combos is None:
+            combos = np.array(list(combinations(range(NUM_CARDS), 2)), dtype=np.int64)
+            HandRanker._combos = (combos, np.left_shift(1, combos).sum(axis=1))
+
+    def rank(self, hole: Sequence[int], board: Sequence[int]) -> HandRanking:
+        """
+        Hero'nun elini board ile çakışmayan tüm rakip elleriyle karşılaştırır.
+
+        Args:
+            hole: Hero'nun 2 kart indeksi
+            board: 3-5 board kart indeksi (mevcut el sıralanır, runout yok)
+
+        Returns:
+            HandRanking (daha iyi / eşit / daha kötü kombinasyon sayıları,
+            yüzdelik, nut bilgisi)
+        """
+        hole, board = list(hole), list(board)
+        if len(board) < 3:
+            return HandRanking()
+
+        hero_rank = self._lookup.evaluate(hole + board)
+        if NUMPY_AVAILABLE:
+            better, ties, total, second_nut = self._count_batch(hole, board, hero_rank)
+        else:
+            better, ties, total, second_nut = self._count_scalar(hole, board, hero_rank)
+
+        return HandRanking(
+            hand_rank=hero_rank,
+            better=better,
+            ties=ties,
+            worse=total - better - ties,
+            percentile=(total - better - ties * 0.5) / total if total else 1.0,
+            is_nut=(better == 0),
+            is_second_nut=second_nut
+        )
+
+    def _count_batch(self, hole: List[int], board: List[int], hero_rank: int):
+        """Canlı 1.000+ kombinasyon tek evaluate_batch çağrısıyla."""
+        combos, masks = HandRanker._combos
+        dead = 0
+        for c in hole + board:
+            dead |= 1 << c
+        live = combos[(masks & dead) == 0]
+        board_rows = np.broadcast_to(np.array(board, dtype=np.int64), (len(live), len(board)))
+        ranks = evaluate_batch(np.hstack([live, board_rows]))
+
+        stronger = ranks > hero_rank
+        better = int(np.count_nonzero(stronger))
+        ties = int(np.count_nonzero(ranks == hero_rank))
+        # Second nut: hero'dan güçlü tam olarak bir el değeri (rank sınıfı) var
+        second_nut = better > 0 and len(np.unique(ranks[stronger])) == 1
+        return better, ties, len(live), second_nut
+
+    def _count_scalar(self, hole: List[int], board: List[int], hero_rank: int):
+        """Saf Python yedeği."""
+        evaluate = self._lookup.evaluate
+        known = set(hole) | set(board)
+        deck = [c for c in range(NUM_CARDS) if c not in known]
+
+        better = ties = total = 0
+        stronger_ranks = set()
+        for v1, v2 in combinations(deck, 2):
+            rank = evaluate([v1, v2] + board)
+            total += 1
+            if rank > hero_rank:
+                better += 1
+                stronger_ranks.add(rank)
+            elif rank == hero_rank:
+                ties += 1
+        second_nut = len(stronger_ranks) == 1
+        return better, ties, total, second_nut
@@ -0,0 +1,594 @@
+"""
+POKER BOT V4.0 - HAND HISTORY STORE
+===================================
+Hand history'ler için sıkıştırılmış, kolon tabanlı disk deposu.
+
+Eller HISTORY_CHUNK_SIZE'lık parçalar halinde chunk_NNNNN.npz dosyalarına
+(np.savez_compressed) yazılır; her kolon bir NumPy dizisidir. Aksiyonlar
+düzleştirilmiş dizilerde tutulur, elin aksiyonları act_offsets[i]:act_offsets[i+1]
+aralığıdır. manifest.json chunk başına satır sayısını ve zaman aralığını
+ve index segmentlerini tutar; her segment (index_AAAAA_BBBBB.npz) A..B
+chunk'larının sıralı hand_key -> (chunk, satır) eşlemesidir.
+
+Her chunk tam olarak chunk_size el içerir: chunk_size'a ulaşmamış kuyruk
+bellekte tamponlanır, flush() onu pending.npz'e yazar (chunk sayısı
+session sayısıyla değil el sayısıyla büyür). Yeni chunk'ın anahtarları
+yeni bir segmente yazılır ve eşit boyuttaki segmentler birleştirilir
+(ikili sayaç); böylece tüm index her chunk'ta yeniden yazılmaz, bir
+anahtar toplamda O(log chunk) kez yazılır ve arama O(log chunk) segmente
+bakar:
+
+    store = HistoryStore("history/")
+    store.ingest("session.txt", hero="Hero")      # Tekrar eden eller atlanır
+    store.flush()                                 # Kuyruğu diske yaz
+    record = store.get("243587445678")
+    columns = store.query(start, end, columns=("net", "big_blind"))
+
+Kullanım (komut satırı):
+    python history_store.py <depo_dizini> <dosya_veya_dizin>... [--hero AD] [--workers N]
+"""
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from constants import Position, Street, ActionType, HISTORY_CHUNK_SIZE, HISTORY_MANIFEST_FILE
+from data_classes import Card, HoleCards, Board, GameState, PokerAction, HandRecord
+from hand_history import HandHistoryParser
+
+_ACTION_TYPES = list(ActionType)
+_ACTION_INDEX = {a: i for i, a in enumerate(_ACTION_TYPES)}
+
+# El başına skaler kolonlar ve dtype'ları (parasal değerler chip cinsinden)
+_HAND_COLUMNS = {
+    'hand_key': np.int64,
+    'timestamp': np.int64,
+    'small_blind': np.float32,
+    'big_blind': np.float32,
+    'players': np.int8,
+    'hero_position': np.int8,
+    'villain_position': np.int8,
+    'street': np.int8,
+    'hero_stack': np.float32,
+    'villain_stack': np.float32,
+    'pot': np.float32,
+    'rake': np.float32,
+    'net': np.float32,
+    'showdown': bool,
+    'flop_pot': np.float32,
+    'flop_stack': np.float32,
+}
+_ACTION_COLUMNS = ('act_street', 'act_type', 'act_amount', 'act_position', 'act_hero')
+_INDEX_FILE = "index_{:05d}_{:05d}.npz"
+_TAIL_FILE = "pending.npz"
+
+
+def hand_key(hand_id: str) -> int:
+    """
+    Hand id'den int64 anahtar: sayısal id'ler kendisi, diğerleri
+    (GG 'RC123...' gibi) negatif 63 bit blake2b hash'i.
+    """
+    if hand_id.isdigit() and len(hand_id) < 19:
+        return int(hand_id)
+    digest = hashlib.blake2b(hand_id.encode(), digest_size=8).digest()
+    return -1 - (int.from_bytes(digest, 'big') >> 1)
+
+
+def records_to_columns(records: Sequence[HandRecord]) -> Dict[str, np.ndarray]:
+    """HandRecord listesini chunk kolonlarına çevirir."""
+    rows = {name: [] for name in _HAND_COLUMNS}
+    hand_ids, heroes, hero_cards, boards = [], [], [], []
+    actions = {name: [] for name in _ACTION_COLUMNS}
+    offsets = [0]
+
+    for record in records:
+        state = record.state
+        rows['hand_key'].append(hand_key(state.hand_id))
+        rows['timestamp'].append(record.timestamp)
+        rows['small_blind'].append(state.small_blind)
+        rows['big_blind'].append(state.big_blind)
+        rows['players'].append(record.players)
+        rows['hero_position'].append(state.hero_position.value)
+        rows['villain_position'].append(state.villain_position.value)
+        rows['street'].append(state.street.value)
+        rows['hero_stack'].append(state.hero_stack)
+        rows['villain_stack'].append(state.villain_stack)
+        rows['pot'].append(state.pot)
+        rows['rake'].append(record.rake)
+        rows['net'].append(record.net)
+        rows['showdown'].append(record.showdown)
+        rows['flop_pot'].append(record.flop_pot)
+        rows['flop_stack'].append(record.flop_stack)
+        hand_ids.append(state.hand_id)
+        heroes.append(record.hero)
+        hero_cards.append(state.hero_hand.indices)
+        boards.append(state.board.indices + [-1] * (5 - len(state.board.indices)))
+
+        for street, street_actions in (
+            (Street.PREFLOP, state.actions_preflop), (Street.FLOP, state.actions_flop),
+            (Street.TURN, state.actions_turn), (Street.RIVER, state.actions_river)
+        ):
+            for action in street_actions:
+                position = record.positions.get(action.description)
+                actions['act_street'].append(street.value)
+                actions['act_type'].append(_ACTION_INDEX[action.action])
+                actions['act_amount'].append(action.amount)
+                actions['act_position'].append(position.value if position else -1)
+                actions['act_hero'].append(action.description == record.hero)
+        offsets.append(len(actions['act_street']))
+
+    columns = {name: np.array(values, dtype=_HAND_COLUMNS[name]) for name, values in rows.items()}
+    columns['hand_id'] = np.array(hand_ids, dtype=str)
+    columns['hero'] = np.array(heroes, dtype=str)
+    columns['hero_cards'] = np.array(hero_cards, dtype=np.int8).reshape(-1, 2)
+    columns['board'] = np.array(boards, dtype=np.int8).reshape(-1, 5)
+    columns['act_offsets'] = np.array(offsets, dtype=np.int64)
+    columns['act_street'] = np.array(actions['act_street'], dtype=np.int8)
+    columns['act_type'] = np.array(actions['act_type'], dtype=np.int8)
+    columns['act_amount'] = np.array(actions['act_amount'], dtype=np.float32)
+    columns['act_position'] = np.array(actions['act_position'], dtype=np.int8)
+    columns['act_hero'] = np.array(actions['act_hero'], dtype=bool)
+    return columns
+
+
+def column_record(columns: Dict[str, np.ndarray], row: int) -> HandRecord:
+    """
+    Chunk satırından HandRecord. Oyuncu adları saklanmadığından rakip
+    aksiyonlarının description'ı pozisyon adıdır (örn. 'BB').
+    """
+    hero = str(columns['hero'][row])
+    hero_position = Position(int(columns['hero_position'][row]))
+    positions = {hero: hero_position}
+    street_actions: Dict[Street, List[PokerAction]] = {s: [] for s in Street}
+    start, end = columns['act_offsets'][row], columns['act_offsets'][row + 1]
+    for i in range(start, end):
+        if columns['act_hero'][i]:
+            actor = hero
+        else:
+            position = int(columns['act_position'][i])
+            actor = Position(position).name if position >= 0 else ""
+            if position >= 0:
+                positions[actor] = Position(position)
+        street_actions[Street(int(columns['act_street'][i]))].append(PokerAction(
+            _ACTION_TYPES[columns['act_type'][i]], round(float(columns['act_amount'][i]), 2), actor
+        ))
+
+    street = Street(int(columns['street'][row]))
+    cards = [int(c) for c in columns['hero_cards'][row]]
+    state = GameState(
+        hand_id=str(columns['hand_id'][row]),
+        street=street,
+        hero_hand=HoleCards(Card.from_index(cards[0]), Card.from_index(cards[1])),
+        board=Board([Card.from_index(int(c)) for c in columns['board'][row] if c >= 0]),
+        hero_position=hero_position,
+        villain_position=Position(int(columns['villain_position'][row])),
+        hero_stack=_money(columns['hero_stack'][row]),
+        villain_stack=_money(columns['villain_stack'][row]),
+        pot=_money(columns['pot'][row]),
+        actions_this_street=list(street_actions[street]),
+        actions_preflop=street_actions[Street.PREFLOP],
+        actions_flop=street_actions[Street.FLOP],
+        actions_turn=street_actions[Street.TURN],
+        actions_river=street_actions[Street.RIVER],
+        small_blind=_money(columns['small_blind'][row]),
+        big_blind=_money(columns['big_blind'][row])
+    )
+    return HandRecord(
+        state=state,
+        timestamp=int(columns['timestamp'][row]),
+        hero=hero,
+        players=int(columns['players'][row]),
+        net=_money(columns['net'][row]),
+        rake=_money(columns['rake'][row]),
+        showdown=bool(columns['showdown'][row]),
+        flop_pot=_money(columns['flop_pot'][row]),
+        flop_stack=_money(columns['flop_stack'][row]),
+        positions=positions
+    )
+
+
+def take_rows(columns: Dict[str, np.ndarray], rows: np.ndarray) -> Dict[str, np.ndarray]:
+    """Seçilen satırların kolonları (aksiyon dizileri ve offset'ler dahil)."""
+    offsets = columns['act_offsets']
+    starts = offsets[rows]
+    lengths = offsets[rows + 1] - starts
+    ends = np.cumsum(lengths)
+    actions = np.repeat(starts - (ends - lengths), lengths) + np.arange(int(ends[-1]) if len(ends) else 0)
+    result = {
+        name: column[actions] if name in _ACTION_COLUMNS else column[rows]
+        for name, column in columns.items() if name != 'act_offsets'
+    }
+    result['act_offsets'] = np.concatenate([[0], ends]).astype(np.int64)
+    return result
+
+
+def concat_columns(blocks: Sequence[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Kolon bloklarını uç uca ekler (aksiyon offset'leri kaydırılır)."""
+    result = {
+        name: np.concatenate([block[name] for block in blocks])
+        for name in blocks[0] if name != 'act_offsets'
+    }
+    offsets, base = [], 0
+    for block in blocks:
+        offsets.append(block['act_offsets'][:-1] + base)
+        base += int(block['act_offsets'][-1])
+    result['act_offsets'] = np.concatenate(offsets + [np.array([base], dtype=np.int64)])
+    return result
+
+
+def parse_columns(task: Tuple[str, Optional[str], int]) -> Tuple[List[Dict[str, np.ndarray]], int]:
+    """
+    Worker görevi: bir dosyayı parse edip batch'ler halinde kolonlara çevirir.
+
+    Args:
+        task: (dosya yolu, hero adı, batch boyutu)
+
+    Returns:
+        (kolon blokları, atlanan el sayısı)
+    """
+    path, hero, batch_size = task
+    parser = HandHistoryParser(hero)
+    blocks, batch = [], []
+    for record in parser.parse_file(path):
+        batch.append(record)
+        if len(batch) >= batch_size:
+            blocks.append(records_to_columns(batch))
+            batch = []
+    if batch:
+        blocks.append(records_to_columns(batch))
+    return blocks, parser.skipped
+
+
+def _money(value) -> float:
+    """float32 kolon değerini cent hassasiyetine yuvarlar."""
+    return round(float(value), 2)
+
+
+class HistoryStore:
+    """
+    Ekleme odaklı (append-only) chunk'lı el deposu.
+
+    Yeni eller kolon blokları halinde bellekte tamponlanır; tampon
+    chunk_size'a ulaştıkça tam chunk'lar yazılır. flush() kuyruğu chunk
+    yazmadan pending.npz'e kaydeder, depo yeniden açılınca tampona yüklenir.
+    Chunk'lar bir kez yazıldıktan sonra değişmez; artımlı analizler sadece
+    yeni chunk indekslerini okur, kuyruk için tail() kullanılır.
+    """
+
+    def __init__(self, path: str, chunk_size: int = HISTORY_CHUNK_SIZE):
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size pozitif olmalı: {chunk_size}")
+        self.path = path
+        self.chunk_size = chunk_size
+        os.makedirs(path, exist_ok=True)
+
+        manifest = os.path.join(path, HISTORY_MANIFEST_FILE)
+        self.manifest: List[dict] = []
+        self.index: List[dict] = []  # Segmentler: {file, first, last} (chunk aralığı)
+        if os.path.exists(manifest):
+            with open(manifest) as f:
+                data = json.load(f)
+            self.manifest = data['chunks']
+            self.index = data['index']
+
+        # Segment başına sıralı anahtarlar ve (chunk, satır) konumları
+        self._segments: List[Tuple[np.ndarray, np.ndarray]] = []
+        for info in self.index:
+            with np.load(os.path.join(path, info['file'])) as segment:
+                self._segments.append((segment['keys'], segment['locations']))
+
+        self._pending: List[Dict[str, np.ndarray]] = []
+        self._cached: Tuple[Optional[int], Optional[Dict[str, np.ndarray]]] = (None, None)
+        self.duplicates = 0
+        self.skipped = 0
+
+        tail = os.path.join(path, _TAIL_FILE)
+        if os.path.exists(tail):
+            with np.load(tail) as data:
+                columns = {name: data[name] for name in data.files}
+            # Chunk yazıldıktan sonra kesilen bir flush'tan kalan satırlar atlanır
+            rows = np.flatnonzero(~self._indexed(columns['hand_key']))
+            if len(rows):
+                self._pending.append(take_rows(columns, rows))
+
+    def __len__(self) -> int:
+        return sum(info['rows'] for info in self.manifest) + self._pending_rows()
+
+    def __contains__(self, hand_id: str) -> bool:
+        return self.get(hand_id) is not None
+
+    def ingest(
+        self,
+        source: Union[str, Sequence[str], Iterable[str]],
+        hero: Optional[str] = None,
+        workers: int = 1
+    ) -> int:
+        """
+        Dosya(lar), dizin (içindeki .txt dosyaları) veya satır akışını
+        parse edip depoya ekler. Dolan chunk'lar diske yazılır; kalan
+        kuyruk tamponda kalır (kalıcı olması için flush()).
+
+        Args:
+            source: Dosya / dizin yolu, yol listesi veya satır akışı
+                (açık dosya, generator)
+            hero: Hero'nun adı (None = 'Dealt to' satırındaki oyuncu)
+            workers: Dosyaları paralel parse eden süreç sayısı; chunk
+                içeriği worker sayısından bağımsızdır
+
+        Returns:
+            Eklenen yeni el sayısı (tekrar eden ve bozuk eller hariç)
+        """
+        if isinstance(source, (str, list, tuple)):
+            tasks = [(path, hero, self.chunk_size) for path in _history_files(source)]
+            if workers > 1 and len(tasks) > 1:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(parse_columns, tasks))
+            else:
+                results = map(parse_columns, tasks)
+            added = 0
+            for blocks, skipped in results:
+                self.skipped += skipped
+                for block in blocks:
+                    added += self.add_columns(block)
+        else:
+            parser = HandHistoryParser(hero)
+            added = self.append(parser.parse(source))
+            self.skipped += parser.skipped
+        return added
+
+    def append(self, records: Iterable[HandRecord]) -> int:
+        """Elleri tampona ekler (depoda veya tamponda olanlar atlanır)."""
+        added, batch = 0, []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= self.chunk_size:
+                added += self.add_columns(records_to_columns(batch))
+                batch = []
+        if batch:
+            added += self.add_columns(records_to_columns(batch))
+        return added
+
+    def add_columns(self, columns: Dict[str, np.ndarray]) -> int:
+        """
+        Kolon bloğunu tekrarları ayıklayarak tampona ekler; tampon
+        chunk_size'ı geçtikçe chunk'lar yazılır.
+        """
+        keys = columns['hand_key']
+        keep = np.zeros(len(keys), dtype=bool)
+        keep[np.unique(keys, return_index=True)[1]] = True
+        keep &= ~self._indexed(keys)
+        if self._pending:
+            keep &= ~np.isin(keys, np.concatenate([b['hand_key'] for b in self._pending]))
+        rows = np.flatnonzero(keep)
+        self.duplicates += len(keys) - len(rows)
+        if len(rows):
+            self._pending.append(columns if len(rows) == len(keys) else take_rows(columns, rows))
+
+        written = False
+        while self._pending_rows() >= self.chunk_size:
+            merged = concat_columns(self._pending)
+            total = len(merged['hand_key'])
+            self._write_chunk(take_rows(merged, np.arange(self.chunk_size)))
+            self._pending = [take_rows(merged, np.arange(self.chunk_size, total))] if total > self.chunk_size else []
+            written = True
+        # Daha önce flush edilmiş kuyruk artık chunk'ta: pending.npz güncellenir
+        if written and os.path.exists(os.path.join(self.path, _TAIL_FILE)):
+            self.flush()
+        return len(rows)
+
+    def flush(self) -> None:
+        """
+        Tampondaki kuyruğu pending.npz'e yazar (chunk oluşturmaz; boyutu
+        chunk_size ile sınırlıdır). Tampon boşsa dosya silinir.
+        """
+        tail = os.path.join(self.path, _TAIL_FILE)
+        if self._pending:
+            self._pending = [concat_columns(self._pending)]
+            self._atomic(_TAIL_FILE, lambda f: np.savez(f, **self._pending[0]))
+        elif os.path.exists(tail):
+            os.remove(tail)
+
+    def tail(self, columns: Optional[Sequence[str]] = None) -> Optional[Dict[str, np.ndarray]]:
+        """Henüz chunk'a yazılmamış ellerin kolonları (tampon boşsa None)."""
+        if not self._pending:
+            return None
+        self._pending = [concat_columns(self._pending)]
+        if columns is None:
+            return self._pending[0]
+        return {name: self._pending[0][name] for name in columns}
+
+    def get(self, hand_id: str) -> Optional[HandRecord]:
+        """Hand id ile tek el (yoksa None)."""
+        key = hand_key(hand_id)
+        location = self._find(key)
+        if location is not None:
+            chunk, row = location
+            return column_record(self.load_chunk(chunk), row)
+        for block in self._pending:
+            rows = np.flatnonzero(block['hand_key'] == key)
+            if len(rows):
+                return column_record(block, int(rows[0]))
+        return None
+
+    def load_chunk(self, chunk: int) -> Dict[str, np.ndarray]:
+        """Chunk'ın tüm kolonları (son okunan chunk bellekte tutulur)."""
+        if self._cached[0] != chunk:
+            with np.load(os.path.join(self.path, self.manifest[chunk]['file'])) as data:
+                self._cached = (chunk, {name: data[name] for name in data.files})
+        return self._cached[1]
+
+    def chunks(
+        self, start: int = 0, columns: Optional[Sequence[str]] = None
+    ) -> Iterator[Tuple[int, Dict[str, np.ndarray]]]:
+        """
+        start indeksinden itibaren (chunk indeksi, kolonlar) çiftleri.
+        columns verilirse sadece o kolonlar açılır.
+        """
+        for chunk in range(start, len(self.manifest)):
+            if columns is None:
+                yield chunk, self.load_chunk(chunk)
+                continue
+            with np.load(os.path.join(self.path, self.manifest[chunk]['file'])) as data:
+                yield chunk, {name: data[name] for name in columns}
+
+    def query(
+        self,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        columns: Sequence[str] = ('hand_id', 'timestamp', 'net', 'big_blind')
+    ) -> Dict[str, np.ndarray]:
+        """
+        Zaman aralığındaki (Unix saniye, uçlar dahil, None = sınırsız)
+        ellerin el başına kolonları. Aralık dışındaki chunk'lar manifest'teki
+        ts_min / ts_max ile hiç okunmaz; tampondaki kuyruk da dahildir.
+        """
+        if any(name.startswith('act_') for name in columns):
+            raise ValueError("query sadece el başına kolonları döndürür; aksiyonlar için chunks() kullanın")
+        low = -np.inf if start is None else start
+        high = np.inf if end is None else end
+        parts: Dict[str, List[np.ndarray]] = {name: [] for name in columns}
+        for info in self.manifest:
+            if info['ts_max'] < low or info['ts_min'] > high:
+                continue
+            with np.load(os.path.join(self.path, info['file'])) as data:
+                timestamps = data['timestamp']
+                selected = (timestamps >= low) & (timestamps <= high)
+                for name in columns:
+                    column = timestamps if name == 'timestamp' else data[name]
+                    parts[name].append(column[selected])
+        tail = self.tail(columns)
+        if tail is not None:
+            timestamps = self._pending[0]['timestamp']
+            selected = (timestamps >= low) & (timestamps <= high)
+            for name in columns:
+                parts[name].append(tail[name][selected])
+        return {
+            name: np.concatenate(values) if values else np.zeros(0, dtype=_HAND_COLUMNS.get(name, str))
+            for name, values in parts.items()
+        }
+
+    def get_stats(self) -> dict:
+        return {
+            "hands": len(self),
+            "chunks": len(self.manifest),
+            "index_segments": len(self.index),
+            "pending": self._pending_rows(),
+            "duplicates": self.duplicates,
+            "skipped": self.skipped,
+            "bytes": sum(
+                os.path.getsize(os.path.join(self.path, info['file'])) for info in self.manifest
+            ),
+        }
+
+    def _pending_rows(self) -> int:
+        return sum(len(block['hand_key']) for block in self._pending)
+
+    def _indexed(self, keys: np.ndarray) -> np.ndarray:
+        """Anahtar başına: yazılmış bir chunk'ta mı?"""
+        found = np.zeros(len(keys), dtype=bool)
+        for segment_keys, _ in self._segments:
+            found |= np.isin(keys, segment_keys)
+        return found
+
+    def _find(self, key: int) -> Optional[Tuple[int, int]]:
+        for keys, locations in self._segments:
+            i = int(np.searchsorted(keys, key))
+            if i < len(keys) and keys[i] == key:
+                return int(locations[i, 0]), int(locations[i, 1])
+        return None
+
+    def _write_chunk(self, columns: Dict[str, np.ndarray]) -> None:
+        """
+        Chunk + index segmenti + manifest yazar (her dosya önce geçici adla).
+        Manifest yazılmadan önce kesilirse yeni dosyalar sahipsiz kalır,
+        depo önceki haliyle açılır.
+        """
+        chunk = len(self.manifest)
+        name = f"chunk_{chunk:05d}.npz"
+        self._atomic(name, lambda f: np.savez_compressed(f, **columns))
+
+        timestamps = columns['timestamp']
+        self.manifest.append({
+            'file': name,
+            'rows': len(timestamps),
+            'ts_min': int(timestamps.min()),
+            'ts_max': int(timestamps.max()),
+        })
+
+        # Yeni segment; son segment bundan büyük olana kadar birleştirilir
+        keys = columns['hand_key']
+        locations = np.column_stack([
+            np.full(len(keys), chunk, dtype=np.int32), np.arange(len(keys), dtype=np.int32)
+        ])
+        first, obsolete = chunk, []
+        while self._segments and len(self._segments[-1][0]) <= len(keys):
+            old_keys, old_locations = self._segments.pop()
+            info = self.index.pop()
+            obsolete.append(info['file'])
+            first = info['first']
+            keys = np.concatenate([old_keys, keys])
+            locations = np.concatenate([old_locations, locations])
+        order = np.argsort(keys, kind='stable')
+        keys, locations = keys[order], locations[order]
+        segment = _INDEX_FILE.format(first, chunk)
+        self._atomic(segment, lambda f: np.savez(f, keys=keys, locations=locations))
+        self._segments.append((keys, locations))
+        self.index.append({'file': segment, 'first': first, 'last': chunk})
+
+        self._atomic(
+            HISTORY_MANIFEST_FILE,
+            lambda f: f.write(json.dumps({'chunks': self.manifest, 'index': self.index}, indent=1).encode())
+        )
+        for old in obsolete:
+            os.remove(os.path.join(self.path, old))
+        self._cached = (chunk, columns)
+
+    def _atomic(self, name: str, write) -> None:
+        target = os.path.join(self.path, name)
+        with open(target + ".tmp", 'wb') as f:
+            write(f)
+        os.replace(target + ".tmp", target)
+
+
+def _history_files(source: Union[str, Sequence[str]]) -> List[str]:
+    """Yol(lar)dan hand history dosyaları; dizinlerde .txt dosyaları sıralı."""
+    paths = []
+    for path in [source] if isinstance(source, str) else source:
+        if os.path.isdir(path):
+            paths.extend(sorted(
+                os.path.join(path, name) for name in os.listdir(path)
+                if name.lower().endswith('.txt')
+            ))
+        else:
+            paths.append(path)
+    return paths
+
+
+if __name__ == "__main__":
+    import sys
+
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    hero = None
+    if "--hero" in sys.argv:
+        hero = sys.argv[sys.argv.index("--hero") + 1]
+        args.remove(hero)
+    workers = os.cpu_count() or 1
+    if "--workers" in sys.argv:
+        workers = int(sys.argv[sys.argv.index("--workers") + 1])
+        args.remove(str(workers))
+    if len(args) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    store = HistoryStore(args[0])
+    start = time.time()
+    added = store.ingest(args[1:], hero=hero, workers=workers)
+    store.flush()
+    elapsed = time.time() - start
+    print(f"{added} yeni el, {elapsed:.1f}s ({added / max(elapsed, 1e-9):.0f} el/s)")
+    print(store.get_stats())
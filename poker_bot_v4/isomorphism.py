@@ -0,0 +1,105 @@
+"""
+POKER BOT V4.0 - SUIT ISOMORPHISM
+=================================
+Suit permütasyonuyla birbirine dönüşen (el, board) çiftlerini tek bir
+kanonik forma indirger. 22.100 flop 1.755 kanonik flopa iner; cache'ler,
+önceden hesaplanmış tablolar ve equity veritabanları bu form ile anahtarlanır.
+
+Kanonik form: her suit için (board rank maskesi, el rank maskesi) imzası
+hesaplanır, suit'ler imzaya göre büyükten küçüğe sıralanıp 0, 1, 2, 3
+(c, d, h, s) olarak yeniden adlandırılır. İmzası aynı suit'ler zaten
+birbirinin yerine geçebildiği için sonuç tektir.
+"""
+
+from typing import List, Sequence, Tuple
+
+from constants import SUITS, SUIT_INDEX
+
+# perm[orijinal_suit] = kanonik_suit
+SuitPermutation = Tuple[int, int, int, int]
+IDENTITY: SuitPermutation = (0, 1, 2, 3)
+
+
+def suit_permutation(hole: Sequence[int], board: Sequence[int]) -> SuitPermutation:
+    """(el, board) için kanonik forma götüren suit permütasyonu."""
+    board_masks = [0, 0, 0, 0]
+    hole_masks = [0, 0, 0, 0]
+    for c in board:
+        board_masks[c & 3] |= 1 << (c >> 2)
+    for c in hole:
+        hole_masks[c & 3] |= 1 << (c >> 2)
+
+    order = sorted(range(4), key=lambda s: (board_masks[s], hole_masks[s]), reverse=True)
+    perm = [0, 0, 0, 0]
+    for canonical, suit in enumerate(order):
+        perm[suit] = canonical
+    return tuple(perm)
+
+
+def apply_permutation(cards: Sequence[int], perm: SuitPermutation) -> Tuple[int, ...]:
+    """Kartların suit'lerini permütasyona göre değiştirir (sıra korunur)."""
+    return tuple((c & ~3) | perm[c & 3] for c in cards)
+
+
+def inverse_permutation(perm: SuitPermutation) -> SuitPermutation:
+    """Kanonik suit -> orijinal suit."""
+    inverse = [0, 0, 0, 0]
+    for suit, canonical in enumerate(perm):
+        inverse[canonical] = suit
+    return tuple(inverse)
+
+
+def map_suit(suit: str, perm: SuitPermutation) -> str:
+    """Suit karakterini ('h' gibi) permütasyonla eşler."""
+    return SUITS[perm[SUIT_INDEX[suit]]]
+
+
+def canonicalize(
+    hole: Sequence[int], board: Sequence[int]
+) -> Tuple[Tuple[int, ...], Tuple[int, ...], SuitPermutation]:
+    """
+    (el, board) çiftinin kanonik formu.
+
+    Returns:
+        (kanonik el, kanonik board, uygulanan permütasyon); el ve board
+        kartları büyükten küçüğe sıralıdır
+    """
+    perm = suit_permutation(hole, board)
+    return (
+        tuple(sorted(apply_permutation(hole, perm), reverse=True)),
+        tuple(sorted(apply_permutation(board, perm), reverse=True)),
+        perm
+    )
+
+
+def canonical_board(board: Sequence[int]) -> Tuple[Tuple[int, ...], SuitPermutation]:
+    """Sadece board'un kanonik formu ve permütasyonu."""
+    _, canonical, perm = canonicalize((), board)
+    return canonical, perm
+
+
+def canonical_key(hole: Sequence[int], board: Sequence[int]) -> int:
+    """
+    Kanonik formun tek tam sayılık anahtarı (cache / tablo indeksi için).
+    El ve board ayrı 52 bitlik maskelerde tutulur.
+    """
+    canonical_hole, canonical, _ = canonicalize(hole, board)
+    key = 0
+    for c in canonical:
+        key |= 1 << c
+    for c in canonical_hole:
+        key |= 1 << (c + 52)
+    return key
+
+
+def canonical_boards(num_cards: int) -> List[Tuple[int, ...]]:
+    """
+    Verilen uzunluktaki tüm kanonik board'lar (3 = 1.755 flop).
+    Sıralı ve tekrarsızdır.
+    """
+    from itertools import combinations
+
+    seen = set()
+    for board in combinations(range(52), num_cards):
+        seen.add(canonical_board(board)[0])
+    return sorted(seen)
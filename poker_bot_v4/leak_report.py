@@ -0,0 +1,279 @@
+"""
+POKER BOT V4.0 - LEAK REPORT
+============================
+Hand history deposu üzerinde hero'nun kazanç dağılımı: pozisyon, flop
+texture (BoardTexture), flop başındaki SPR aralığı ve oynanan line başına
+bb/100, standart hata ve showdown / showdown'suz ayrımı.
+
+Her grup için toplamlar (el, net, net², showdown eli, showdown net'i)
+toplanabilir olduğundan rapor artımlıdır: işlenen chunk'ların toplamları
+depo dizinindeki leak_report.npz dosyasında tutulur, update() sadece yeni
+chunk'ları okur. Henüz chunk'a yazılmamış kuyruk (HistoryStore.tail())
+her raporda ayrıca eklenir, kaydedilmez. Chunk başına gruplama np.unique +
+bincount ile vektörizedir.
+
+    analyzer = LeakAnalyzer(HistoryStore("history/"))
+    analyzer.update()               # Yeni session'lar ingest edildikten sonra
+    print(analyzer.report(min_hands=500))
+
+Kullanım (komut satırı):
+    python leak_report.py <depo_dizini> [min_el]
+"""
+
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from constants import (
+    Position, Street, ActionType, BoardTexture,
+    SPR_SHALLOW, SPR_MEDIUM, SPR_DEEP, LEAK_REPORT_FILE, LEAK_LINE_MAX_ACTIONS
+)
+from data_classes import LeakStat, LeakReport
+from hand_evaluator import BoardAnalyzer
+from history_store import HistoryStore
+
+DIMENSIONS = ('position', 'texture', 'spr', 'line')
+
+# Chunk'tan okunan kolonlar
+_COLUMNS = (
+    'hero_position', 'street', 'board', 'net', 'big_blind', 'showdown',
+    'flop_pot', 'flop_stack', 'act_offsets', 'act_street', 'act_type', 'act_hero'
+)
+
+# Toplam vektörü: el, net (bb), net², showdown eli, showdown net'i (bb)
+_NUM_SUMS = 5
+
+_SPR_EDGES = np.array([SPR_SHALLOW, SPR_MEDIUM, SPR_DEEP])
+SPR_LABELS = (
+    f"SPR < {SPR_SHALLOW:g}", f"SPR {SPR_SHALLOW:g}-{SPR_MEDIUM:g}",
+    f"SPR {SPR_MEDIUM:g}-{SPR_DEEP:g}", f"SPR {SPR_DEEP:g}+"
+)
+
+# Line anahtarı: hero aksiyonları sırayla, token = sokak * 6 + aksiyon + 1
+# (1..24), 25 tabanında; ilk aksiyon en düşük basamak
+_LINE_CODES = {
+    ActionType.FOLD: 'F', ActionType.CHECK: 'X', ActionType.CALL: 'C',
+    ActionType.BET: 'B', ActionType.RAISE: 'R', ActionType.ALL_IN: 'A'
+}
+_ACTION_LETTERS = [_LINE_CODES[a] for a in ActionType]
+_STREET_LABELS = {Street.PREFLOP: 'PF', Street.FLOP: 'F', Street.TURN: 'T', Street.RIVER: 'R'}
+_LINE_BASE = 4 * len(_ACTION_LETTERS) + 1
+_LINE_POWERS = _LINE_BASE ** np.arange(LEAK_LINE_MAX_ACTIONS, dtype=np.int64)
+
+
+def line_keys(columns: Dict[str, np.ndarray]) -> np.ndarray:
+    """El başına hero line anahtarı (hero'nun aksiyonu yoksa 0)."""
+    offsets = columns['act_offsets']
+    hands = len(offsets) - 1
+    owner = np.repeat(np.arange(hands), np.diff(offsets))
+    hero = columns['act_hero']
+    owner = owner[hero]
+    tokens = (
+        (columns['act_street'][hero].astype(np.int64) - 1) * len(_ACTION_LETTERS)
+        + columns['act_type'][hero] + 1
+    )
+    counts = np.bincount(owner, minlength=hands)
+    order = np.arange(len(owner)) - (np.cumsum(counts) - counts)[owner]
+    kept = order < LEAK_LINE_MAX_ACTIONS
+    values = tokens[kept] * _LINE_POWERS[order[kept]]
+
+    kept_counts = np.minimum(counts, LEAK_LINE_MAX_ACTIONS)
+    acting = np.flatnonzero(kept_counts)
+    keys = np.zeros(hands, dtype=np.int64)
+    if len(acting):
+        keys[acting] = np.add.reduceat(values, (np.cumsum(kept_counts) - kept_counts)[acting])
+    return keys
+
+
+def line_label(key: int) -> str:
+    """Line anahtarından okunur etiket, örn. 'PF:R F:B T:XC'."""
+    if key == 0:
+        return "(aksiyon yok)"
+    parts: List[Tuple[Street, str]] = []
+    while key:
+        key, token = divmod(key, _LINE_BASE)
+        street = Street((token - 1) // len(_ACTION_LETTERS) + 1)
+        letter = _ACTION_LETTERS[(token - 1) % len(_ACTION_LETTERS)]
+        if parts and parts[-1][0] == street:
+            parts[-1] = (street, parts[-1][1] + letter)
+        else:
+            parts.append((street, letter))
+    return " ".join(f"{_STREET_LABELS[street]}:{letters}" for street, letters in parts)
+
+
+def _group(keys: np.ndarray, sums: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Anahtara göre toplamlar: (benzersiz anahtarlar, (k, _NUM_SUMS) toplamlar)."""
+    unique, inverse = np.unique(keys, return_inverse=True)
+    grouped = np.column_stack([
+        np.bincount(inverse, weights=sums[:, j], minlength=len(unique)) for j in range(sums.shape[1])
+    ]) if len(unique) else np.zeros((0, sums.shape[1]))
+    return unique, grouped
+
+
+def _merge(groups: Dict[str, Tuple[np.ndarray, np.ndarray]],
+           new: Dict[str, Tuple[np.ndarray, np.ndarray]]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """Boyut başına iki grup toplamını birleştirir."""
+    merged = {}
+    for dim, (keys, sums) in new.items():
+        old_keys, old_sums = groups[dim]
+        merged[dim] = _group(np.concatenate([old_keys, keys]), np.concatenate([old_sums, sums]))
+    return merged
+
+
+def _stat(label: str, sums: np.ndarray) -> LeakStat:
+    hands, net, net_sq, showdowns, showdown_net = sums
+    n = max(int(round(hands)), 1)
+    mean = net / n
+    std_dev = np.sqrt(max(0.0, net_sq / n - mean * mean) * n / max(n - 1, 1))
+    return LeakStat(
+        label=label,
+        hands=int(round(hands)),
+        bb_per_100=float(100 * mean),
+        std_error=float(100 * std_dev / np.sqrt(n)),
+        showdown_hands=int(round(showdowns)),
+        showdown_bb_per_100=float(100 * showdown_net / n),
+        non_showdown_bb_per_100=float(100 * (net - showdown_net) / n)
+    )
+
+
+class LeakAnalyzer:
+    """
+    HistoryStore üzerinde artımlı leak raporu.
+
+    Durum (işlenen chunk'ların satır sayıları + grup toplamları) depo
+    dizinine yazılır; depo yeniden oluşturulmuşsa (chunk satırları
+    uyuşmazsa) toplamlar sıfırdan hesaplanır. Deponun tamponundaki eller
+    sadece rapora katılır.
+    """
+
+    def __init__(self, store: HistoryStore, path: Optional[str] = None):
+        self.store = store
+        self.path = path or os.path.join(store.path, LEAK_REPORT_FILE)
+        self.board_analyzer = BoardAnalyzer()
+        self._textures: Dict[int, int] = {}  # Flop kart maskesi -> BoardTexture değeri
+        self._reset()
+        if os.path.exists(self.path):
+            with np.load(self.path) as data:
+                rows = [info['rows'] for info in store.manifest]
+                processed = data['chunk_rows'].tolist()
+                if rows[:len(processed)] == processed:
+                    self.chunk_rows = processed
+                    self.groups = {
+                        dim: (data[f'{dim}_keys'], data[f'{dim}_sums']) for dim in DIMENSIONS
+                    }
+
+    def _reset(self) -> None:
+        self.chunk_rows: List[int] = []
+        self.groups: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+            dim: (np.zeros(0, dtype=np.int64), np.zeros((0, _NUM_SUMS))) for dim in DIMENSIONS
+        }
+
+    def update(self) -> int:
+        """
+        İşlenmemiş chunk'ları toplamlara ekler ve durumu kaydeder
+        (depo tamponundaki eller chunk'a yazılana kadar işlenmez).
+
+        Returns:
+            İşlenen yeni el sayısı
+        """
+        start = len(self.chunk_rows)
+        added = 0
+        for _, columns in self.store.chunks(start, columns=_COLUMNS):
+            self.groups = _merge(self.groups, self.chunk_groups(columns))
+            self.chunk_rows.append(len(columns['net']))
+            added += len(columns['net'])
+        if added:
+            self._save()
+        return added
+
+    def chunk_groups(self, columns: Dict[str, np.ndarray]) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """Tek chunk'ın boyut başına grup toplamları."""
+        net = columns['net'].astype(np.float64) / columns['big_blind']
+        showdown = columns['showdown'].astype(np.float64)
+        sums = np.column_stack([np.ones_like(net), net, net * net, showdown, showdown * net])
+
+        flop = columns['street'] >= Street.FLOP.value
+        with np.errstate(divide='ignore', invalid='ignore'):
+            spr = columns['flop_stack'][flop] / columns['flop_pot'][flop]
+        return {
+            'position': _group(columns['hero_position'].astype(np.int64), sums),
+            'texture': _group(self._flop_textures(columns['board'][flop]), sums[flop]),
+            'spr': _group(np.digitize(spr, _SPR_EDGES).astype(np.int64), sums[flop]),
+            'line': _group(line_keys(columns), sums),
+        }
+
+    def report(self, min_hands: int = 0, update: bool = True) -> LeakReport:
+        """
+        Güncel toplamlardan rapor (depo tamponundaki eller dahil).
+
+        Args:
+            min_hands: Bundan az elli gruplar atlanır
+            update: Önce yeni chunk'ları işle
+        """
+        if update:
+            self.update()
+        groups = self.groups
+        tail = self.store.tail(_COLUMNS)
+        if tail is not None:
+            groups = _merge(groups, self.chunk_groups(tail))
+        _, sums = groups['position']
+
+        def stats(dim: str, label) -> List[LeakStat]:
+            dim_keys, dim_sums = groups[dim]
+            return [
+                _stat(label(int(k)), s) for k, s in zip(dim_keys, dim_sums) if s[0] >= max(min_hands, 1)
+            ]
+
+        by_line = stats('line', line_label)
+        by_line.sort(key=lambda s: -s.hands)
+        return LeakReport(
+            total=_stat("Toplam", sums.sum(axis=0) if len(sums) else np.zeros(_NUM_SUMS)),
+            by_position=stats('position', lambda k: Position(k).name),
+            by_texture=stats('texture', lambda k: BoardTexture(k).name),
+            by_spr=stats('spr', lambda k: SPR_LABELS[k]),
+            by_line=by_line
+        )
+
+    def get_stats(self) -> dict:
+        return {
+            "chunks": len(self.chunk_rows),
+            "hands": sum(self.chunk_rows),
+            "lines": len(self.groups['line'][0]),
+            "flops": len(self._textures),
+        }
+
+    def _flop_textures(self, boards: np.ndarray) -> np.ndarray:
+        """Flop başına BoardTexture değeri; her benzersiz flop bir kez analiz edilir."""
+        flops = boards[:, :3].astype(np.int64)
+        masks = (np.int64(1) << flops).sum(axis=1)
+        unique, first, inverse = np.unique(masks, return_index=True, return_inverse=True)
+        for mask, row in zip(unique.tolist(), first):
+            if mask not in self._textures:
+                cards = [int(c) for c in flops[row]]
+                self._textures[mask] = self.board_analyzer.analyze_cards(cards).texture.value
+        values = np.array([self._textures[m] for m in unique.tolist()], dtype=np.int64)
+        return values[inverse]
+
+    def _save(self) -> None:
+        arrays = {'chunk_rows': np.array(self.chunk_rows, dtype=np.int64)}
+        for dim, (keys, sums) in self.groups.items():
+            arrays[f'{dim}_keys'] = keys
+            arrays[f'{dim}_sums'] = sums
+        with open(self.path + ".tmp", 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(self.path + ".tmp", self.path)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    analyzer = LeakAnalyzer(HistoryStore(sys.argv[1]))
+    start = time.time()
+    added = analyzer.update()
+    print(f"{added} yeni el işlendi, {time.time() - start:.2f}s")
+    print(analyzer.report(min_hands=int(sys.argv[2]) if len(sys.argv) > 2 else 0, update=False))
@@ -0,0 +1,287 @@
+"""
+POKER BOT V4.0 - LOOKUP EVALUATOR
+=================================
+Tablo tabanlı 5-7 kart el değerlendirici.
+Tablolar bir kez oluşturulur; her el tek bir tablo erişimiyle
+karşılaştırılabilir bir tam sayıya (1 = en zayıf, 7462 = Royal Flush) iner.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
+
+from constants import RANKS, NUM_CARDS, HandCategory
+
+# Kart indeksi: rank_index * 4 + suit_index (0-51), bkz. Card.index
+
+NUM_EQUIVALENCE_CLASSES = 7462
+
+# Rank anahtarı: her rank için 3 bit sayaç (bit 0-38)
+# Suit sayacı: her suit için 4 bit (bit 40-55), başlangıç değeri 3.
+# 5+ aynı suit kart olduğunda ilgili nibble'ın 3. biti set olur.
+_RANK_BITS = 3
+_RANK_KEY_MASK = (1 << (13 * _RANK_BITS)) - 1
+_SUIT_SHIFT = 40
+_SUIT_BASE = sum(3 << (_SUIT_SHIFT + 4 * s) for s in range(4))
+_FLUSH_BITS = sum(8 << (_SUIT_SHIFT + 4 * s) for s in range(4))
+_FLUSH_SUIT: Dict[int, int] = {8 << (_SUIT_SHIFT + 4 * s): s for s in range(4)}
+
+_CARD_KEYS: List[int] = [
+    (1 << (_RANK_BITS * (i >> 2))) + (1 << (_SUIT_SHIFT + 4 * (i & 3)))
+    for i in range(NUM_CARDS)
+]
+
+# Straight maskeleri: en yüksek kart -> 5 bitlik rank maskesi (wheel dahil)
+_STRAIGHT_MASKS: List[Tuple[int, int]] = (
+    [(top, 0b11111 << (top - 4)) for top in range(12, 3, -1)]
+    + [(3, 0b1000000001111)]  # A-2-3-4-5
+)
+
+
+def _straight_top(mask: int) -> int:
+    """Rank maskesindeki en yüksek straight'in tepe kartı (-1 = yok)."""
+    for top, smask in _STRAIGHT_MASKS:
+        if mask & smask == smask:
+            return top
+    return -1
+
+
+class LookupEvaluator:
+    """
+    Perfect-hash tablo değerlendiricisi.
+
+    Flush elleri 13 bitlik rank maskesi ile, diğerleri rank çoklu kümesi
+    anahtarıyla tek erişimde skorlanır. Tablolar sınıf seviyesinde tutulur,
+    tüm örnekler paylaşır.
+    """
+
+    _flush_ranks: Optional[List[int]] = None
+    _unsuited_ranks: Optional[Dict[int, int]] = None
+
+    def __init__(self):
+        if LookupEvaluator._flush_ranks is None:
+            LookupEvaluator._build_tables()
+        self._flush = LookupEvaluator._flush_ranks
+        self._unsuited = LookupEvaluator._unsuited_ranks
+
+    def evaluate(self, cards: Sequence[int]) -> int:
+        """
+        5-7 kart indeksini değerlendirir.
+
+        Returns:
+            1-7462 arası rank (büyük olan kazanır, eşit = split)
+        """
+        keys = _CARD_KEYS
+        key = _SUIT_BASE
+        for c in cards:
+            key += keys[c]
+
+        flush_bits = key & _FLUSH_BITS
+        if flush_bits:
+            suit = _FLUSH_SUIT[flush_bits]
+            mask = 0
+            for c in cards:
+                if c & 3 == suit:
+                    mask |= 1 << (c >> 2)
+            return self._flush[mask]
+
+        return self._unsuited[key & _RANK_KEY_MASK]
+
+    def category(self, rank: int) -> HandCategory:
+        """Rank'ın el kategorisi."""
+        return rank_category(rank)
+
+    def describe(self, rank: int) -> str:
+        """Rank'ın okunabilir açıklaması ('Pair of Ks' gibi)."""
+        return describe_rank(rank)
+
+    # --- TABLO OLUŞTURMA ---
+
+    @classmethod
+    def _build_tables(cls) -> None:
+        """Denklik sınıflarını sıralar ve lookup tablolarını doldurur."""
+        classes = _equivalence_classes()
+
+        high_card = {k: r for r, (cat, k) in enumerate(classes, 1) if cat == 'high'}
+        flush = {k: r for r, (cat, k) in enumerate(classes, 1) if cat == 'flush'}
+        straight = {k[0]: r for r, (cat, k) in enumerate(classes, 1) if cat == 'straight'}
+        straight_flush = {k[0]: r for r, (cat, k) in enumerate(classes, 1) if cat == 'sflush'}
+        ranked = {(cat, k): r for r, (cat, k) in enumerate(classes, 1)}
+
+        # Flush tablosu: 13 bitlik maske -> en iyi flush / straight flush
+        flush_ranks = [0] * 8192
+        for mask in range(8192):
+            if bin(mask).count('1') < 5:
+                continue
+            top = _straight_top(mask)
+            if top >= 0:
+                flush_ranks[mask] = straight_flush[top]
+            else:
+                bits = tuple(r for r in range(12, -1, -1) if mask >> r & 1)[:5]
+                flush_ranks[mask] = flush[bits]
+
+        # Suit'siz tablo: rank çoklu kümesi (5-7 kart) -> en iyi el
+        unsuited_ranks: Dict[int, int] = {}
+        for n in (5, 6, 7):
+            for combo in combinations_with_replacement(range(13), n):
+                counts = [0] * 13
+                for r in combo:
+                    counts[r] += 1
+                if max(counts) > 4:
+                    continue
+                key = sum(c << (_RANK_BITS * r) for r, c in enumerate(counts))
+                unsuited_ranks[key] = _best_unsuited(
+                    counts, ranked, high_card, straight
+                )
+
+        cls._flush_ranks = flush_ranks
+        cls._unsuited_ranks = unsuited_ranks
+
+
+# --- KATEGORİ VE AÇIKLAMA (rank'tan türetilir) ---
+
+_CATEGORY_NAMES: Dict[str, HandCategory] = {
+    'high': HandCategory.HIGH_CARD,
+    'pair': HandCategory.PAIR,
+    'two_pair': HandCategory.TWO_PAIR,
+    'trips': HandCategory.THREE_OF_A_KIND,
+    'straight': HandCategory.STRAIGHT,
+    'flush': HandCategory.FLUSH,
+    'full_house': HandCategory.FULL_HOUSE,
+    'quads': HandCategory.FOUR_OF_A_KIND,
+    'sflush': HandCategory.STRAIGHT_FLUSH,
+}
+
+
+@lru_cache(maxsize=1)
+def _category_starts() -> Tuple[List[int], List[HandCategory]]:
+    """Her kategorinin ilk rank'ı (bisect için)."""
+    starts: List[int] = []
+    categories: List[HandCategory] = []
+    for rank, (cat, _) in enumerate(_equivalence_classes(), 1):
+        category = _CATEGORY_NAMES[cat]
+        if not categories or categories[-1] != category:
+            starts.append(rank)
+            categories.append(category)
+    starts.append(NUM_EQUIVALENCE_CLASSES)
+    categories.append(HandCategory.ROYAL_FLUSH)
+    return starts, categories
+
+
+def rank_category(rank: int) -> HandCategory:
+    """1-7462 rank'ından el kategorisini döndürür."""
+    starts, categories = _category_starts()
+    return categories[bisect_right(starts, rank) - 1]
+
+
+@lru_cache(maxsize=None)
+def describe_rank(rank: int) -> str:
+    """1-7462 rank'ından el açıklamasını üretir (ilk istekte, sonra cache)."""
+    cat, key = _equivalence_classes()[rank - 1]
+    r = [RANKS[k] for k in key]
+
+    if rank == NUM_EQUIVALENCE_CLASSES:
+        return "Royal Flush"
+    if cat == 'sflush':
+        return f"Straight Flush, {r[0]} high"
+    if cat == 'quads':
+        return f"Quad {r[0]}s"
+    if cat == 'full_house':
+        return f"Full House, {r[0]}s full of {r[1]}s"
+    if cat == 'flush':
+        return f"Flush, {r[0]} high"
+    if cat == 'straight':
+        return f"Straight, {r[0]} high"
+    if cat == 'trips':
+        return f"Trip {r[0]}s"
+    if cat == 'two_pair':
+        return f"Two Pair, {r[0]}s and {r[1]}s"
+    if cat == 'pair':
+        return f"Pair of {r[0]}s"
+    return f"{r[0]} high"
+
+
+@lru_cache(maxsize=1)
+def _equivalence_classes() -> List[Tuple[str, Tuple[int, ...]]]:
+    """
+    7462 denklik sınıfını zayıftan güçlüye sıralı döndürür.
+    Her sınıf (kategori, tie-breaker rank indeksleri) çiftidir.
+    """
+    straight_sets = {frozenset(
+        r for r in range(13) if smask >> r & 1
+    ) for _, smask in _STRAIGHT_MASKS}
+
+    five_distinct = sorted(
+        tuple(sorted(c, reverse=True)) for c in combinations(range(13), 5)
+        if frozenset(c) not in straight_sets
+    )
+
+    def kickers(exclude: Tuple[int, ...], n: int) -> List[Tuple[int, ...]]:
+        rest = [r for r in range(13) if r not in exclude]
+        return sorted(tuple(sorted(c, reverse=True)) for c in combinations(rest, n))
+
+    classes: List[Tuple[str, Tuple[int, ...]]] = []
+    classes += [('high', k) for k in five_distinct]
+    classes += [('pair', (p,) + k) for p in range(13) for k in kickers((p,), 3)]
+    classes += [
+        ('two_pair', (hi, lo, k))
+        for hi in range(13) for lo in range(hi)
+        for k in range(13) if k not in (hi, lo)
+    ]
+    classes += [('trips', (t,) + k) for t in range(13) for k in kickers((t,), 2)]
+    classes += [('straight', (top,)) for top in range(3, 13)]
+    classes += [('flush', k) for k in five_distinct]
+    classes += [
+        ('full_house', (t, p)) for t in range(13) for p in range(13) if p != t
+    ]
+    classes += [
+        ('quads', (q, k)) for q in range(13) for k in range(13) if k != q
+    ]
+    classes += [('sflush', (top,)) for top in range(3, 13)]
+
+    assert len(classes) == NUM_EQUIVALENCE_CLASSES
+    return classes
+
+
+def _best_unsuited(
+    counts: List[int],
+    ranked: Dict[Tuple[str, Tuple[int, ...]], int],
+    high_card: Dict[Tuple[int, ...], int],
+    straight: Dict[int, int]
+) -> int:
+    """Suit'ler yok sayıldığında rank sayaçlarından en iyi eli bulur."""
+    desc = [r for r in range(12, -1, -1) if counts[r]]
+    quads = [r for r in desc if counts[r] == 4]
+    trips = [r for r in desc if counts[r] == 3]
+    pairs = [r for r in desc if counts[r] == 2]
+
+    if quads:
+        q = quads[0]
+        return ranked[('quads', (q, next(r for r in desc if r != q)))]
+
+    if trips:
+        t = trips[0]
+        fill = [r for r in desc if r != t and counts[r] >= 2]
+        if fill:
+            return ranked[('full_house', (t, fill[0]))]
+
+    mask = sum(1 << r for r in desc)
+    top = _straight_top(mask)
+    if top >= 0:
+        return straight[top]
+
+    if trips:
+        t = trips[0]
+        return ranked[('trips', (t,) + tuple(r for r in desc if r != t)[:2])]
+
+    if len(pairs) >= 2:
+        hi, lo = pairs[0], pairs[1]
+        kicker = next(r for r in desc if r not in (hi, lo))
+        return ranked[('two_pair', (hi, lo, kicker))]
+
+    if pairs:
+        p = pairs[0]
+        return ranked[('pair', (p,) + tuple(r for r in desc if r != p)[:3])]
+
+    return high_card[tuple(desc[:5])]
@@ -0,0 +1,158 @@
+"""
+POKER BOT V4.0 - OUTS ENGINE
+============================
+Kesin out sayımı ve sonraki kart equity'si.
+Flop ve turn'de görünmeyen her kart lookup evaluator ile denenir; elin
+kategorisini board'un kendisinden daha fazla geliştiren kartlar out sayılır.
+Draw tipi sabit out sayıları yerine bu sayımdan türetilir. Strateji eşikleri
+(draw_outs >= 8 vb.) için sadece straight / flush yapan out'lar draw out'u
+sayılır; hole card eşleştiren kartlar improvements'ta kalır.
+"""
+
+from collections import Counter
+from math import comb
+from typing import Dict, List, Sequence
+
+from constants import NUM_CARDS, HandCategory, DrawType
+from data_classes import OutsAnalysis, EquityResult
+from lookup_evaluator import LookupEvaluator, rank_category
+
+_FLUSH_CATEGORIES = (
+    HandCategory.FLUSH, HandCategory.STRAIGHT_FLUSH, HandCategory.ROYAL_FLUSH
+)
+
+
+class OutsCalculator:
+    """
+    Sonraki kart analizi.
+
+    analyze() tamamen saf Python'dur (turn'de ~46 lookup, < 1 ms);
+    range'e karşı iki sokaklık equity NumPy ile RangeEquity üzerinden
+    hesaplanır.
+    """
+
+    def __init__(self):
+        self._lookup = LookupEvaluator()
+        self._range_equity = None
+
+    def analyze(self, hole: Sequence[int], board: Sequence[int]) -> OutsAnalysis:
+        """
+        Hero'nun outs'larını ve draw tipini hesaplar.
+
+        Args:
+            hole: Hero'nun 2 kart indeksi
+            board: Board kart indeksleri (sadece flop / turn'de out aranır)
+
+        Returns:
+            OutsAnalysis (out kartları, yeni kategori dağılımı, draw tipi,
+            river'a kadar isabet olasılığı)
+        """
+        hole, board = list(hole), list(board)
+        dead = set(hole) | set(board)
+        unseen = NUM_CARDS - len(dead)
+        if len(board) not in (3, 4):
+            return OutsAnalysis(unseen=unseen)
+
+        evaluate = self._lookup.evaluate
+        current = rank_category(evaluate(hole + board)).value
+        known = hole + board
+
+        out_cards: List[int] = []
+        draw_cards: List[int] = []
+        improvements: Dict[HandCategory, int] = {}
+        flush_draw = False
+        straight_ranks = set()
+        for card in range(NUM_CARDS):
+            if card in dead:
+                continue
+            new = rank_category(evaluate(known + [card]))
+            if new.value <= current or new.value <= _board_category(board + [card], evaluate).value:
+                continue
+            out_cards.append(card)
+            improvements[new] = improvements.get(new, 0) + 1
+            if new in _FLUSH_CATEGORIES:
+                flush_draw = True
+                draw_cards.append(card)
+            elif new == HandCategory.STRAIGHT:
+                straight_ranks.add(card >> 2)
+                draw_cards.append(card)
+
+        if flush_draw and straight_ranks:
+            draw_type = DrawType.COMBO_DRAW
+        elif flush_draw:
+            draw_type = DrawType.FLUSH_DRAW
+        elif len(straight_ranks) >= 2:
+            draw_type = DrawType.OESD
+        elif straight_ranks:
+            draw_type = DrawType.GUTSHOT
+        elif len(board) == 3:
+            draw_type = _backdoor_draw(hole, board)
+        else:
+            draw_type = DrawType.NONE
+
+        return OutsAnalysis(
+            outs=len(out_cards),
+            out_cards=out_cards,
+            improvements=improvements,
+            draw_type=draw_type,
+            hit_probability=hit_probability(len(out_cards), unseen, 5 - len(board)),
+            unseen=unseen,
+            draw_outs=len(draw_cards),
+            draw_cards=draw_cards,
+            draw_probability=hit_probability(len(draw_cards), unseen, 5 - len(board))
+        )
+
+    def draw_equity(
+        self, hole: Sequence[int], board: Sequence[int], villain_range=None
+    ) -> EquityResult:
+        """
+        River'a kadar (flop'ta iki sokak) range'e karşı tam equity.
+
+        Args:
+            villain_range: Range, notasyon metni, kümesi veya {notasyon: ağırlık} sözlüğü
+                (None = rastgele el)
+        """
+        return self._get_range_equity().equity(tuple(hole), villain_range, board)
+
+    def next_card_equity(
+        self, hole: Sequence[int], board: Sequence[int], villain_range=None
+    ) -> Dict[int, float]:
+        """Her olası sonraki kart için range'e karşı equity ({kart: equity})."""
+        return self._get_range_equity().next_card_equity(tuple(hole), villain_range, board)
+
+    def _get_range_equity(self):
+        if self._range_equity is None:
+            from equity import RangeEquity
+            self._range_equity = RangeEquity()
+        return self._range_equity
+
+
+def hit_probability(outs: int, unseen: int, cards_to_come: int) -> float:
+    """Kalan kartlarda en az bir out gelme olasılığı (kesin, kombinatoryal)."""
+    if outs <= 0 or cards_to_come <= 0 or unseen <= 0:
+        return 0.0
+    cards_to_come = min(cards_to_come, unseen)
+    return 1.0 - comb(unseen - outs, cards_to_come) / comb(unseen, cards_to_come)
+
+
+def _board_category(cards: List[int], evaluate) -> HandCategory:
+    """Board'un (artı sonraki kart) kendi başına kategorisi."""
+    if len(cards) >= 5:
+        return rank_category(evaluate(cards))
+    counts = sorted(Counter(c >> 2 for c in cards).values(), reverse=True)
+    if counts[0] == 4:
+        return HandCategory.FOUR_OF_A_KIND
+    if counts[0] == 3:
+        return HandCategory.THREE_OF_A_KIND
+    if counts[0] == 2:
+        return HandCategory.TWO_PAIR if counts[1] == 2 else HandCategory.PAIR
+    return HandCategory.HIGH_CARD
+
+
+def _backdoor_draw(hole: List[int], board: List[int]) -> DrawType:
+    """Flop'ta runner-runner flush (hero en az bir kartla katkı veriyorsa)."""
+    suit_counts = Counter(c & 3 for c in hole + board)
+    for suit, count in suit_counts.items():
+        if count == 3 and any(c & 3 == suit for c in hole):
+            return DrawType.BACKDOOR_FLUSH
+    return DrawType.NONE
@@ -0,0 +1,291 @@
+"""
+POKER BOT V4.0 - PREFLOP EQUITY TABLE
+=====================================
+169 x 169 preflop all-in equity matrisi.
+Matris build_equity_matrix ile bir kez süreç havuzunda hesaplanır ve
+preflop_equity.npy dosyasına yazılır; çalışma zamanında sadece yüklenir.
+Somut el vs range sorgularında kart çakışması kombinasyon ağırlıklarıyla
+hesaba katılır.
+
+Kullanım (matrisi yeniden üretmek için):
+    python preflop_equity.py [board_sayısı] [worker_sayısı]
+"""
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from batch_evaluator import evaluate_batch, sample_without_replacement
+from constants import RANKS, NUM_CARDS, PREFLOP_EQUITY_FILE, PREFLOP_BUILD_BOARDS
+from preflop_ranges import notation_to_combos
+
+NUM_HAND_CLASSES = 169
+
+# 13x13 grid sırası: satır/sütun A..2; köşegen pair, üst üçgen suited,
+# alt üçgen offsuit (örn. [0][1] = 'AKs', [1][0] = 'AKo')
+_GRID_RANKS = RANKS[::-1]
+HAND_CLASSES: List[str] = [
+    f"{_GRID_RANKS[row]}{_GRID_RANKS[col]}" if row == col
+    else f"{_GRID_RANKS[min(row, col)]}{_GRID_RANKS[max(row, col)]}{'s' if row < col else 'o'}"
+    for row in range(13) for col in range(13)
+]
+CLASS_INDEX = {notation: i for i, notation in enumerate(HAND_CLASSES)}
+
+
+def hand_class(c1: int, c2: int) -> int:
+    """İki kart indeksinin 169'luk el sınıfı indeksi."""
+    hi, lo = 12 - max(c1 >> 2, c2 >> 2), 12 - min(c1 >> 2, c2 >> 2)
+    if hi == lo or (c1 & 3) == (c2 & 3):
+        return hi * 13 + lo
+    return lo * 13 + hi
+
+
+@lru_cache(maxsize=1)
+def _combo_table() -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    1326 kombinasyon, sınıfa göre gruplu.
+
+    Returns:
+        (kartlar (1326, 2), sınıf indeksleri, 52 bitlik maskeler)
+    """
+    cards = np.array(
+        [combo for notation in HAND_CLASSES for combo in notation_to_combos(notation)],
+        dtype=np.int64
+    )
+    classes = np.array([hand_class(c1, c2) for c1, c2 in cards], dtype=np.int64)
+    masks = np.left_shift(1, cards).sum(axis=1)
+    return cards, classes, masks
+
+
+@lru_cache(maxsize=1)
+def _conflict_pairs() -> Tuple[np.ndarray, np.ndarray]:
+    """Ortak kart içeren (i, j) kombinasyon çiftleri (i != j)."""
+    _, _, masks = _combo_table()
+    shared = (masks[:, None] & masks[None, :]) != 0
+    np.fill_diagonal(shared, False)
+    return np.nonzero(shared)
+
+
+# --- MATRİS ÜRETİMİ ---
+
+def _accumulate_board(board: np.ndarray, num: np.ndarray, den: np.ndarray) -> None:
+    """
+    Tek bir 5 kartlık board için tüm kombinasyon çiftlerini sınıf
+    matrislerine ekler.
+
+    num[a, b] += Σ sign(rank_i - rank_j), den[a, b] += çift sayısı
+    (i ∈ a, j ∈ b, ikisi de board ile ve birbiriyle çakışmayan).
+    Çakışmasız karşılaştırmalar sıralı kümülatif sayımla, ortak kartlı
+    çiftlerin düzeltmesi seyrek çift listesiyle yapılır.
+    """
+    cards, classes, masks = _combo_table()
+    conflict_i, conflict_j = _conflict_pairs()
+
+    board_mask = int(np.left_shift(1, board).sum())
+    live = (masks & board_mask) == 0
+    idx = np.flatnonzero(live)
+    live_classes = classes[idx]
+
+    hands = np.hstack([cards[idx], np.broadcast_to(board, (len(idx), 5))])
+    ranks = np.zeros(len(cards), dtype=np.int32)
+    ranks[idx] = evaluate_batch(hands)
+
+    # Her kombinasyon için: her sınıftan kaç canlı kombinasyonu yeniyor / yeniliyor
+    order = np.argsort(ranks[idx], kind='stable')
+    sorted_ranks = ranks[idx][order]
+    one_hot = np.zeros((len(idx) + 1, NUM_HAND_CLASSES), dtype=np.int32)
+    one_hot[np.arange(1, len(idx) + 1), live_classes[order]] = 1
+    cumulative = np.cumsum(one_hot, axis=0)
+    below = cumulative[np.searchsorted(sorted_ranks, ranks[idx], side='left')]
+    above = cumulative[-1] - cumulative[np.searchsorted(sorted_ranks, ranks[idx], side='right')]
+    margin = (below - above).astype(np.float64)
+
+    # Ortak kartlı çiftleri çıkar
+    keep = live[conflict_i] & live[conflict_j]
+    ci, cj = conflict_i[keep], conflict_j[keep]
+    position = np.full(len(cards), -1, dtype=np.int64)
+    position[idx] = np.arange(len(idx))
+    margin -= np.bincount(
+        position[ci] * NUM_HAND_CLASSES + classes[cj],
+        weights=np.sign(ranks[ci] - ranks[cj]),
+        minlength=margin.size
+    ).reshape(margin.shape)
+
+    # Satırları sınıflara topla (kombinasyonlar sınıfa göre gruplu)
+    bounds = np.searchsorted(live_classes, np.arange(NUM_HAND_CLASSES + 1))
+    row_sums = np.vstack([np.zeros(NUM_HAND_CLASSES), np.cumsum(margin, axis=0)])
+    num += row_sums[bounds[1:]] - row_sums[bounds[:-1]]
+
+    counts = np.diff(bounds).astype(np.float64)
+    den += np.outer(counts, counts)
+    den[np.diag_indices(NUM_HAND_CLASSES)] -= counts  # kombinasyonun kendisiyle eşleşmesi
+    den -= np.bincount(
+        classes[ci] * NUM_HAND_CLASSES + classes[cj],
+        minlength=NUM_HAND_CLASSES * NUM_HAND_CLASSES
+    ).reshape(den.shape)
+
+
+def _build_shard(task: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Bir shard'lık rastgele board'u işler: (num, den)."""
+    num_boards, seed = task
+    boards = sample_without_replacement(
+        range(NUM_CARDS), num_boards, 5, np.random.default_rng(seed)
+    )
+    num = np.zeros((NUM_HAND_CLASSES, NUM_HAND_CLASSES))
+    den = np.zeros((NUM_HAND_CLASSES, NUM_HAND_CLASSES))
+    for board in boards:
+        _accumulate_board(board, num, den)
+    return num, den
+
+
+def build_equity_matrix(
+    num_boards: int = PREFLOP_BUILD_BOARDS,
+    workers: Optional[int] = None,
+    seed: int = 0,
+    shard_size: int = 5000
+) -> np.ndarray:
+    """
+    169 x 169 equity matrisini hesaplar.
+
+    Her board'da 1326 kombinasyonun tamamı birbirine karşı sayılır;
+    board'lar seed'li shard'lar halinde süreç havuzunda işlenir.
+
+    Args:
+        num_boards: Örneklenecek 5 kartlık board sayısı
+        workers: Süreç sayısı (None = CPU sayısı, 1 = aynı süreçte)
+        seed: Shard seed'leri için ana seed
+
+    Returns:
+        float32 matris, [a, b] = a sınıfının b sınıfına karşı equity'si
+    """
+    master = random.Random(seed)
+    tasks = []
+    remaining = num_boards
+    while remaining > 0:
+        n = min(shard_size, remaining)
+        tasks.append((n, master.getrandbits(63)))
+        remaining -= n
+
+    if workers == 1:
+        results = list(map(_build_shard, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_build_shard, tasks))
+
+    num = sum(r[0] for r in results)
+    den = sum(r[1] for r in results)
+    return (0.5 + 0.5 * num / np.maximum(den, 1.0)).astype(np.float32)
+
+
+def default_table_path() -> str:
+    """Modülün yanındaki matris dosyası."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), PREFLOP_EQUITY_FILE)
+
+
+# --- SORGULAR ---
+
+class PreflopEquityTable:
+    """
+    Önceden hesaplanmış preflop equity sorguları.
+
+    Matris sınıf seviyesinde bir kez yüklenir (~100 KB .npy).
+    """
+
+    _matrices = {}
+
+    def __init__(self, path: Optional[str] = None, matrix: Optional[np.ndarray] = None):
+        """
+        Args:
+            path: .npy dosyası (None = paketteki tablo)
+            matrix: Dosya yerine doğrudan verilen 169 x 169 matris
+        """
+        if matrix is None:
+            path = path or default_table_path()
+            if path not in PreflopEquityTable._matrices:
+                PreflopEquityTable._matrices[path] = np.load(path)
+            matrix = PreflopEquityTable._matrices[path]
+        if matrix.shape != (NUM_HAND_CLASSES, NUM_HAND_CLASSES):
+            raise ValueError(f"169 x 169 matris gerekli: {matrix.shape}")
+        self.matrix = matrix
+
+    def equity(self, hand: str, villain: str) -> float:
+        """Sınıf vs sınıf equity'si (örn. 'AKs' vs 'QQ')."""
+        return float(self.matrix[CLASS_INDEX[hand], CLASS_INDEX[villain]])
+
+    def hand_vs_range(self, hole: Sequence[int], hand_range=None) -> float:
+        """
+        Somut elin range'e karşı equity'si.
+
+        Rakip sınıflarının ağırlığı, hero'nun kartlarıyla çakışmayan
+        kombinasyon sayısı x range ağırlığıdır.
+
+        Args:
+            hole: Hero'nun 2 kart indeksi
+            hand_range: Range, notasyon kümesi, {notasyon: ağırlık} sözlüğü
+                veya None (rastgele el)
+        """
+        weights = self._class_weights(hole, hand_range)
+        total = weights.sum()
+        if total == 0:
+            return 0.5
+        return float(self.matrix[hand_class(*hole)] @ weights / total)
+
+    def vs_random(self, hole: Sequence[int]) -> float:
+        """Somut elin rastgele bir ele karşı equity'si."""
+        return self.hand_vs_range(hole)
+
+    @staticmethod
+    def _class_weights(hole: Sequence[int], hand_range) -> np.ndarray:
+        """Hero kartlarıyla çakışmayan kombinasyonlardan sınıf ağırlıkları."""
+        _, classes, masks = _combo_table()
+        dead = (1 << hole[0]) | (1 << hole[1])
+        if isinstance(hand_range, str):
+            from ranges import parse_range
+            hand_range = parse_range(hand_range)
+        if hasattr(hand_range, 'combos'):
+            cards, weights = hand_range.combos()
+            live = (np.left_shift(1, cards).sum(axis=1) & dead) == 0
+            return np.bincount(
+                [hand_class(c1, c2) for c1, c2 in cards[live]],
+                weights=weights[live], minlength=NUM_HAND_CLASSES
+            )
+        live = np.bincount(
+            classes[(masks & dead) == 0], minlength=NUM_HAND_CLASSES
+        ).astype(np.float64)
+        if hand_range is None:
+            return live
+        scale = np.zeros(NUM_HAND_CLASSES)
+        items = hand_range.items() if isinstance(hand_range, dict) else ((h, 1.0) for h in hand_range)
+        for notation, weight in items:
+            scale[CLASS_INDEX[notation]] = weight
+        return live * scale
+
+
+_default_table: Optional[PreflopEquityTable] = None
+
+
+def get_preflop_table() -> Optional[PreflopEquityTable]:
+    """Paketteki tablo (dosya yoksa None)."""
+    global _default_table
+    if _default_table is None and os.path.exists(default_table_path()):
+        _default_table = PreflopEquityTable()
+    return _default_table
+
+
+if __name__ == "__main__":
+    import sys
+
+    boards = int(sys.argv[1]) if len(sys.argv) > 1 else PREFLOP_BUILD_BOARDS
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    start = time.time()
+    matrix = build_equity_matrix(boards, workers=workers)
+    np.save(default_table_path(), matrix)
+    print(f"{boards} board, {time.time() - start:.1f}s -> {default_table_path()}")
+    table = PreflopEquityTable(matrix=matrix)
+    for hand, villain in (('AA', 'KK'), ('AKs', 'QQ'), ('AKo', '22'), ('72o', 'AA')):
+        print(f"{hand} vs {villain}: {table.equity(hand, villain):.3f}")
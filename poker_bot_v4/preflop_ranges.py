@@ -4,8 +4,8 @@ POKER BOT V4.0 - PREFLOP RANGES
 Pozisyon bazlı GTO preflop range tabloları.
 """
 
-from typing import Dict, Set, List
-from constants import Position
+from typing import Dict, Set, List, Tuple
+from constants import Position, SUITS, RANK_INDEX
 
 # Hand notasyonu: 
 # - "AA", "KK" = Pocket pairs
@@ -229,10 +229,59 @@ def hand_to_notation(card1_rank: str, card2_rank: str, is_suited: bool) -> str:
     return f"{high}{low}{suffix}"
 
 
-def is_hand_in_range(hand_notation: str, range_set: Set[str]) -> bool:
+def notation_to_combos(hand_notation: str) -> List[Tuple[int, int]]:
+    """
+    El notasyonunu somut kart kombinasyonlarına açar.
+    Örn: 'AKs' -> 4, 'AKo' -> 12, 'QQ' -> 6 kombinasyon (kart indeksi çiftleri)
+    """
+    high = RANK_INDEX[hand_notation[0]]
+    low = RANK_INDEX[hand_notation[1]]
+    suits = range(len(SUITS))
+    
+    if high == low:
+        return [(high * 4 + s1, low * 4 + s2) for s1 in suits for s2 in suits if s1 < s2]
+    if hand_notation.endswith('s'):
+        return [(high * 4 + s, low * 4 + s) for s in suits]
+    if hand_notation.endswith('o'):
+        return [(high * 4 + s1, low * 4 + s2) for s1 in suits for s2 in suits if s1 != s2]
+    return [(high * 4 + s1, low * 4 + s2) for s1 in suits for s2 in suits]
+
+
+def range_to_combos(hand_range) -> List[Tuple[int, int, float]]:
+    """
+    Range'i ağırlıklı kombinasyon listesine çevirir.
+    
+    Args:
+        hand_range: Notasyon kümesi ({'AA', 'AKs'}), ağırlıklı sözlük
+            ({'AA': 1.0, 'A5s': 0.5}), kısa notasyon metni ("QQ+, AKs")
+            veya ranges.Range
+    
+    Returns:
+        (kart1, kart2, ağırlık) listesi
+    """
+    if isinstance(hand_range, str):
+        from ranges import parse_range
+        hand_range = parse_range(hand_range)
+    if hasattr(hand_range, 'to_combos'):
+        return hand_range.to_combos()
+    weights = hand_range if isinstance(hand_range, dict) else dict.fromkeys(hand_range, 1.0)
+    combos = []
+    for notation, weight in weights.items():
+        if weight <= 0:
+            continue
+        combos.extend((c1, c2, weight) for c1, c2 in notation_to_combos(notation))
+    return combos
+
+
+def is_hand_in_range(hand_notation: str, range_set) -> bool:
     """
     Verilen el notasyonu range içinde mi kontrol eder.
+    range_set: notasyon kümesi, ranges.Range veya kısa notasyon metni
+    ("77+, ATs+"; derlenmiş hali memoize edilir).
     """
+    if isinstance(range_set, str):
+        from ranges import parse_range
+        range_set = parse_range(range_set)
     return hand_notation in range_set
 
 
@@ -257,24 +306,15 @@ def get_bb_defense_range(vs_position: Position) -> Set[str]:
     return BB_CALL_VS_POSITION.get(vs_position, set())
 
 
-def calculate_range_percentage(range_set: Set[str]) -> float:
+def calculate_range_percentage(range_set) -> float:
     """
-    Range'in toplam el kombinasyonlarına oranını hesaplar.
-    Toplam: 1326 el kombinasyonu
-    - Pocket pair: 6 combo each (78 total for 13 pairs)
-    - Suited: 4 combo each
-    - Offsuit: 12 combo each
+    Range'in toplam el kombinasyonlarına (1326) oranını hesaplar.
+    Notasyon kümesi, ağırlıklı sözlük veya ranges.Range kabul eder;
+    ağırlıklar kombinasyon sayısına katılır.
     """
-    total_combos = 0
-    
-    for hand in range_set:
-        if len(hand) == 2:  # Pocket pair (AA, KK, etc.)
-            total_combos += 6
-        elif hand.endswith('s'):  # Suited
-            total_combos += 4
-        elif hand.endswith('o'):  # Offsuit
-            total_combos += 12
-    
+    if hasattr(range_set, 'percentage'):
+        return range_set.percentage()
+    total_combos = sum(w for _, _, w in range_to_combos(range_set))
     return (total_combos / 1326) * 100
 
 
@@ -0,0 +1,350 @@
+"""
+POKER BOT V4.0 - RANGES
+=======================
+1326 kombinasyonluk ağırlık dizisiyle tutulan el range'i.
+Notasyon kümeleri (RFI / 3-bet / BB defense tabloları) ve ağırlıklı
+sözlüklerle karşılıklı dönüşür; birleşim, kesişim, ölçekleme ve ölü kart
+çıkarma vektörize yapılır. Equity ve analiz API'leri Range'i doğrudan
+kabul eder.
+
+    utg = Range.from_notation(get_rfi_range(Position.UTG))
+    wide = (utg | parse_range("A5s-A2s:0.5")) * 0.8
+    wide.num_combos(dead=board.indices)
+
+Kısa notasyon (parse_range): virgülle ayrılmış parçalar, her parça
+isteğe bağlı ":ağırlık" alır (aynı el tekrar geçerse sonuncusu geçerli):
+    77+ / 77-55      pair aralıkları
+    ATs+ / A5s-A2s   sabit üst kart, kicker aralıkları (s / o / ikisi)
+    KQo, AK, AhKh    tek sınıf (AK = 16 kombinasyon) veya somut kombinasyon
+"""
+
+import re
+from functools import lru_cache
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from constants import NUM_CARDS, RANKS, RANK_INDEX, SUIT_INDEX, Position
+from preflop_ranges import (
+    notation_to_combos, get_rfi_range, get_3bet_range, get_bb_defense_range
+)
+
+NUM_COMBOS = 1326
+
+# Kombinasyon sırası: (küçük kart, büyük kart) sözlük sırasıyla
+COMBO_CARDS = np.array(list(combinations(range(NUM_CARDS), 2)), dtype=np.int64)
+COMBO_MASKS = np.left_shift(1, COMBO_CARDS).sum(axis=1)
+_COMBO_INDEX = np.full((NUM_CARDS, NUM_CARDS), -1, dtype=np.int64)
+_COMBO_INDEX[COMBO_CARDS[:, 0], COMBO_CARDS[:, 1]] = np.arange(NUM_COMBOS)
+_COMBO_INDEX[COMBO_CARDS[:, 1], COMBO_CARDS[:, 0]] = np.arange(NUM_COMBOS)
+
+
+def combo_index(c1: int, c2: int) -> int:
+    """İki kart indeksinin 0-1325 kombinasyon indeksi."""
+    return int(_COMBO_INDEX[c1, c2])
+
+
+def _notation_indices(notation: str) -> np.ndarray:
+    combos = np.array(notation_to_combos(notation), dtype=np.int64)
+    return _COMBO_INDEX[combos[:, 0], combos[:, 1]]
+
+
+class Range:
+    """
+    Ağırlıklı el range'i (her kombinasyon için 0-1 arası frekans).
+
+    Değer nesnesidir: işlemler yeni Range döndürür, hash'lenebilir ve
+    cache anahtarı olarak kullanılabilir.
+    """
+
+    __slots__ = ('weights', '_hash')
+
+    def __init__(self, weights: Optional[np.ndarray] = None):
+        """
+        Args:
+            weights: 1326 elemanlı ağırlık dizisi (None = boş range)
+        """
+        if weights is None:
+            weights = np.zeros(NUM_COMBOS)
+        weights = np.clip(np.asarray(weights, dtype=np.float64), 0.0, 1.0)
+        if weights.shape != (NUM_COMBOS,):
+            raise ValueError(f"{NUM_COMBOS} elemanlı ağırlık dizisi gerekli: {weights.shape}")
+        weights.setflags(write=False)
+        self.weights = weights
+        self._hash = None
+
+    # --- OLUŞTURMA ---
+
+    @classmethod
+    def full(cls) -> 'Range':
+        """Tüm 1326 kombinasyon."""
+        return cls(np.ones(NUM_COMBOS))
+
+    @classmethod
+    def from_notation(cls, hand_range) -> 'Range':
+        """
+        Notasyon kümesi ({'AA', 'AKs'}) veya ağırlıklı sözlükten
+        ({'AA': 1.0, 'A5s': 0.5}) Range.
+        """
+        items = hand_range.items() if isinstance(hand_range, dict) else ((h, 1.0) for h in hand_range)
+        weights = np.zeros(NUM_COMBOS)
+        for notation, weight in items:
+            weights[_notation_indices(notation)] = weight
+        return cls(weights)
+
+    @classmethod
+    def from_combos(cls, combos: Iterable[Tuple]) -> 'Range':
+        """(kart1, kart2) veya (kart1, kart2, ağırlık) listesinden Range."""
+        weights = np.zeros(NUM_COMBOS)
+        for combo in combos:
+            weights[_COMBO_INDEX[combo[0], combo[1]]] = combo[2] if len(combo) > 2 else 1.0
+        return cls(weights)
+
+    # --- DÖNÜŞÜM ---
+
+    def to_notation(self) -> Dict[str, float]:
+        """
+        {notasyon: ortalama ağırlık} sözlüğü (sıfır ağırlıklı sınıflar hariç).
+        Ölü kart çıkarılmış range'lerde ortalama tüm kombinasyonlar üzerindendir.
+        """
+        from preflop_equity import HAND_CLASSES
+
+        result = {}
+        for notation in HAND_CLASSES:
+            weight = float(self.weights[_notation_indices(notation)].mean())
+            if weight > 0:
+                result[notation] = weight
+        return result
+
+    def to_set(self) -> Set[str]:
+        """Eski tablo formatı: ağırlığı sıfırdan büyük el sınıfları."""
+        return set(self.to_notation())
+
+    def combos(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Ağırlığı sıfırdan büyük (kartlar (N, 2), ağırlıklar (N,))."""
+        idx = np.flatnonzero(self.weights)
+        return COMBO_CARDS[idx], self.weights[idx]
+
+    def to_combos(self):
+        """range_to_combos formatı: (kart1, kart2, ağırlık) listesi."""
+        cards, weights = self.combos()
+        return [(int(c1), int(c2), float(w)) for (c1, c2), w in zip(cards, weights)]
+
+    # --- İŞLEMLER ---
+
+    def __or__(self, other: 'Range') -> 'Range':
+        """Birleşim (kombinasyon başına en büyük ağırlık)."""
+        return Range(np.maximum(self.weights, other.weights))
+
+    def __and__(self, other: 'Range') -> 'Range':
+        """Kesişim (kombinasyon başına en küçük ağırlık)."""
+        return Range(np.minimum(self.weights, other.weights))
+
+    def __sub__(self, other: 'Range') -> 'Range':
+        """Fark: other'da olan kombinasyonlar çıkarılır."""
+        return Range(np.where(other.weights > 0, 0.0, self.weights))
+
+    def __mul__(self, factor: float) -> 'Range':
+        """Ölçekleme (sonuç 0-1 aralığına kırpılır)."""
+        return Range(self.weights * factor)
+
+    __rmul__ = __mul__
+
+    def remove_cards(self, dead: Sequence[int]) -> 'Range':
+        """Ölü kartlardan birini içeren kombinasyonları sıfırlar."""
+        return Range(np.where(self._blocked(dead), 0.0, self.weights))
+
+    # --- SORGULAR ---
+
+    def num_combos(self, dead: Sequence[int] = ()) -> float:
+        """Ölü kartlar çıkarıldıktan sonra ağırlıklı kombinasyon sayısı."""
+        if not len(dead):
+            return float(self.weights.sum())
+        return float(self.weights[~self._blocked(dead)].sum())
+
+    def percentage(self, dead: Sequence[int] = ()) -> float:
+        """Tüm kombinasyonlara oranı (yüzde)."""
+        return self.num_combos(dead) / NUM_COMBOS * 100
+
+    def weight(self, c1: int, c2: int) -> float:
+        return float(self.weights[_COMBO_INDEX[c1, c2]])
+
+    def __contains__(self, hand) -> bool:
+        """Notasyon ('AKs') veya (kart1, kart2) range'de mi?"""
+        if isinstance(hand, str):
+            return bool(self.weights[_notation_indices(hand)].any())
+        return self.weight(*hand) > 0
+
+    def __bool__(self) -> bool:
+        return bool(self.weights.any())
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Range) and np.array_equal(self.weights, other.weights)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self.weights.tobytes())
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Range({self.num_combos():.1f} combos, {self.percentage():.1f}%)"
+
+    @staticmethod
+    def _blocked(dead: Sequence[int]) -> np.ndarray:
+        dead_mask = 0
+        for c in dead:
+            dead_mask |= 1 << c
+        return (COMBO_MASKS & dead_mask) != 0
+
+
+_FULL_RANGE = Range.full()
+
+
+@lru_cache(maxsize=256)
+def _range_from_key(key: frozenset) -> Range:
+    return Range.from_notation(dict(key))
+
+
+def as_range(hand_range) -> Range:
+    """
+    Equity / analiz API'lerinin kabul ettiği range formatlarını Range'e
+    çevirir: None (tüm eller), Range, kısa notasyon metni, notasyon kümesi
+    veya {notasyon: ağırlık} sözlüğü. Küme ve sözlük dönüşümleri memoize edilir.
+    """
+    if hand_range is None:
+        return _FULL_RANGE
+    if isinstance(hand_range, Range):
+        return hand_range
+    if isinstance(hand_range, str):
+        return parse_range(hand_range)
+    items = hand_range.items() if isinstance(hand_range, dict) else ((h, 1.0) for h in hand_range)
+    return _range_from_key(frozenset(items))
+
+
+# --- TABLOLARDAN ---
+
+def rfi_range(position: Position) -> Range:
+    """RFI tablosunun Range karşılığı."""
+    return Range.from_notation(get_rfi_range(position))
+
+
+def three_bet_range(vs_position: Position, include_bluffs: bool = True) -> Range:
+    """3-bet tablosunun Range karşılığı."""
+    return Range.from_notation(get_3bet_range(vs_position, include_bluffs))
+
+
+def bb_defense_range(vs_position: Position) -> Range:
+    """BB defense tablosunun Range karşılığı."""
+    return Range.from_notation(get_bb_defense_range(vs_position))
+
+
+# --- KISA NOTASYON ---
+
+_CLASS_TOKEN = re.compile(r'^([2-9TJQKA])([2-9TJQKA])([so]?)(\+?)$')
+_COMBO_TOKEN = re.compile(r'^([2-9TJQKA])([cdhs])([2-9TJQKA])([cdhs])$')
+
+
+def _class_notation(high: int, low: int, suffix: str) -> str:
+    if high == low:
+        return RANKS[high] * 2
+    return f"{RANKS[high]}{RANKS[low]}{suffix}"
+
+
+def _expand_class(token: str) -> List[str]:
+    """'77+', 'ATs+', 'A5s-A2s', 'KQo' gibi parçayı sınıf notasyonlarına açar."""
+    if '-' in token:
+        first, last = (_CLASS_TOKEN.match(part) for part in token.split('-', 1))
+        if not first or not last or first.group(4) or last.group(4):
+            raise ValueError(f"Geçersiz aralık: {token}")
+        high1, low1 = RANK_INDEX[first.group(1)], RANK_INDEX[first.group(2)]
+        high2, low2 = RANK_INDEX[last.group(1)], RANK_INDEX[last.group(2)]
+        suffix = first.group(3)
+        if suffix != last.group(3):
+            raise ValueError(f"Aralık uçlarının suited/offsuit tipi farklı: {token}")
+        if high1 == low1 and high2 == low2:
+            lo, hi = sorted((high1, high2))
+            return [_class_notation(r, r, '') for r in range(lo, hi + 1)]
+        if high1 != high2 or high1 <= max(low1, low2):
+            raise ValueError(f"Aralıkta üst kart sabit olmalı: {token}")
+        lo, hi = sorted((low1, low2))
+        return [_class_notation(high1, r, suffix) for r in range(lo, hi + 1)]
+
+    match = _CLASS_TOKEN.match(token)
+    if not match:
+        raise ValueError(f"Geçersiz el notasyonu: {token}")
+    high, low = RANK_INDEX[match.group(1)], RANK_INDEX[match.group(2)]
+    suffix, plus = match.group(3), match.group(4)
+    if low > high:
+        high, low = low, high
+    if high == low:
+        if suffix:
+            raise ValueError(f"Pair suited/offsuit olamaz: {token}")
+        return [_class_notation(r, r, '') for r in range(high, 13)] if plus else [token[:2]]
+    if plus:
+        return [_class_notation(high, r, suffix) for r in range(low, high)]
+    return [_class_notation(high, low, suffix)]
+
+
+def _token_indices(token: str) -> np.ndarray:
+    """Tek parçanın kombinasyon indeksleri."""
+    match = _COMBO_TOKEN.match(token)
+    if match:
+        c1 = RANK_INDEX[match.group(1)] * 4 + SUIT_INDEX[match.group(2)]
+        c2 = RANK_INDEX[match.group(3)] * 4 + SUIT_INDEX[match.group(4)]
+        if c1 == c2:
+            raise ValueError(f"Aynı kart iki kez: {token}")
+        return np.array([_COMBO_INDEX[c1, c2]])
+    return np.concatenate([_notation_indices(n) for n in _expand_class(token)])
+
+
+@lru_cache(maxsize=1024)
+def _parse(text: str) -> Range:
+    weights = np.zeros(NUM_COMBOS)
+    for part in text.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        token, _, weight = part.partition(':')
+        try:
+            value = float(weight) if weight else 1.0
+        except ValueError:
+            raise ValueError(f"Geçersiz ağırlık: {part}") from None
+        if not 0.0 <= value <= 1.0:
+            raise ValueError(f"Ağırlık 0-1 arasında olmalı: {part}")
+        weights[_token_indices(token.strip())] = value
+    return Range(weights)
+
+
+def parse_range(text: str) -> Range:
+    """
+    Kısa notasyonu Range'e derler ("77+, ATs+, KQo, A5s-A2s:0.5").
+
+    Sonuçlar metin başına memoize edilir; Range değiştirilemez olduğu
+    için aynı nesne paylaşılır.
+
+    Raises:
+        ValueError: Geçersiz notasyon veya ağırlık
+    """
+    return _parse(' '.join(text.split()))
+
+
+def load_ranges(path: str) -> Dict[str, Range]:
+    """
+    Range kütüphanesi dosyası: her satır "isim = notasyon", '#' yorum.
+
+    Örn:
+        UTG_RFI = 77+, ATs+, KQs, AQo+
+        BTN_3BET = TT+, AQs+, AKo, A5s-A2s:0.5
+    """
+    ranges: Dict[str, Range] = {}
+    with open(path, encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+            name, sep, notation = line.partition('=')
+            if not sep or not name.strip():
+                raise ValueError(f"{path}:{number}: 'isim = notasyon' bekleniyor")
+            ranges[name.strip()] = parse_range(notation)
+    return ranges
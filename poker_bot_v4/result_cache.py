@@ -0,0 +1,66 @@
+"""
+POKER BOT V4.0 - RESULT CACHE
+=============================
+evaluate_hand / BoardAnalyzer.analyze sonuçları için boyut sınırlı LRU
+cache. Anahtarlar suit izomorfizmi ile kanonikleştirilmiş kart
+tuple'larıdır; değerler dondurulmuş (değiştirilemez) sonuç nesneleridir.
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from constants import ANALYSIS_CACHE_SIZE
+
+
+class ResultCache:
+    """Hit / miss / eviction sayaçlı LRU cache."""
+
+    def __init__(self, maxsize: int = ANALYSIS_CACHE_SIZE):
+        if maxsize <= 0:
+            raise ValueError(f"Cache boyutu pozitif olmalı: {maxsize}")
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Değeri döndürür (yoksa None) ve en son kullanılan yapar."""
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Değeri ekler; boyut aşılırsa en eski kaydı atar."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def record_hit(self) -> None:
+        """Cache önünde tutulan bir kısayoldan dönen sonucu hit sayar."""
+        self.hits += 1
+
+    def clear(self) -> None:
+        """Kayıtları ve sayaçları sıfırlar."""
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / max(1, lookups)
+        }
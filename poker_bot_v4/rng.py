@@ -0,0 +1,66 @@
+"""
+POKER BOT V4.0 - RNG STREAMS
+============================
+Bileşen başına RNG enjeksiyonu ve seed bölme.
+
+Olasılıklı bileşenler (BetSizer, PostflopStrategy, HandEvaluator,
+anti-detection) global random yerine kendi random.Random örneklerini
+kullanır. Bir ana seed'den hash ile türetilen alt seed'ler worker
+süreçlerine ve bileşenlere dağıtılır; aynı ana seed, süreç sayısı ve
+sırasından bağımsız olarak aynı akışları üretir.
+"""
+
+import hashlib
+import random
+from typing import List, Optional, Union
+
+RandomLike = Union[None, int, random.Random]
+
+
+def make_random(rng: RandomLike = None) -> random.Random:
+    """
+    RNG argümanını random.Random örneğine çevirir.
+
+    Args:
+        rng: Hazır örnek (olduğu gibi döner, akış paylaşılır), int seed
+            veya None (işletim sistemi entropisiyle yeni bağımsız akış)
+    """
+    if isinstance(rng, random.Random):
+        return rng
+    if rng is None or isinstance(rng, int):
+        return random.Random(rng)
+    raise ValueError(f"RNG bekleniyordu (random.Random, int veya None): {rng!r}")
+
+
+def derive_seed(seed: int, *keys) -> int:
+    """
+    Ana seed ve anahtar yolundan kararlı 63 bit alt seed.
+
+    hash() yerine blake2b kullanılır: sonuç Python sürecinden ve
+    PYTHONHASHSEED'den bağımsızdır.
+    """
+    path = ":".join(str(k) for k in (seed,) + keys)
+    return int.from_bytes(hashlib.blake2b(path.encode(), digest_size=8).digest(), 'big') >> 1
+
+
+def split_seeds(seed: int, n: int) -> List[int]:
+    """Ana seed'den n bağımsız alt seed (worker / shard başına bir tane)."""
+    return [derive_seed(seed, i) for i in range(n)]
+
+
+def spawn(rng: RandomLike, n: int) -> List[random.Random]:
+    """
+    Bir akıştan n bağımsız alt akış.
+    int seed verilirse alt akışlar split_seeds ile, örnek verilirse
+    onun sıradaki bitleriyle seed'lenir.
+    """
+    if isinstance(rng, int):
+        return [random.Random(s) for s in split_seeds(rng, n)]
+    parent = make_random(rng)
+    return [random.Random(parent.getrandbits(63)) for _ in range(n)]
+
+
+def numpy_generator(rng: Optional[random.Random] = None):
+    """random.Random akışından türetilen NumPy Generator (numpy gerekli)."""
+    import numpy as np
+    return np.random.default_rng(make_random(rng).getrandbits(63))
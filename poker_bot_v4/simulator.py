@@ -0,0 +1,675 @@
+"""
+POKER BOT V4.0 - SELF-PLAY SIMULATOR
+====================================
+Heads-up el motoru ve toplu self-play simülasyonu.
+
+GameController.run_hand'in senaryolu tekrarından farklı olarak kartlar
+gerçekten dağıtılır, her aksiyon legal hale getirilir, pot ve side pot'lar
+hesaplanır ve showdown lookup evaluator ile yapılır. Eller seed'li
+shard'lar halinde süreç havuzunda oynanır; sonuç bb/100 ve güven aralığı.
+Duplicate deal, common random numbers ve all-in EV düzeltmesi aynı
+hassasiyete çok daha az elle ulaştırır.
+
+Chip birimi blind'lardır (varsayılan SB 0.5, BB 1.0 = 1 bb).
+"""
+
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from math import comb, sqrt
+from statistics import NormalDist
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from constants import (
+    Position, Street, ActionType, NUM_CARDS, ANALYSIS_CACHE_SIZE, EQUITY_CONFIDENCE,
+    SIM_STACK_BB, SIM_SHARD_SIZE, SIM_MAX_RAISES, SIM_ALLIN_SAMPLES
+)
+from data_classes import (
+    Card, HoleCards, Board, GameState, PokerAction, PlayerStats,
+    HandOutcome, SimulationResult, StrategyComparison
+)
+from lookup_evaluator import LookupEvaluator
+from rng import RandomLike, make_random, derive_seed
+
+try:
+    import numpy as np
+    from batch_evaluator import evaluate_batch, sample_without_replacement
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+_STREETS = (Street.PREFLOP, Street.FLOP, Street.TURN, Street.RIVER)
+_BOARD_SIZES = {Street.PREFLOP: 0, Street.FLOP: 3, Street.TURN: 4, Street.RIVER: 5}
+_AGGRESSIVE = (ActionType.BET, ActionType.RAISE, ActionType.ALL_IN)
+
+
+# --- POLICIES ---
+
+class StrategyPolicy:
+    """Bot'un PreflopStrategy / PostflopStrategy çifti."""
+
+    profile: Optional[PlayerStats] = None
+
+    def __init__(self, cache_size: int = ANALYSIS_CACHE_SIZE, rng: RandomLike = None):
+        from strategy import PreflopStrategy, PostflopStrategy
+        self.rng = make_random(rng)
+        self.preflop = PreflopStrategy()
+        self.postflop = PostflopStrategy(cache_size=cache_size, rng=self.rng)
+
+    def decide(self, state: GameState) -> PokerAction:
+        if state.street == Street.PREFLOP:
+            return self.preflop.decide(state)
+        return self.postflop.decide(state)
+
+
+class CallingStationPolicy:
+    """Hiç fold ve raise etmez: check / call."""
+
+    profile = PlayerStats(vpip=80.0, pfr=2.0, aggression_factor=0.2)
+
+    def decide(self, state: GameState) -> PokerAction:
+        if state.get_call_amount() > 0:
+            return PokerAction(ActionType.CALL, state.get_call_amount(), "Station Call")
+        return PokerAction(ActionType.CHECK, 0, "Station Check")
+
+
+class RandomPolicy:
+    """Sabit olasılıklarla fold / call / pot-size raise."""
+
+    profile = PlayerStats(vpip=60.0, pfr=25.0, aggression_factor=1.5)
+
+    def __init__(self, fold: float = 0.2, raise_: float = 0.2, rng: RandomLike = None):
+        if fold < 0 or raise_ < 0 or fold + raise_ > 1:
+            raise ValueError(f"Geçersiz olasılıklar: fold={fold}, raise={raise_}")
+        self.fold = fold
+        self.raise_ = raise_
+        self.rng = make_random(rng)
+
+    def decide(self, state: GameState) -> PokerAction:
+        to_call = state.get_call_amount()
+        roll = self.rng.random()
+        if roll < self.raise_:
+            pot_raise = state.current_bet + state.pot + to_call
+            return PokerAction(ActionType.RAISE, pot_raise, "Random Raise")
+        if roll < self.raise_ + self.fold and to_call > 0:
+            return PokerAction(ActionType.FOLD, 0, "Random Fold")
+        return PokerAction(ActionType.CALL, to_call, "Random Call")
+
+
+class PushFoldPolicy:
+    """Preflop range'indeki elle all-in, diğerleriyle fold; postflop check / fold."""
+
+    profile = PlayerStats(vpip=35.0, pfr=35.0, aggression_factor=5.0)
+
+    def __init__(self, hand_range: str = "22+, A2+, K7s+, K9o+, Q9s+, QTo+, J9s+, JTo, T9s"):
+        from ranges import parse_range
+        self.hand_range = parse_range(hand_range)
+
+    def decide(self, state: GameState) -> PokerAction:
+        if state.street == Street.PREFLOP and state.hero_hand.indices in self.hand_range:
+            return PokerAction(ActionType.ALL_IN, state.hero_invested + state.hero_stack, "Push")
+        return PokerAction(ActionType.FOLD, 0, "Fold")
+
+
+POLICIES = {
+    'strategy': StrategyPolicy,
+    'station': CallingStationPolicy,
+    'random': RandomPolicy,
+    'pushfold': PushFoldPolicy,
+}
+
+
+def make_policy(spec):
+    """
+    Politika tanımından örnek üretir.
+
+    Args:
+        spec: POLICIES adı ('station'), (ad, {kwargs}) çifti, argümansız
+            çağrılabilir (sınıf) veya decide() metodu olan hazır nesne
+    """
+    if hasattr(spec, 'decide'):
+        return spec
+    if isinstance(spec, str):
+        spec = (spec, {})
+    if isinstance(spec, tuple):
+        name, kwargs = spec
+        if name not in POLICIES:
+            raise ValueError(f"Bilinmeyen politika: {name} (seçenekler: {sorted(POLICIES)})")
+        return POLICIES[name](**kwargs)
+    if callable(spec):
+        return spec()
+    raise ValueError(f"Geçersiz politika tanımı: {spec!r}")
+
+
+# --- POT ACCOUNTING ---
+
+def award_pots(contributions: Sequence[float], ranks: Sequence[Optional[int]]) -> List[float]:
+    """
+    Ana pot ve side pot'ları dağıtır.
+
+    Her katkı seviyesi ayrı bir pot katmanıdır; katmanı o seviyeye kadar
+    yatırmış ve fold etmemiş oyuncuların en iyisi (eşitlikte bölüşerek)
+    alır. Sadece bir oyuncunun karşılandığı katman (uncalled bet) ona döner.
+
+    Args:
+        contributions: Oyuncu başına toplam yatırılan chip
+        ranks: Oyuncu başına el rank'ı (yüksek kazanır), fold = None
+
+    Returns:
+        Oyuncu başına pottan alınan chip
+    """
+    payouts = [0.0] * len(contributions)
+    live = [i for i, rank in enumerate(ranks) if rank is not None]
+    if not live:
+        raise ValueError("Pota hak kazanan oyuncu yok")
+
+    previous = 0.0
+    for level in sorted(set(c for c in contributions if c > 0)):
+        layer = sum(min(c, level) - min(c, previous) for c in contributions)
+        eligible = [i for i in live if contributions[i] >= level] or live
+        best = max(ranks[i] for i in eligible)
+        winners = [i for i in eligible if ranks[i] == best]
+        for i in winners:
+            payouts[i] += layer / len(winners)
+        previous = level
+    return payouts
+
+
+def all_in_equity(
+    holes: Sequence[Sequence[int]], board: Sequence[int], samples: int = SIM_ALLIN_SAMPLES, seed=None
+) -> float:
+    """
+    Koltuk 0'ın bilinen rakip eline karşı equity'si (split yarım sayılır).
+
+    Kalan runout sayısı samples'tan azsa (flop, turn) tam sayılır;
+    preflop'ta samples kadar runout örneklenir.
+    """
+    known = set(board) | set(holes[0]) | set(holes[1])
+    deck = [c for c in range(NUM_CARDS) if c not in known]
+    to_deal = 5 - len(board)
+    exact = comb(len(deck), to_deal) <= samples
+
+    if NUMPY_AVAILABLE:
+        if exact:
+            runouts = np.array(list(combinations(deck, to_deal)), dtype=np.int64).reshape(
+                comb(len(deck), to_deal), to_deal
+            )
+        else:
+            runouts = sample_without_replacement(deck, samples, to_deal, np.random.default_rng(seed))
+        boards = np.hstack([
+            np.broadcast_to(np.array(board, dtype=np.int64), (len(runouts), len(board))), runouts
+        ])
+        ranks = [
+            evaluate_batch(np.hstack([
+                np.broadcast_to(np.array(hole, dtype=np.int64), (len(boards), 2)), boards
+            ]))
+            for hole in holes
+        ]
+        return float(np.mean((ranks[0] > ranks[1]) + 0.5 * (ranks[0] == ranks[1])))
+
+    evaluate = LookupEvaluator().evaluate
+    rng = random.Random(seed)
+    runouts = combinations(deck, to_deal) if exact else (rng.sample(deck, to_deal) for _ in range(samples))
+    score = total = 0
+    for runout in runouts:
+        full = list(board) + list(runout)
+        first, second = evaluate(list(holes[0]) + full), evaluate(list(holes[1]) + full)
+        score += 1.0 if first > second else 0.5 if first == second else 0.0
+        total += 1
+    return score / total
+
+
+# --- HAND ENGINE ---
+
+class _Hand:
+    """Oynanmakta olan elin durumu (koltuk 0 / 1)."""
+
+    __slots__ = (
+        'hand_id', 'button', 'holes', 'board', 'street', 'stacks', 'committed',
+        'bets', 'folded', 'actions', 'history', 'all_in_street'
+    )
+
+    def __init__(self, hand_id: str, button: int, holes, board, stacks):
+        self.hand_id = hand_id
+        self.button = button
+        self.holes = holes
+        self.board = board
+        self.street = Street.PREFLOP
+        self.stacks = list(stacks)
+        self.committed = [0.0, 0.0]   # Elin tamamında yatırılan
+        self.bets = [0.0, 0.0]        # Bu sokakta yatırılan
+        self.folded: Optional[int] = None
+        self.actions: Dict[Street, List[PokerAction]] = {street: [] for street in _STREETS}
+        self.history: List[Tuple[int, Street, PokerAction]] = []
+        self.all_in_street: Optional[Street] = None
+
+    def put(self, seat: int, amount: float) -> None:
+        amount = min(amount, self.stacks[seat])
+        self.stacks[seat] -= amount
+        self.bets[seat] += amount
+        self.committed[seat] += amount
+
+    def record(self, seat: int, action: PokerAction) -> None:
+        self.actions[self.street].append(action)
+        self.history.append((seat, self.street, action))
+
+
+class HeadsUpEngine:
+    """
+    No-limit heads-up el motoru.
+
+    Button small blind'ı öder, preflop ilk, postflop son konuşur. Politika
+    aksiyonları legal hale getirilir:
+        - bedava fold -> check, bet karşısında check -> fold
+        - BET / RAISE miktarı sokak toplamıdır (raise-to); min-raise'e
+          yükseltilir, stack'i aşarsa all-in olur
+        - raise sınırı dolduysa veya rakip all-in ise raise -> call
+    """
+
+    def __init__(
+        self,
+        small_blind: float = 0.5,
+        big_blind: float = 1.0,
+        stack: float = SIM_STACK_BB,
+        max_raises: int = SIM_MAX_RAISES
+    ):
+        self.small_blind = small_blind
+        self.big_blind = big_blind
+        self.stack = stack * big_blind
+        self.max_raises = max_raises
+        self._lookup = LookupEvaluator()
+
+    @staticmethod
+    def deal(rng) -> Tuple[Tuple[Tuple[int, int], Tuple[int, int]], Tuple[int, ...]]:
+        """İki el ve 5 board kartı: ((el0, el1), board)."""
+        cards = rng.sample(range(NUM_CARDS), 9)
+        return ((cards[0], cards[1]), (cards[2], cards[3])), tuple(cards[4:])
+
+    def play_hand(
+        self,
+        policies: Sequence,
+        button: int = 0,
+        rng=None,
+        deal=None,
+        stacks: Optional[Sequence[float]] = None,
+        hand_id: str = ""
+    ) -> HandOutcome:
+        """
+        Bir eli sonuna kadar oynar.
+
+        Args:
+            policies: Koltuk 0 ve 1 için decide(GameState) -> PokerAction
+            button: Button (SB) koltuğu
+            rng: Kart dağıtımı için random.Random (deal verilmezse gerekli)
+            deal: Sabit kartlar ((el0, el1), board)
+            stacks: Koltuk başına başlangıç stack'i (chip, varsayılan eşit)
+
+        Returns:
+            HandOutcome (koltuk başına net kazanç)
+        """
+        holes, board = deal if deal is not None else self.deal(rng)
+        hand = _Hand(hand_id, button, holes, board, stacks or (self.stack, self.stack))
+        hand.put(button, self.small_blind)
+        hand.put(1 - button, self.big_blind)
+
+        for street in _STREETS:
+            hand.street = street
+            if street != Street.PREFLOP:
+                hand.bets = [0.0, 0.0]
+            first = button if street == Street.PREFLOP else 1 - button
+            self._betting_round(hand, policies, first)
+            if hand.folded is not None:
+                break
+            if hand.all_in_street is None and 0 in hand.stacks:
+                hand.all_in_street = street
+
+        shown = _BOARD_SIZES[hand.street] if hand.folded is not None else 5
+        if hand.folded is not None:
+            ranks = [None, None]
+            ranks[1 - hand.folded] = 0
+        else:
+            ranks = [self._lookup.evaluate(list(hole) + list(board)) for hole in holes]
+        payouts = award_pots(hand.committed, ranks)
+
+        return HandOutcome(
+            profits=tuple(payouts[s] - hand.committed[s] for s in (0, 1)),
+            pot=2 * min(hand.committed),
+            showdown=hand.folded is None,
+            all_in_street=hand.all_in_street,
+            button=button,
+            hole_cards=tuple(holes),
+            board=tuple(board[:shown]),
+            actions=hand.history
+        )
+
+    def all_in_ev(self, outcome: HandOutcome, seed=None) -> Tuple[float, float]:
+        """
+        All-in anındaki equity'ye göre koltuk başına beklenen kazanç
+        (chip). Açılan kartların şansını sonuçtan çıkarır.
+        """
+        if outcome.all_in_street is None:
+            return outcome.profits
+        board = outcome.board[:_BOARD_SIZES[outcome.all_in_street]]
+        equity = all_in_equity(outcome.hole_cards, board, seed=seed)
+        expected = equity * outcome.pot - outcome.pot / 2
+        return expected, -expected
+
+    def _betting_round(self, hand: _Hand, policies: Sequence, first: int) -> None:
+        """Bir sokağın bahis turu; fold olursa hand.folded atanır."""
+        pending = [first, 1 - first]
+        raises = 0
+        last_raise = self.big_blind
+        while pending:
+            seat = pending.pop(0)
+            to_call = max(hand.bets) - hand.bets[seat]
+            if hand.stacks[seat] == 0 or (to_call <= 0 and hand.stacks[1 - seat] == 0):
+                continue
+
+            proposed = policies[seat].decide(self._state(hand, seat, policies))
+            action = self._legalize(proposed, hand, seat, raises, last_raise)
+            hand.record(seat, action)
+
+            if action.action == ActionType.FOLD:
+                hand.folded = seat
+                return
+            if action.action == ActionType.CALL:
+                hand.put(seat, action.amount)
+            elif action.action in _AGGRESSIVE:
+                current = max(hand.bets)
+                last_raise = max(last_raise, action.amount - current)
+                hand.put(seat, action.amount - hand.bets[seat])
+                if action.amount > current:
+                    raises += 1
+                    pending = [1 - seat]
+
+    def _legalize(
+        self, proposed: PokerAction, hand: _Hand, seat: int, raises: int, last_raise: float
+    ) -> PokerAction:
+        """
+        Politika aksiyonunu legal aksiyona çevirir.
+        CALL miktarı eklenen chip, BET / RAISE / ALL_IN miktarı sokak toplamıdır.
+        """
+        current = max(hand.bets)
+        to_call = current - hand.bets[seat]
+        stack = hand.stacks[seat]
+        all_in = hand.bets[seat] + stack
+        kind, description = proposed.action, proposed.description
+
+        if kind in _AGGRESSIVE:
+            can_raise = raises < self.max_raises and hand.stacks[1 - seat] > 0 and stack > to_call
+            if can_raise:
+                target = all_in if kind == ActionType.ALL_IN else proposed.amount
+                target = min(max(target, current + last_raise), all_in)
+                if target >= all_in:
+                    return PokerAction(ActionType.ALL_IN, all_in, description)
+                kind = ActionType.RAISE if current > 0 else ActionType.BET
+                return PokerAction(kind, round(target, 2), description)
+            kind = ActionType.CALL
+
+        if kind == ActionType.FOLD and to_call <= 0:
+            return PokerAction(ActionType.CHECK, 0, description)
+        if kind == ActionType.CHECK and to_call > 0:
+            return PokerAction(ActionType.FOLD, 0, description)
+        if kind == ActionType.CALL:
+            if to_call <= 0:
+                return PokerAction(ActionType.CHECK, 0, description)
+            return PokerAction(ActionType.CALL, min(to_call, stack), description)
+        return PokerAction(kind, 0, description)
+
+    def _state(self, hand: _Hand, seat: int, policies: Sequence) -> GameState:
+        """Koltuğun kendi bakış açısından oyun durumu."""
+        hole = hand.holes[seat]
+        opponent = 1 - seat
+        return GameState(
+            hand_id=hand.hand_id,
+            street=hand.street,
+            hero_hand=HoleCards(Card.from_index(hole[0]), Card.from_index(hole[1])),
+            board=Board([Card.from_index(c) for c in hand.board[:_BOARD_SIZES[hand.street]]]),
+            hero_position=Position.BTN if seat == hand.button else Position.BB,
+            villain_position=Position.BTN if opponent == hand.button else Position.BB,
+            hero_stack=hand.stacks[seat],
+            villain_stack=hand.stacks[opponent],
+            pot=sum(hand.committed),
+            current_bet=max(hand.bets),
+            hero_invested=hand.bets[seat],
+            villain_invested=hand.bets[opponent],
+            actions_this_street=list(hand.actions[hand.street]),
+            actions_preflop=list(hand.actions[Street.PREFLOP]),
+            actions_flop=list(hand.actions[Street.FLOP]),
+            actions_turn=list(hand.actions[Street.TURN]),
+            actions_river=list(hand.actions[Street.RIVER]),
+            villain_stats=getattr(policies[opponent], 'profile', None),
+            small_blind=self.small_blind,
+            big_blind=self.big_blind
+        )
+
+
+# --- BATCH SIMULATION ---
+
+# (hero'lar, rakip, deal, seed, (sb, bb, stack), duplicate, all-in EV)
+ShardTask = Tuple[tuple, object, int, int, Tuple[float, float, float], bool, bool]
+# (örnek, oynanan el, hero başına showdown, [(toplam, kareler toplamı)])
+ShardResult = Tuple[int, int, List[int], List[Tuple[float, float]]]
+
+
+def _play(engine: HeadsUpEngine, policies, hero_seat: int, deal, button: int, seed: int, all_in_ev: bool):
+    """
+    Tek el. rng akışı olan politikalar deal seed'inden rollerine göre
+    (hero / rakip) türetilen seed'le başlatılır: karşılaştırılan hero'lar
+    ve duplicate yarıları aynı karar akışlarını görür (common random numbers).
+
+    Returns:
+        (hero kazancı (chip), showdown)
+    """
+    for seat, policy in enumerate(policies):
+        stream = getattr(policy, 'rng', None)
+        if stream is not None:
+            stream.seed(derive_seed(seed, 'hero' if seat == hero_seat else 'villain'))
+    outcome = engine.play_hand(policies, button=button, deal=deal)
+    profit = outcome.profits[hero_seat]
+    if all_in_ev and outcome.showdown and outcome.all_in_street not in (None, Street.RIVER):
+        profit = engine.all_in_ev(outcome, seed)[hero_seat]
+    return profit, outcome.showdown
+
+
+def run_shard(task: ShardTask) -> ShardResult:
+    """
+    Bir shard'lık deal'i her hero politikasıyla oynar; button her deal'de
+    yer değiştirir.
+
+    Bütün hero'lar aynı kartları ve aynı karar RNG seed'lerini görür;
+    aynı görev her süreçte aynı sonucu verir. Duplicate
+    modunda deal koltuklar değiştirilerek tekrar oynanır ve örnek iki elin
+    ortalamasıdır.
+
+    Returns:
+        (örnek, el, showdown'lar, momentler); momentler önce her hero'nun
+        kazancı (bb), sonra hero[i] - hero[0] farkları içindir
+    """
+    heroes, villain, deals, seed, (small_blind, big_blind, stack), duplicate, all_in_ev = task
+    rng = random.Random(seed)
+    engine = HeadsUpEngine(small_blind, big_blind, stack)
+    opponent = make_policy(villain)
+    players = [make_policy(hero) for hero in heroes]
+
+    moments = [[0.0, 0.0] for _ in range(2 * len(players) - 1)]
+    showdowns = [0] * len(players)
+    for i in range(deals):
+        deal = engine.deal(rng)
+        deal_seed = rng.getrandbits(63)
+        profits = []
+        for k, player in enumerate(players):
+            profit, showdown = _play(engine, (player, opponent), 0, deal, i % 2, deal_seed, all_in_ev)
+            if duplicate:
+                swapped, swapped_showdown = _play(
+                    engine, (opponent, player), 1, deal, i % 2, deal_seed, all_in_ev
+                )
+                profit = (profit + swapped) / 2
+                showdown += swapped_showdown
+            profits.append(profit / big_blind)
+            showdowns[k] += showdown
+
+        samples = profits + [p - profits[0] for p in profits[1:]]
+        for moment, x in zip(moments, samples):
+            moment[0] += x
+            moment[1] += x * x
+
+    hands = deals * len(players) * (2 if duplicate else 1)
+    return deals, hands, showdowns, [tuple(m) for m in moments]
+
+
+def _summary(n: int, total: float, total_sq: float, confidence: float):
+    """(bb/100, örnek std sapması, bb/100 standart hatası, ci_low, ci_high)."""
+    mean = total / n
+    std_dev = sqrt(max(0.0, total_sq / n - mean * mean) * n / max(n - 1, 1))
+    std_error = 100 * std_dev / sqrt(n)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return 100 * mean, std_dev, std_error, 100 * mean - z * std_error, 100 * mean + z * std_error
+
+
+class SelfPlaySimulator:
+    """
+    Hero politikasını rakip politikasına karşı toplu oynatır.
+
+    Varyans azaltma:
+        - duplicate: her deal koltuklar değiştirilerek iki kez oynanır,
+          kart şansı büyük ölçüde birbirini götürür
+        - all_in_ev: all-in'den sonra açılan kartlar yerine o andaki
+          equity x pot sayılır
+        - compare(): iki hero aynı deal ve RNG seed'leriyle oynar (common
+          random numbers); eşleştirilmiş farkın güven aralığı raporlanır
+
+    Kullanım:
+        simulator = SelfPlaySimulator('strategy', 'station', workers=8, duplicate=True)
+        result = simulator.run(1_000_000, seed=42)
+        diff = simulator.compare('strategy', ('random', {'fold': 0.3}), 200_000)
+    """
+
+    def __init__(
+        self,
+        hero='strategy',
+        villain='station',
+        workers: Optional[int] = None,
+        shard_size: int = SIM_SHARD_SIZE,
+        small_blind: float = 0.5,
+        big_blind: float = 1.0,
+        stack: float = SIM_STACK_BB,
+        duplicate: bool = False,
+        all_in_ev: bool = False
+    ):
+        """
+        Args:
+            hero, villain: Politika tanımları (bkz. make_policy); süreç
+                havuzunda çalışırken pickle edilebilir olmalıdır
+            workers: Süreç sayısı (None = CPU sayısı, 1 = aynı süreçte)
+            stack: Başlangıç stack'i (bb)
+            duplicate: Her deal'i koltuklar değiştirilmiş olarak da oyna
+            all_in_ev: All-in showdown'larda gerçek sonuç yerine equity
+        """
+        self.hero = hero
+        self.villain = villain
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.config = (small_blind, big_blind, stack)
+        self.duplicate = duplicate
+        self.all_in_ev = all_in_ev
+
+    def shard_tasks(self, heroes: tuple, deals: int, seed: int = 0) -> List[ShardTask]:
+        """
+        Shard sayısı ve seed'leri sadece (deal, seed, shard_size)'a bağlıdır;
+        shard i'nin seed'i derive_seed(seed, 'shard', i).
+        """
+        tasks: List[ShardTask] = []
+        remaining = deals
+        while remaining > 0:
+            n = min(self.shard_size, remaining)
+            tasks.append((
+                heroes, self.villain, n, derive_seed(seed, 'shard', len(tasks)), self.config,
+                self.duplicate, self.all_in_ev
+            ))
+            remaining -= n
+        return tasks
+
+    def run(
+        self, hands: int, seed: int = 0, confidence: float = EQUITY_CONFIDENCE
+    ) -> SimulationResult:
+        """
+        Hero'nun bb/100 sonucu.
+
+        Args:
+            hands: Deal sayısı (duplicate modunda oynanan el iki katıdır)
+        """
+        deals, played, showdowns, moments = self._run((self.hero,), hands, seed)
+        return self._result(deals, played, showdowns[0], moments[0], confidence)
+
+    def compare(
+        self, baseline, candidate, hands: int, seed: int = 0, confidence: float = EQUITY_CONFIDENCE
+    ) -> StrategyComparison:
+        """
+        İki hero politikasını aynı deal'lerde karşılaştırır.
+
+        Fark deal başına eşleştirilmiş örneklerden hesaplanır; ortak kart ve
+        RNG akışı sayesinde iki sonucun ortak gürültüsü birbirini götürür.
+        """
+        deals, played, showdowns, moments = self._run((baseline, candidate), hands, seed)
+        if deals == 0:
+            return StrategyComparison()
+        difference, _, std_error, ci_low, ci_high = _summary(deals, *moments[2], confidence)
+        return StrategyComparison(
+            baseline=self._result(deals, played // 2, showdowns[0], moments[0], confidence),
+            candidate=self._result(deals, played // 2, showdowns[1], moments[1], confidence),
+            difference=difference,
+            std_error=std_error,
+            ci_low=ci_low,
+            ci_high=ci_high
+        )
+
+    def _run(self, heroes: tuple, hands: int, seed: int):
+        """Shard'ları dağıtır ve sayaçları birleştirir."""
+        tasks = self.shard_tasks(heroes, hands, seed)
+        if self.workers == 1 or len(tasks) == 1:
+            results = list(map(run_shard, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(run_shard, tasks))
+
+        moments = [
+            (sum(r[3][k][0] for r in results), sum(r[3][k][1] for r in results))
+            for k in range(2 * len(heroes) - 1)
+        ]
+        showdowns = [sum(r[2][k] for r in results) for k in range(len(heroes))]
+        return sum(r[0] for r in results), sum(r[1] for r in results), showdowns, moments
+
+    def _result(
+        self, deals: int, played: int, showdowns: int, moment: Tuple[float, float], confidence: float
+    ) -> SimulationResult:
+        if deals == 0:
+            return SimulationResult()
+        bb_per_100, std_dev, std_error, ci_low, ci_high = _summary(deals, *moment, confidence)
+        return SimulationResult(
+            hands=played,
+            profit=bb_per_100 * played / 100,
+            bb_per_100=bb_per_100,
+            std_dev=std_dev,
+            std_error=std_error,
+            ci_low=ci_low,
+            ci_high=ci_high,
+            showdowns=showdowns,
+            duplicate=self.duplicate,
+            all_in_ev=self.all_in_ev
+        )
+
+
+if __name__ == "__main__":
+    # Kullanım: python simulator.py [el] [rakip] [worker] [--duplicate] [--allin-ev]
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    num_hands = int(args[0]) if len(args) > 0 else 20000
+    opponent = args[1] if len(args) > 1 else 'station'
+    workers = int(args[2]) if len(args) > 2 else None
+    simulator = SelfPlaySimulator(
+        'strategy', opponent, workers,
+        duplicate='--duplicate' in sys.argv, all_in_ev='--allin-ev' in sys.argv
+    )
+    print(f"strategy vs {opponent}: {simulator.run(num_hands)}")
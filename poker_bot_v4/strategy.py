@@ -4,7 +4,6 @@ POKER BOT V4.0 - STRATEGY ENGINE
 GTO ve Exploitative strateji karışımı.
 """
 
-import random
 import math
 import logging
 from typing import Tuple, Optional, List
@@ -20,6 +19,7 @@ from data_classes import (
     BoardAnalysis, PlayerStats
 )
 from hand_evaluator import HandEvaluator, BoardAnalyzer
+from rng import RandomLike, make_random
 from preflop_ranges import (
     hand_to_notation, is_hand_in_range,
     get_rfi_range, get_3bet_range, get_bb_defense_range
@@ -31,8 +31,15 @@ log = logging.getLogger("Strategy")
 class BetSizer:
     """Dinamik bet sizing hesaplayıcı."""
     
-    @staticmethod
+    def __init__(self, rng: RandomLike = None):
+        """
+        Args:
+            rng: random.Random örneği veya seed (overbet / sizing varyansı)
+        """
+        self.rng = make_random(rng)
+    
     def calculate_value_bet(
+        self,
         pot: float,
         hand: HandStrength,
         board: BoardAnalysis,
@@ -75,13 +82,13 @@ class BetSizer:
         # Nut advantage
         if hand.is_nut:
             # Overbet potansiyeli
-            if random.random() < 0.3:  # %30 ihtimalle overbet
+            if self.rng.random() < 0.3:  # %30 ihtimalle overbet
                 base_size = pot * BET_SIZE_OVERBET
         
         return round(max(base_size, pot * 0.25), 2)  # Min %25 pot
     
-    @staticmethod
     def calculate_bluff_bet(
+        self,
         pot: float,
         board: BoardAnalysis,
         has_blockers: bool = False
@@ -93,7 +100,7 @@ class BetSizer:
         # Islak board'da bluff riski yüksek
         if board.danger_level >= 6:
             # Ya bluff yapma ya da büyük yap
-            if random.random() < 0.3:  # %30 ihtimalle büyük bluff
+            if self.rng.random() < 0.3:  # %30 ihtimalle büyük bluff
                 return round(pot * BET_SIZE_LARGE, 2)
             return 0.0
         
@@ -106,8 +113,8 @@ class BetSizer:
         
         return round(base_size, 2)
     
-    @staticmethod
     def calculate_raise_size(
+        self,
         pot: float,
         facing_bet: float,
         is_value: bool,
@@ -126,7 +133,7 @@ class BetSizer:
             # Value raise - pot-sized veya biraz üstü
             if spr < SPR_SHALLOW:
                 return pot_raise * 1.2  # All-in'e yakın
-            return min(pot_raise, pot_raise * random.uniform(0.9, 1.1))
+            return min(pot_raise, pot_raise * self.rng.uniform(0.9, 1.1))
         else:
             # Bluff raise - daha küçük (fold equity/risk oranı)
             return min(min_raise * 2.5, pot_raise * 0.7)
@@ -240,10 +247,18 @@ class PreflopStrategy:
 class PostflopStrategy:
     """Postflop karar motoru."""
     
-    def __init__(self):
-        self.evaluator = HandEvaluator()
-        self.board_analyzer = BoardAnalyzer()
-        self.bet_sizer = BetSizer()
+    def __init__(self, cache_size: int = 0, rng: RandomLike = None):
+        """
+        Args:
+            cache_size: > 0 ise el ve board analizleri LRU cache'te tutulur
+                (aynı board'daki tekrar kararlar neredeyse bedava olur)
+            rng: random.Random örneği veya seed; karar frekansları, sizing
+                ve equity örneklemesi bu tek akışı paylaşır
+        """
+        self.rng = make_random(rng)
+        self.evaluator = HandEvaluator(cache_size=cache_size, rng=self.rng)
+        self.board_analyzer = BoardAnalyzer(cache_size=cache_size)
+        self.bet_sizer = BetSizer(self.rng)
     
     def decide(self, state: GameState) -> PokerAction:
         """
@@ -313,8 +328,8 @@ class PostflopStrategy:
         
         # === DRAWING HAND ===
         if hand.has_draw and hand.draw_outs >= 8:
-            # Draw equity hesabı
-            draw_equity = hand.draw_outs * (0.02 if state.street == Street.RIVER else 0.04)
+            # Draw equity: river'a kadar en az bir out gelme olasılığı
+            draw_equity = hand.draw_equity
             
             # Semi-bluff raise
             if self._should_semi_bluff(hand, board, spr):
@@ -371,7 +386,7 @@ class PostflopStrategy:
         
         # === PURE BLUFF ===
         bluff_freq = BLUFF_FREQ_DRY if board.danger_level <= 4 else BLUFF_FREQ_WET
-        if random.random() < bluff_freq:
+        if self.rng.random() < bluff_freq:
             # Bluff spot kontrolü
             if self._is_good_bluff_spot(board, villain_type):
                 bluff_size = self.bet_sizer.calculate_bluff_bet(
@@ -395,7 +410,7 @@ class PostflopStrategy:
         
         # Nut hand - bazen trap
         if hand.is_nut:
-            return random.random() > 0.35  # %65 raise
+            return self.rng.random() > 0.35  # %65 raise
         
         # Calling station'a karşı raise
         if villain_type == "FISH":
@@ -403,7 +418,7 @@ class PostflopStrategy:
         
         # Agresif oyuncuya karşı trap
         if villain_type == "LAG":
-            return random.random() > 0.5  # %50 trap
+            return self.rng.random() > 0.5  # %50 trap
         
         return True  # Default raise
     
@@ -427,11 +442,11 @@ class PostflopStrategy:
         """Semi-bluff raise yapmalı mı?"""
         # Güçlü draw (12+ out)
         if hand.draw_outs >= 12:
-            return random.random() < 0.6  # %60
+            return self.rng.random() < 0.6  # %60
         
         # Normal draw + fold equity
         if hand.draw_outs >= 8 and spr > SPR_SHALLOW:
-            return random.random() < 0.35  # %35
+            return self.rng.random() < 0.35  # %35
         
         return False
     
@@ -443,11 +458,11 @@ class PostflopStrategy:
         # Kuru board + agresif rakip
         if board.danger_level <= 3 and villain_type in ["LAG", None]:
             if hand.equity > 0.35:
-                return random.random() < 0.15  # %15 hero call
+                return self.rng.random() < 0.15  # %15 hero call
         
         # Küçük bet (probe/blocker bet)
         if bet < pot * 0.4 and hand.equity > 0.30:
-            return random.random() < 0.25  # %25
+            return self.rng.random() < 0.25  # %25
         
         return False
     
@@ -462,14 +477,14 @@ class PostflopStrategy:
         
         # Kuru board - yüksek c-bet frequency
         if board.danger_level <= 4:
-            return random.random() < 0.70  # %70
+            return self.rng.random() < 0.70  # %70
         
         # Islak board - sadece value veya iyi draw
         if board.danger_level >= 6:
             return hand.equity >= 0.45 or hand.draw_outs >= 8
         
         # Orta board
-        return random.random() < 0.50  # %50
+        return self.rng.random() < 0.50  # %50
     
     def _calculate_cbet_size(self, pot: float, board: BoardAnalysis) -> float:
         """C-bet size hesaplar."""
@@ -492,9 +507,9 @@ class PostflopStrategy:
         
         # İyi draw
         if hand.draw_outs >= 12:
-            return random.random() < 0.70
+            return self.rng.random() < 0.70
         elif hand.draw_outs >= 8:
-            return random.random() < 0.45
+            return self.rng.random() < 0.45
         
         return False
     
@@ -514,4 +529,4 @@ class PostflopStrategy:
         if board.danger_level <= 4:
             return True
         
-        return random.random() < 0.40
+        return self.rng.random() < 0.40
@@ -0,0 +1,901 @@
+"""
+POKER BOT V4.0 - HAND EVALUATOR TESTS
+=====================================
+Lookup evaluator ve equity hesabı testleri.
+"""
+
+import random
+from collections import Counter
+from itertools import combinations
+
+from data_classes import Card, HoleCards, Board
+from hand_evaluator import HandEvaluator
+from constants import HandCategory
+from lookup_evaluator import (
+    LookupEvaluator, NUM_EQUIVALENCE_CLASSES, rank_category, describe_rank
+)
+
+
+def _reference_score(cards):
+    """Basit (yavaş) referans: 5'li kombinasyonlar üzerinden tuple skor."""
+    best = None
+    for five in combinations(cards, 5):
+        ranks = sorted((c >> 2 for c in five), reverse=True)
+        flush = len({c & 3 for c in five}) == 1
+        counts = Counter(ranks)
+        groups = sorted(counts.items(), key=lambda x: (x[1], x[0]), reverse=True)
+        shape = [g[1] for g in groups]
+        ordered = [g[0] for g in groups]
+        straight = None
+        if len(counts) == 5:
+            if ranks[0] - ranks[4] == 4:
+                straight = ranks[0]
+            elif ranks == [12, 3, 2, 1, 0]:
+                straight = 3
+        if straight is not None and flush:
+            score = (8, [straight])
+        elif shape == [4, 1]:
+            score = (7, ordered)
+        elif shape == [3, 2]:
+            score = (6, ordered)
+        elif flush:
+            score = (5, ranks)
+        elif straight is not None:
+            score = (4, [straight])
+        elif shape == [3, 1, 1]:
+            score = (3, ordered)
+        elif shape == [2, 2, 1]:
+            score = (2, ordered)
+        elif shape == [2, 1, 1, 1]:
+            score = (1, ordered)
+        else:
+            score = (0, ranks)
+        if best is None or score > best:
+            best = score
+    return best
+
+
+def test_card_representation():
+    """Kartlar indeks tabanlı ve paylaşılan örnekler olmalı."""
+    ace = Card.from_string("Ah")
+    assert ace is Card("A", "h")
+    assert ace.index == 12 * 4 + 2
+    assert ace.value == 14 and ace.rank == "A" and ace.suit == "h"
+    assert Card.from_index(ace.index) is ace
+
+    hand = HoleCards.from_strings(["Ah", "Kh"])
+    assert hand.is_suited and hand.is_connected and not hand.is_pocket_pair
+    assert hand.mask == ace.mask | Card("K", "h").mask
+
+    board = Board.from_strings(["2c", "7d"])
+    board.add_card(Card.from_string("Ts"))
+    assert str(board) == "2c 7d Ts" and board.street.name == "FLOP"
+
+    try:
+        Card.from_string("Xz")
+        assert False, "Geçersiz kart kabul edildi"
+    except ValueError:
+        pass
+
+
+def test_lookup_matches_reference():
+    """Lookup evaluator sıralaması referans skorlayıcı ile aynı olmalı."""
+    print("\n" + "="*60)
+    print("TEST: Lookup Evaluator vs Reference")
+    print("="*60)
+
+    evaluator = LookupEvaluator()
+    rng = random.Random(42)
+
+    for _ in range(2000):
+        cards = rng.sample(range(52), 9)
+        for n in (3, 4, 5):
+            hero = cards[:2] + cards[4:4 + n]
+            villain = cards[2:4] + cards[4:4 + n]
+            fast = evaluator.evaluate(hero) - evaluator.evaluate(villain)
+            ref_hero, ref_villain = _reference_score(hero), _reference_score(villain)
+            expected = (ref_hero > ref_villain) - (ref_hero < ref_villain)
+            assert (fast > 0) - (fast < 0) == expected, f"{hero} vs {villain}"
+
+    print("✓ 6000 showdown referans ile uyumlu")
+
+
+def test_lookup_extremes():
+    """En zayıf ve en güçlü eller tablonun uçlarında olmalı."""
+    evaluator = LookupEvaluator()
+    to_idx = lambda cards: Board.from_strings(cards).indices
+
+    royal = evaluator.evaluate(to_idx(["Ah", "Kh", "Qh", "Jh", "Th", "2c", "3d"]))
+    worst = evaluator.evaluate(to_idx(["7c", "5d", "4h", "3s", "2c"]))
+    wheel = evaluator.evaluate(to_idx(["Ac", "2d", "3h", "4s", "5c"]))
+    six_high = evaluator.evaluate(to_idx(["2c", "3d", "4h", "5s", "6c"]))
+
+    print(f"\nRoyal: {royal}, 75432: {worst}, Wheel: {wheel}, 6-high: {six_high}")
+    assert royal == NUM_EQUIVALENCE_CLASSES
+    assert worst == 1
+    assert wheel < six_high
+
+
+def test_rank_categories_and_descriptions():
+    """Kategori ve açıklama sadece rank'tan türetilmeli."""
+    evaluator = LookupEvaluator()
+    to_idx = lambda cards: Board.from_strings(cards).indices
+
+    counts = {}
+    for rank in range(1, NUM_EQUIVALENCE_CLASSES + 1):
+        category = rank_category(rank)
+        counts[category] = counts.get(category, 0) + 1
+    assert counts[HandCategory.HIGH_CARD] == 1277
+    assert counts[HandCategory.PAIR] == 2860
+    assert counts[HandCategory.FULL_HOUSE] == 156
+    assert counts[HandCategory.STRAIGHT_FLUSH] == 9
+    assert counts[HandCategory.ROYAL_FLUSH] == 1
+
+    cases = [
+        (["Kc", "Kd", "7h", "4s", "2c"], "Pair of Ks"),
+        (["Kc", "Kd", "7h", "7s", "Kh"], "Full House, Ks full of 7s"),
+        (["Ac", "2d", "3h", "4s", "5c"], "Straight, 5 high"),
+        (["9h", "8h", "7h", "6h", "5h"], "Straight Flush, 9 high"),
+    ]
+    for cards, expected in cases:
+        desc = describe_rank(evaluator.evaluate(to_idx(cards)))
+        print(f"{cards}: {desc}")
+        assert desc == expected
+
+
+def test_monte_carlo_equity():
+    """Monte Carlo equity bilinen değerlere yakın olmalı."""
+    print("\n" + "="*60)
+    print("TEST: Monte Carlo Equity")
+    print("="*60)
+
+    evaluator = HandEvaluator()
+    random.seed(7)
+
+    # AA vs random el preflop ~%85
+    aces = HoleCards.from_strings(["Ah", "As"])
+    equity = evaluator.calculate_equity_monte_carlo(aces, Board(), iterations=4000)
+    print(f"AA vs random: {equity}")
+    assert 0.81 <= equity <= 0.89
+
+    # River'da nut flush
+    nut_flush = HoleCards.from_strings(["Ah", "2h"])
+    board = Board.from_strings(["Kh", "9h", "4h", "7c", "Jd"])
+    equity = evaluator.calculate_equity_monte_carlo(nut_flush, board, iterations=1000)
+    print(f"Nut flush on river: {equity}")
+    assert equity >= 0.99
+
+
+def test_batch_matches_scalar():
+    """Batch evaluator skalar evaluator ile aynı rank'ları vermeli."""
+    import numpy as np
+    from batch_evaluator import evaluate_batch, sample_without_replacement
+
+    evaluator = LookupEvaluator()
+    rng = np.random.default_rng(3)
+    for n in (5, 6, 7):
+        cards = sample_without_replacement(range(52), 5000, n, rng)
+        ranks = evaluate_batch(cards)
+        expected = [evaluator.evaluate(row.tolist()) for row in cards]
+        assert ranks.tolist() == expected, f"{n} kartlık batch uyuşmuyor"
+
+    # Vektörize Monte Carlo skalar sonuca yakın olmalı
+    hand = HoleCards.from_strings(["Ah", "Kh"])
+    board = Board.from_strings(["Qh", "Jh", "2d"])
+    hand_evaluator = HandEvaluator()
+    equity = hand_evaluator.calculate_equity_monte_carlo(
+        hand, board, iterations=20000, vectorized=True
+    )
+    print(f"\nAKhh on QJ2 (vectorized): {equity}")
+    assert 0.70 <= equity <= 0.82
+
+
+def test_exact_enumeration():
+    """Turn ve river'da tam sayım deterministik ve doğru olmalı."""
+    import equity as equity_module
+    from equity import ExactEquity, enumeration_size
+
+    evaluator = HandEvaluator()
+
+    # River: 990 rakip eli, runout yok
+    assert enumeration_size(45, 0) == 990
+    sets = HoleCards.from_strings(["7s", "7h"])
+    river = Board.from_strings(["7d", "8s", "9s", "2c", "Jh"])
+    first = evaluator.calculate_equity(sets, river)
+    assert first == evaluator.calculate_equity(sets, river)
+    print(f"\nSet of 7s on river: {first}")
+
+    # Turn: NumPy ve saf Python sayımı aynı sonucu vermeli
+    hero = HoleCards.from_strings(["Ah", "Kh"])
+    turn = Board.from_strings(["Qh", "Jh", "2d", "3c"])
+    exact = ExactEquity()
+    batch_result = exact.equity(hero.indices, turn.indices)
+    equity_module.NUMPY_AVAILABLE = False
+    try:
+        scalar_result = exact.equity(hero.indices, turn.indices)
+    finally:
+        equity_module.NUMPY_AVAILABLE = True
+    print(f"AKhh on QJ23 (exact): {batch_result:.4f}")
+    assert batch_result == scalar_result
+
+    # Limit aşılırsa Monte Carlo'ya düşer
+    sampled = evaluator.calculate_equity(hero, turn, iterations=4000, exact_limit=0)
+    assert abs(sampled - batch_result) < 0.05
+
+
+def test_parallel_shards_reproducible():
+    """Aynı seed, worker sayısından bağımsız olarak aynı sayaçları vermeli."""
+    from equity import ParallelEquity, shard_tasks
+
+    hero = HoleCards.from_strings(["Ah", "Kh"]).indices
+    board = Board.from_strings(["Qh", "Jh", "2d"]).indices
+
+    tasks = shard_tasks(hero, board, iterations=25000, seed=11, shard_size=10000)
+    assert [t[2] for t in tasks] == [10000, 10000, 5000]
+
+    with ParallelEquity(workers=1, shard_size=10000) as serial:
+        serial_counts = serial.run(hero, board, 25000, seed=11)
+    with ParallelEquity(workers=2, shard_size=10000) as pooled:
+        pooled_counts = pooled.run(hero, board, 25000, seed=11)
+
+    print(f"\nSerial: {serial_counts}, Pool: {pooled_counts}")
+    assert serial_counts == pooled_counts
+    assert serial_counts[2] == 25000
+
+
+def test_adaptive_equity():
+    """Adaptif örnekleme hedef hataya ulaşınca durmalı."""
+    evaluator = HandEvaluator()
+
+    # Baskın el: az örnekle hedefe ulaşır
+    aces = HoleCards.from_strings(["Ah", "As"])
+    dry = Board.from_strings(["Ad", "7c", "2h"])
+    easy = evaluator.estimate_equity(aces, dry, target_std_error=0.005, seed=1)
+    print(f"\nTop set: {easy}")
+    assert easy.std_error <= 0.005 and not easy.exact
+    assert easy.ci_low <= easy.equity <= easy.ci_high
+
+    # Başa baş el: daha çok örnek gerekir
+    hero = HoleCards.from_strings(["9h", "8h"])
+    wet = Board.from_strings(["Th", "7c", "2h"])
+    close = evaluator.estimate_equity(hero, wet, target_std_error=0.005, seed=1)
+    print(f"Combo draw: {close}")
+    assert close.samples > easy.samples
+
+    # Turn tam sayılır
+    turn = Board.from_strings(["Th", "7c", "2h", "3s"])
+    exact = evaluator.estimate_equity(hero, turn)
+    print(f"Turn exact: {exact}")
+    assert exact.exact and exact.std_error == 0.0
+
+
+def test_range_equity():
+    """Range vs range: kart çakışmaları dahil brute force ile aynı olmalı."""
+    from equity import RangeEquity
+    from preflop_ranges import range_to_combos, get_rfi_range, get_bb_defense_range
+    from constants import Position
+
+    lookup = LookupEvaluator()
+    engine = RangeEquity()
+    turn = Board.from_strings(["Ad", "Kh", "7h", "2c"]).indices
+
+    # Brute force: her kombinasyon çifti x river kartı. İkinci çiftte aynı
+    # kombinasyonlar iki range'de de var (kart çakışması düzeltmesi)
+    for hero_range, villain_range in (
+        ({'AA': 1.0, 'AKs': 0.5}, {'KK', 'AQs', '76s'}),
+        ({'AKs': 0.5, 'KK': 1.0, 'QJs': 1.0}, {'AKs': 1.0, 'KK': 1.0, 'AQs': 1.0, 'QJs': 0.3}),
+    ):
+        score = weight = 0.0
+        for h1, h2, hw in range_to_combos(hero_range):
+            for v1, v2, vw in range_to_combos(villain_range):
+                used = {h1, h2, v1, v2}
+                if len(used) < 4 or used & set(turn):
+                    continue
+                for river in range(52):
+                    if river in used or river in turn:
+                        continue
+                    hr = lookup.evaluate([h1, h2, river] + turn)
+                    vr = lookup.evaluate([v1, v2, river] + turn)
+                    score += hw * vw * (1.0 if hr > vr else 0.5 if hr == vr else 0.0)
+                    weight += hw * vw
+        result = engine.equity(hero_range, villain_range, turn)
+        print(f"\nRange vs range (turn): {result}")
+        assert result.exact
+        assert abs(result.equity - score / weight) < 1e-9
+
+    # Flop tam sayım, simetri
+    flop = Board.from_strings(["Ah", "7d", "2c"])
+    utg = get_rfi_range(Position.UTG)
+    bb = get_bb_defense_range(Position.UTG)
+    forward = HandEvaluator().calculate_range_equity(utg, bb, flop)
+    backward = engine.equity(bb, utg, flop.indices)
+    print(f"UTG vs BB on A72: {forward}")
+    assert abs(forward.equity + backward.equity - 1.0) < 1e-9
+    assert abs(engine.equity(utg, utg, flop.indices).equity - 0.5) < 1e-9
+
+    # Preflop örnekleme: AA vs KK ~%82
+    preflop = engine.equity({'AA'}, {'KK'}, seed=5)
+    assert not preflop.exact and abs(preflop.equity - 0.82) < 0.03
+
+
+def test_multiway_equity():
+    """N rakip: equity'ler toplamı 1, seed tekrarlanabilir, NumPy/saf Python uyumlu."""
+    import numpy as np
+    import equity as equity_module
+    from batch_evaluator import deal_without_replacement
+    from constants import MAX_PLAYERS
+
+    # Kısmi Fisher-Yates: satır içinde tekrar yok, dead kartlar dağıtılmaz
+    deck = list(range(10, 52))
+    dead = np.array([[10, 11], [51, 20], [30, 31]])
+    dealt = deal_without_replacement(deck, 3, 20, np.random.default_rng(0), dead=dead)
+    for row, removed in zip(dealt, dead):
+        assert len(set(row)) == 20 and not set(row) & set(removed)
+
+    evaluator = HandEvaluator()
+    aces = HoleCards.from_strings(["Ah", "As"])
+    preflop = Board()
+
+    # 6-handed AA ~%49
+    six_way = evaluator.calculate_multiway_equity(
+        aces, preflop, [None] * (MAX_PLAYERS - 1), iterations=20000, seed=3
+    )
+    print(f"\nAA 6-way: {six_way}")
+    assert len(six_way.equities) == MAX_PLAYERS
+    assert abs(sum(six_way.equities) - 1.0) < 1e-9
+    assert 0.45 < six_way.equity < 0.53
+    assert six_way.win + six_way.tie <= 1.0
+    again = evaluator.calculate_multiway_equity(
+        aces, preflop, [None] * (MAX_PLAYERS - 1), iterations=20000, seed=3
+    )
+    assert again.equities == six_way.equities
+
+    # Bilinen el + range + rastgele el
+    flop = Board.from_strings(["Qh", "Jh", "2d"])
+    villains = [HoleCards.from_strings(["Kd", "Kc"]), {'QQ', 'JJ', 'AQs'}, None]
+    batch = evaluator.calculate_multiway_equity(aces, flop, villains, iterations=10000, seed=1)
+    equity_module.NUMPY_AVAILABLE = False
+    try:
+        scalar = HandEvaluator().calculate_multiway_equity(
+            aces, flop, villains, iterations=10000, seed=1
+        )
+    finally:
+        equity_module.NUMPY_AVAILABLE = True
+    print(f"AA vs KK, set range, random on QJ2: {batch}")
+    for a, b in zip(batch.equities, scalar.equities):
+        assert abs(a - b) < 0.03
+
+    # calculate_equity tek sayı döndürür; seed'li ve 1000 iterasyonun
+    # standart hatasının (~0.014) 3 katı içinde
+    equity = evaluator.calculate_equity(aces, flop, villains=villains, seed=1)
+    assert equity == evaluator.calculate_equity(aces, flop, villains=villains, seed=1)
+    assert abs(equity - batch.equity) < 0.045
+
+    # Birlikte dağıtılamayan range'ler (AKo'ya karşı iki AA) sonsuz döngü yerine hata
+    from ranges import parse_range
+    big_slick = HoleCards.from_strings(["Ah", "Kd"])
+    for numpy_path in (True, False):
+        equity_module.NUMPY_AVAILABLE = numpy_path
+        try:
+            evaluator.calculate_multiway_equity(
+                big_slick, preflop, [parse_range('AA'), parse_range('AA')], iterations=100, seed=1
+            )
+            assert False, "Dağıtılamayan range'ler ValueError vermeli"
+        except ValueError:
+            pass
+        finally:
+            equity_module.NUMPY_AVAILABLE = True
+
+
+def test_preflop_equity_table():
+    """169x169 tablo: antisimetrik, bilinen değerlerle uyumlu, hızlı yüklenir."""
+    import time
+    import numpy as np
+    from preflop_equity import (
+        PreflopEquityTable, build_equity_matrix, default_table_path, hand_class,
+        HAND_CLASSES, CLASS_INDEX
+    )
+
+    assert len(HAND_CLASSES) == 169 and HAND_CLASSES[1] == 'AKs' and HAND_CLASSES[13] == 'AKo'
+    ah, kh, kd = (Card.from_string(c).index for c in ("Ah", "Kh", "Kd"))
+    assert HAND_CLASSES[hand_class(ah, kh)] == 'AKs'
+    assert HAND_CLASSES[hand_class(kd, ah)] == 'AKo'
+
+    # Küçük üretim: her board'da tüm kombinasyonlar sayılır, matris antisimetrik
+    small = build_equity_matrix(50, workers=1)
+    assert np.allclose(small + small.T, 1.0)
+
+    start = time.time()
+    PreflopEquityTable._matrices.clear()
+    table = PreflopEquityTable(default_table_path())
+    load_ms = (time.time() - start) * 1000
+    print(f"\nPreflop table load: {load_ms:.1f} ms")
+    assert load_ms < 100
+
+    assert np.allclose(table.matrix + table.matrix.T, 1.0, atol=1e-6)
+    assert abs(table.equity('AA', 'KK') - 0.82) < 0.01
+    assert abs(table.equity('AKs', 'QQ') - 0.46) < 0.01
+    assert abs(table.equity('72o', 'AA') - 0.12) < 0.01
+
+    # Rastgele ele karşı ve kart çakışması
+    evaluator = HandEvaluator()
+    aces = HoleCards.from_strings(["Ah", "As"])
+    assert abs(evaluator.calculate_preflop_equity(aces) - 0.85) < 0.01
+    assert evaluator.evaluate_hand(aces, Board()).equity == evaluator.calculate_preflop_equity(aces)
+    # Hero iki as tutuyor: rakipte sadece bir AA kombinasyonu kalır
+    assert table.hand_vs_range(aces.indices, {'AA'}) == 0.5
+    ak = HoleCards.from_strings(["Ah", "Kh"])
+    vs_range = evaluator.calculate_preflop_equity(ak, {'AA': 1.0, 'QQ': 1.0, 'AQs': 0.5})
+    print(f"AKs vs AA/QQ/AQs(0.5): {vs_range}")
+    assert table.equity('AKs', 'AA') < vs_range < table.equity('AKs', 'AQs')
+
+
+def test_suit_isomorphism():
+    """Suit permütasyonları aynı kanonik forma iner; flop sayısı 1755."""
+    from itertools import permutations
+    from isomorphism import (
+        canonicalize, canonical_boards, canonical_key, apply_permutation,
+        inverse_permutation, map_suit
+    )
+
+    assert len(canonical_boards(3)) == 1755
+    holes = {canonicalize(hole, ())[0] for hole in combinations(range(52), 2)}
+    assert len(holes) == 169
+
+    rng = random.Random(4)
+    for _ in range(300):
+        cards = rng.sample(range(52), 7)
+        hole, board = cards[:2], cards[2:2 + rng.choice((3, 4, 5))]
+        canonical_hole, canonical, perm = canonicalize(hole, board)
+        for other in permutations(range(4)):
+            moved = canonicalize(apply_permutation(hole, other), apply_permutation(board, other))
+            assert moved[:2] == (canonical_hole, canonical)
+        # Permütasyon geri alınabilir
+        inverse = inverse_permutation(perm)
+        assert sorted(apply_permutation(canonical, inverse)) == sorted(board)
+        assert canonical_key(hole, board) == canonical_key(
+            apply_permutation(hole, (3, 2, 1, 0)), apply_permutation(board, (3, 2, 1, 0))
+        )
+
+    # Kanonik board'un equity'si ve rank'ı değişmez
+    evaluator = HandEvaluator()
+    hero = HoleCards.from_strings(["As", "Ks"])
+    board = Board.from_strings(["Qs", "Js", "2h", "3d"])
+    canonical_hole, canonical, perm = canonicalize(hero.indices, board.indices)
+    assert map_suit('s', perm) == 'c'
+    assert evaluator.calculate_equity(hero, board) == evaluator.calculate_equity(
+        HoleCards(Card.from_index(canonical_hole[0]), Card.from_index(canonical_hole[1])),
+        Board([Card.from_index(c) for c in canonical])
+    )
+
+
+def test_analysis_cache():
+    """Cache'li sonuçlar cache'siz hesapla aynı, dondurulmuş ve sayaçlı olmalı."""
+    from itertools import permutations
+    from hand_evaluator import BoardAnalyzer
+    from isomorphism import apply_permutation
+    from result_cache import ResultCache
+
+    # LRU: en eski kayıt atılır
+    lru = ResultCache(maxsize=2)
+    lru.put('a', 1)
+    lru.put('b', 2)
+    assert lru.get('a') == 1
+    lru.put('c', 3)
+    assert lru.get('b') is None and lru.get('a') == 1
+    assert lru.get_stats()["evictions"] == 1
+
+    plain, cached = HandEvaluator(), HandEvaluator(cache_size=1000)
+    plain_board, cached_board = BoardAnalyzer(), BoardAnalyzer(cache_size=1000)
+    rng = random.Random(12)
+    suit_orders = list(permutations(range(4)))
+    for _ in range(300):
+        cards = rng.sample(range(52), 7)
+        size = rng.choice((0, 3, 4, 5))
+        for perm in ((0, 1, 2, 3), rng.choice(suit_orders)):
+            moved = apply_permutation(cards, perm)
+            hole = HoleCards(Card.from_index(moved[0]), Card.from_index(moved[1]))
+            board = Board([Card.from_index(c) for c in moved[2:2 + size]])
+            expected = plain.evaluate_hand(hole, board)
+            strength = cached.evaluate_hand(hole, board)
+            assert strength == expected
+            assert (strength.is_nut, strength.is_second_nut, strength.percentile, strength.blockers) == \
+                (expected.is_nut, expected.is_second_nut, expected.percentile, expected.blockers)
+            assert cached_board.analyze(board) == plain_board.analyze(board)
+
+    # Suit permütasyonu aynı kanonik kayda düşer
+    stats = cached_board.cache.get_stats()
+    print(f"\nBoard cache: {stats}")
+    assert stats["hits"] > 0 and stats["size"] < 600
+
+    strength = cached.evaluate_hand(
+        HoleCards.from_strings(["Kh", "Kd"]), Board.from_strings(["Ah", "7d", "2c"])
+    )
+    assert strength.frozen
+    try:
+        strength.equity = 1.0
+        assert False, "Cache'lenmiş sonuç değiştirilebilmemeli"
+    except AttributeError:
+        pass
+
+    # Preflop: suit izomorfik eller aynı kaydı paylaşır, açıklama suit içermez
+    for cards in (["Ah", "Kh"], ["As", "Ks"]):
+        strength = cached.evaluate_hand(HoleCards.from_strings(cards), Board())
+        assert strength.made_hand_desc == "AKs Premium Suited"
+    offsuit = cached.evaluate_hand(HoleCards.from_strings(["Kc", "Ad"]), Board())
+    assert offsuit.made_hand_desc == "AKo Broadway"
+
+    # Aynı karar noktası tekrarları hit sayılır
+    hits = cached.cache.hits
+    for _ in range(5):
+        cached.evaluate_hand(
+            HoleCards.from_strings(["Kh", "Kd"]), Board.from_strings(["Ah", "7d", "2c"])
+        )
+    assert cached.cache.hits == hits + 5
+
+
+def test_texture_table():
+    """Texture tablosu lookup'ı hesapla aynı; toplu sorgular doğru satırları seçer."""
+    from hand_evaluator import BoardAnalyzer
+    from texture_table import get_texture_table
+
+    table = get_texture_table()
+    assert len(table.query(num_cards=3)) == 1755
+    assert len(table.query(num_cards=4)) == 16432
+
+    computed, looked_up = BoardAnalyzer(use_table=False), BoardAnalyzer()
+    rng = random.Random(21)
+    for _ in range(500):
+        board = Board([Card.from_index(c) for c in rng.sample(range(52), rng.choice((3, 4, 5)))])
+        assert looked_up.analyze(board) == computed.analyze(board)
+
+    # Monotone ve tehlikeli floplar
+    rows = table.query(num_cards=3, same_suit_count=3, danger_level=(7, None))
+    print(f"\nMonotone flops with danger >= 7: {len(rows)}")
+    assert len(rows) > 0
+    for flop in table.boards(rows):
+        analysis = computed.analyze(Board([Card.from_index(c) for c in flop]))
+        assert analysis.same_suit_count == 3 and analysis.danger_level >= 7
+
+
+def test_outs_engine():
+    """Outs sayımı, draw tipi ve isabet olasılığı kesin hesapla tutarlı."""
+    from constants import DrawType
+    from outs import OutsCalculator, hit_probability
+
+    calculator = OutsCalculator()
+    cases = [
+        (["Ah", "Kh"], ["Qh", "7h", "2c"], DrawType.FLUSH_DRAW, {HandCategory.FLUSH: 9}),
+        (["9c", "8d"], ["Jc", "Th", "2s"], DrawType.OESD, {HandCategory.STRAIGHT: 8}),
+        (["9c", "8d"], ["Tc", "6h", "2s"], DrawType.GUTSHOT, {HandCategory.STRAIGHT: 4}),
+        (["9h", "8h"], ["Th", "7c", "2h"], DrawType.COMBO_DRAW,
+         {HandCategory.FLUSH: 9, HandCategory.STRAIGHT: 6}),
+    ]
+    for hole, board, draw_type, expected in cases:
+        hole_idx = HoleCards.from_strings(hole).indices
+        board_idx = Board.from_strings(board).indices
+        analysis = calculator.analyze(hole_idx, board_idx)
+        print(f"\n{hole} {board}: {analysis.outs} outs, {analysis.draw_type.name}")
+        assert analysis.draw_type == draw_type
+        for category, count in expected.items():
+            assert analysis.improvements[category] == count
+
+        # İsabet olasılığı = tüm runout'ların sayımı
+        live = [c for c in range(52) if c not in hole_idx and c not in board_idx]
+        outs = set(analysis.out_cards)
+        hits = sum(1 for runout in combinations(live, 2) if outs & set(runout))
+        assert abs(analysis.hit_probability - hits / len(list(combinations(live, 2)))) < 1e-12
+
+    # Board'daki gelişme out sayılmaz: set board'u eşlediğinde quad/full out'tur
+    analysis = calculator.analyze(
+        HoleCards.from_strings(["As", "Ks"]).indices,
+        Board.from_strings(["7d", "7c", "3h", "9h"]).indices
+    )
+    assert all(c >> 2 in (12, 11) for c in analysis.out_cards)
+    assert analysis.draw_outs == 0
+    assert abs(hit_probability(9, 46, 1) - 9 / 46) < 1e-12
+
+    # HandStrength'e sadece straight / flush out'ları gider: overcard'lar draw değildir
+    evaluator = HandEvaluator()
+    oesd = evaluator.evaluate_hand(HoleCards.from_strings(["Jh", "Tc"]), Board.from_strings(["9d", "8s", "2c"]))
+    assert oesd.has_draw and oesd.draw_outs == 8 and oesd.draw_type == DrawType.OESD
+    assert abs(oesd.draw_equity - round(hit_probability(8, 47, 2), 3)) < 1e-12
+    for hole in (["Ah", "Kd"], ["As", "Ks"]):
+        high = evaluator.evaluate_hand(HoleCards.from_strings(hole), Board.from_strings(["7c", "4s", "2h"]))
+        assert not high.has_draw and high.draw_outs == 0 and high.draw_equity == 0.0
+
+    # Range'e karşı iki sokaklık equity tam sayımla
+    result = evaluator.calculate_draw_equity(
+        HoleCards.from_strings(["9h", "8h"]), Board.from_strings(["Th", "7c", "2h"]), {"AA", "TT"}
+    )
+    print(f"Combo draw vs AA/TT: {result}")
+    assert result.exact
+    assert 0.4 < result.equity < 0.6
+
+
+def test_hand_ranking():
+    """Nut / second nut ve yüzdelik tüm rakip elleriyle tutarlı."""
+    import hand_ranking
+    from hand_ranking import HandRanker
+
+    ranker = HandRanker()
+    cases = [
+        (["Ah", "5h"], ["Kh", "Qh", "7h", "2c", "3d"], True, False),
+        # Ax flush'lar kicker'a göre birden çok el değeri: second nut değil
+        (["Kh", "5h"], ["Qh", "7h", "2h", "3c", "8d"], False, False),
+        (["Qc", "Qd"], ["Kh", "Qh", "7s", "3c", "8d"], False, True),  # sadece KK geçer
+        (["7c", "7d"], ["7h", "7s", "2c"], True, False),
+        (["Jc", "9d"], ["Kh", "Qh", "7s", "3c", "8d"], False, False),
+        # K-high ve A-high straight ayrı iki el değeri
+        (["9c", "8d"], ["Qs", "Jd", "Tc", "3h", "2s"], False, False),
+        (["Kc", "9d"], ["Qs", "Jd", "Tc", "3h", "2s"], False, True),  # sadece AK geçer
+    ]
+    for hole, board, is_nut, is_second_nut in cases:
+        ranking = ranker.rank(HoleCards.from_strings(hole).indices, Board.from_strings(board).indices)
+        print(f"\n{hole} {board}: pct {ranking.percentile:.3f}, nut {ranking.is_nut}")
+        assert (ranking.is_nut, ranking.is_second_nut) == (is_nut, is_second_nut)
+
+    # Toplu sayım saf Python sayımla birebir aynı
+    rng = random.Random(15)
+    lookup = LookupEvaluator()
+    for _ in range(20):
+        cards = rng.sample(range(52), 2 + rng.choice((3, 4, 5)))
+        hole, board = cards[:2], cards[2:]
+        batch = ranker.rank(hole, board)
+        hand_ranking.NUMPY_AVAILABLE = False
+        try:
+            assert ranker.rank(hole, board) == batch
+        finally:
+            hand_ranking.NUMPY_AVAILABLE = True
+        assert batch.total == len(list(combinations(set(range(52)) - set(cards), 2)))
+        assert batch.hand_rank == lookup.evaluate(cards)
+
+    strength = HandEvaluator().evaluate_hand(
+        HoleCards.from_strings(["Qc", "Qd"]), Board.from_strings(["Kh", "Qh", "7s", "3c", "8d"])
+    )
+    assert strength.is_second_nut and not strength.is_nut
+    assert strength.percentile > 0.99
+
+
+def test_hand_potential():
+    """Equity dağılımı tam sayımla tutarlı; PPot / NPot ve cache."""
+    from equity import RangeEquity
+    from hand_potential import PotentialCalculator
+
+    calculator = PotentialCalculator()
+    board = Board.from_strings(["Th", "7c", "2h"])
+    draw = HoleCards.from_strings(["9h", "8h"])
+    overpair = HoleCards.from_strings(["Ah", "Ad"])
+
+    for hole, villain_range in ((draw, None), (overpair, {"TT", "AT", "KQs"})):
+        potential = calculator.analyze(hole.indices, board.indices, villain_range)
+        exact = RangeEquity().equity(hole.indices, villain_range, board.indices)
+        print(f"\n{hole}: HS {potential.hand_strength:.3f}, EHS {potential.ehs:.3f}, "
+              f"PPot {potential.ppot:.3f}, NPot {potential.npot:.3f}")
+        assert abs(potential.equity - exact.equity) < 1e-9
+        assert abs(sum(potential.histogram) - 1.0) < 1e-9
+        assert potential.equity ** 2 <= potential.ehs2 <= potential.equity + 1e-12
+        assert potential.runouts == 1081
+
+    # Draw: şu an geride, öne geçme potansiyeli yüksek; overpair tersi
+    draw_potential = calculator.analyze(draw.indices, board.indices)
+    overpair_potential = calculator.analyze(overpair.indices, board.indices)
+    assert draw_potential.hand_strength < 0.3 < 0.5 < draw_potential.ppot
+    assert overpair_potential.npot < draw_potential.ppot
+
+    # River'da potansiyel yok, dağılım tek noktada
+    river = Board.from_strings(["Th", "7c", "2h", "3d", "Qs"])
+    potential = calculator.analyze(overpair.indices, river.indices)
+    assert potential.ppot == potential.npot == 0.0
+    assert potential.equity == potential.hand_strength
+
+    # İzomorf el cache'ten gelir
+    hits = calculator.cache.hits
+    spades = HoleCards.from_strings(["9s", "8s"])
+    calculator.analyze_range({"98s"}, board.indices)
+    assert calculator.cache.hits > hits
+    assert calculator.analyze(spades.indices, board.indices).frozen
+
+    # HandEvaluator giriş noktası aynı sonucu verir
+    flush_draw = HoleCards.from_strings(["Ah", "Kh"])
+    flop = Board.from_strings(["Qh", "7h", "2c"])
+    potential = HandEvaluator().calculate_hand_potential(flush_draw, flop)
+    assert abs(potential.equity - calculator.analyze(flush_draw.indices, flop.indices).equity) < 1e-12
+    assert potential.ppot > 0.3 and potential.runouts == 1081
+
+
+def test_blocker_analysis():
+    """Kart çıkarma: kategori deltaları brute force ile aynı, blockers dolu."""
+    from blockers import BlockerAnalyzer
+    from ranges import parse_range
+
+    analyzer = BlockerAnalyzer()
+    lookup = LookupEvaluator()
+    board = Board.from_strings(["Kh", "9h", "4h", "7c", "Js"])
+    hole = HoleCards.from_strings(["Ah", "2c"])
+    villain = parse_range("77+, ATs+, KQo, A5s-A2s:0.5, QJs, T8s")
+
+    analysis = analyzer.analyze(hole.indices, board.indices, villain)
+    print(f"\nAh2c blockers: {analysis.blocked}, value {analysis.value_share:.2f}, "
+          f"bluff {analysis.bluff_share:.2f}")
+
+    # Brute force: hero kartını içeren range kombinasyonları
+    expected = Counter()
+    for c1, c2, w in villain.to_combos():
+        if {c1, c2} & set(board.indices) or not {c1, c2} & set(hole.indices):
+            continue
+        expected[rank_category(lookup.evaluate([c1, c2] + board.indices))] += w
+    assert analysis.category_deltas == dict(expected)
+    assert analysis.blocked == ['Flush']
+    assert analysis.value_share > analysis.bluff_share
+
+    # Kart başına deltalar, iki kartın ortak kombinasyonu yoksa toplamı verir
+    per_card = Counter()
+    for deltas in analysis.card_deltas.values():
+        per_card.update(deltas)
+    assert dict(per_card) == analysis.category_deltas
+
+    # Nut flush blocker'ı olmayan el, evaluate_hand üzerinden
+    strength = HandEvaluator().evaluate_hand(HoleCards.from_strings(["Ac", "2c"]), board)
+    assert 'Flush' not in strength.blockers
+    strength = HandEvaluator().evaluate_hand(hole, board)
+    assert 'Flush' in strength.blockers
+    assert analyzer.analyze(hole.indices, Board().indices).category_deltas == {}
+
+
+def test_equity_session():
+    """Turn / river equity'si flop kayıtlarından türetilir, doğrudan hesapla aynı."""
+    from equity import RangeEquity
+
+    engine = RangeEquity()
+    hole = HoleCards.from_strings(["9h", "8h"])
+    runout = Board.from_strings(["Th", "7c", "2h", "3d", "Qs"]).indices
+    for villain_range in ({"AA", "TT", "AT", "KQs"}, None):
+        session = HandEvaluator().equity_session(hole, villain_range)
+        for street in (3, 4, 5):
+            derived = session.equity(runout[:street])
+            direct = engine.equity(hole.indices, villain_range, runout[:street])
+            assert derived.exact and abs(derived.equity - direct.equity) < 1e-12
+        assert session.get_stats() == {"computed": 1, "derived": 2}
+
+        next_cards = session.next_card_equity(runout[:4])
+        expected = engine.next_card_equity(hole.indices, villain_range, runout[:4])
+        assert next_cards.keys() == expected.keys()
+        assert all(abs(next_cards[c] - expected[c]) < 1e-12 for c in expected)
+
+    # Yeni flop kökü yeniden hesaplatır
+    other = Board.from_strings(["As", "Kd", "5c"]).indices
+    result = session.equity(other)
+    print(f"\nSession on new flop: {result}")
+    assert session.get_stats()["computed"] == 2
+    assert abs(result.equity - engine.equity(hole.indices, None, other).equity) < 1e-12
+
+
+def test_evaluate_hand_classification():
+    """evaluate_hand kategori ve açıklama üretmeli."""
+    evaluator = HandEvaluator()
+
+    strength = evaluator.evaluate_hand(
+        HoleCards.from_strings(["7s", "7h"]),
+        Board.from_strings(["7d", "8s", "9s"])
+    )
+    print(f"\n77 on 789: {strength.made_hand_desc} ({strength.hand_category.name})")
+    assert strength.hand_category.name == "THREE_OF_A_KIND"
+    assert strength.uses_both_cards
+
+    strength = evaluator.evaluate_hand(
+        HoleCards.from_strings(["2c", "3d"]),
+        Board.from_strings(["Ah", "Kh", "Qh", "Jh", "Th"])
+    )
+    print(f"Board royal: {strength.made_hand_desc}")
+    assert strength.hand_category.name == "ROYAL_FLUSH"
+    assert not strength.uses_both_cards
+
+    # Nut / blocker analizi sadece okunduğunda ve bir kez yapılır; board
+    # sonradan değişse de değerlendirilen kartlara göre
+    calls = []
+    rank = evaluator._ranker.rank
+    evaluator._ranker.rank = lambda hole, board: calls.append(1) or rank(hole, board)
+    board = Board.from_strings(["Ah", "Kh", "Qh", "2c"])
+    strength = evaluator.evaluate_hand(HoleCards.from_strings(["Jh", "Th"]), board)
+    assert not calls
+    board.add_card(Card.from_string("Ac"))
+    assert strength.is_nut and strength.percentile == 1.0 and not calls[1:]
+    assert strength.is_nut and len(calls) == 1
+
+
+def test_string_ranges():
+    """Kısa notasyon metni her equity API'sinde notasyon kümesiyle aynı sonucu verir."""
+    evaluator = HandEvaluator()
+    kings = HoleCards.from_strings(["Kh", "Kd"])
+    flop = Board.from_strings(["Qh", "7c", "2d"])
+    text, notations = 'QQ+', {'QQ', 'KK', 'AA'}
+
+    assert evaluator.calculate_preflop_equity(kings, text) == \
+        evaluator.calculate_preflop_equity(kings, notations)
+    assert evaluator.calculate_draw_equity(kings, flop, text).equity == \
+        evaluator.calculate_draw_equity(kings, flop, notations).equity
+    assert evaluator.calculate_range_equity(text, 'AKs', flop).equity == \
+        evaluator.calculate_range_equity(notations, {'AKs'}, flop).equity
+    assert evaluator.calculate_multiway_equity(kings, flop, ['AA', 'QQ'], iterations=2000, seed=5).equities == \
+        evaluator.calculate_multiway_equity(kings, flop, [{'AA'}, {'QQ'}], iterations=2000, seed=5).equities
+
+    # Metin range'i karakterlerine göre değil, kendisiyle cache'lenir
+    potential = evaluator.calculate_hand_potential(kings, flop, text)
+    assert potential == evaluator.calculate_hand_potential(kings, flop, notations)
+    assert evaluator._potential._cache_key(kings.indices, flop.indices, text)[2] == text
+
+
+def test_injectable_rng():
+    """Aynı RNG seed'i global random durumundan bağımsız olarak aynı sonucu verir."""
+    from constants import Street
+    from data_classes import GameState
+    from rng import derive_seed, split_seeds, spawn
+    from strategy import BetSizer, PostflopStrategy
+
+    hole = HoleCards.from_strings(["Ah", "Kd"])
+    flop = Board.from_strings(["Qh", "7c", "2h"])
+    runs = []
+    for perturb in (1, 2):
+        random.seed(perturb)
+        evaluator = HandEvaluator(rng=7)
+        runs.append((
+            evaluator.calculate_equity_monte_carlo(hole, flop, 2000),
+            evaluator.calculate_equity_monte_carlo(hole, flop, 2000, vectorized=True),
+            evaluator.estimate_equity(hole, flop, max_samples=5000).equity
+        ))
+    assert runs[0] == runs[1]
+
+    deals = random.Random(3)
+    states = []
+    for i in range(40):
+        cards = deals.sample(range(52), 5)
+        states.append(GameState(
+            street=Street.FLOP,
+            hero_hand=HoleCards(Card.from_index(cards[0]), Card.from_index(cards[1])),
+            board=Board([Card.from_index(c) for c in cards[2:]]),
+            pot=6.0, current_bet=3.0 * (i % 2), hero_stack=97.0, villain_stack=94.0
+        ))
+    decisions = []
+    for perturb in (1, 2):
+        random.seed(perturb)
+        strategy = PostflopStrategy(cache_size=64, rng=11)
+        decisions.append([(a.action, a.amount) for a in map(strategy.decide, states)])
+    assert decisions[0] == decisions[1]
+
+    sizers = (BetSizer(rng=5), BetSizer(rng=5))
+    raises = [[s.calculate_raise_size(10.0, 5.0, True, 8.0) for _ in range(20)] for s in sizers]
+    assert raises[0] == raises[1] and len(set(raises[0])) > 1
+
+    # Seed bölme: kararlı, bağımsız alt seed'ler
+    assert split_seeds(42, 4) == split_seeds(42, 4)
+    assert len(set(split_seeds(42, 1000))) == 1000
+    assert derive_seed(42, 'shard', 0) != derive_seed(42, 'shard', 1) < 2 ** 63
+    assert [r.random() for r in spawn(9, 3)] == [r.random() for r in spawn(9, 3)]
+
+
+if __name__ == "__main__":
+    test_card_representation()
+    test_lookup_matches_reference()
+    test_lookup_extremes()
+    test_rank_categories_and_descriptions()
+    test_monte_carlo_equity()
+    test_batch_matches_scalar()
+    test_exact_enumeration()
+    test_parallel_shards_reproducible()
+    test_adaptive_equity()
+    test_range_equity()
+    test_multiway_equity()
+    test_preflop_equity_table()
+    test_suit_isomorphism()
+    test_analysis_cache()
+    test_texture_table()
+    test_outs_engine()
+    test_hand_ranking()
+    test_hand_potential()
+    test_blocker_analysis()
+    test_equity_session()
+    test_evaluate_hand_classification()
+    test_string_ranges()
+    test_injectable_rng()
+    print("\nALL EVALUATOR TESTS PASSED")
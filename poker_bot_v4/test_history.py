@@ -0,0 +1,270 @@
+"""
+POKER BOT V4.0 - HAND HISTORY TESTS
+===================================
+PokerStars / GGPoker parser'ı ve kolon tabanlı el deposu.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from constants import ActionType, Position, Street
+from hand_history import HandHistoryParser, table_positions
+from history_store import HistoryStore, concat_columns, hand_key, take_rows
+
+SAMPLE = """\
+PokerStars Hand #243587445678:  Hold'em No Limit ($0.05/$0.10 USD) - 2023/03/14 19:23:45 ET
+Table 'Aludra III' 6-max Seat #3 is the button
+Seat 1: villain1 ($10.23 in chips)
+Seat 2: Hero ($10 in chips)
+Seat 3: btnguy ($12.50 in chips)
+Seat 4: sbguy ($9.80 in chips)
+Seat 5: bbguy ($10.40 in chips)
+Seat 6: sitter ($5 in chips) is sitting out
+sbguy: posts small blind $0.05
+bbguy: posts big blind $0.10
+*** HOLE CARDS ***
+Dealt to Hero [Ah Kd]
+villain1: folds
+Hero: raises $0.20 to $0.30
+btnguy: folds
+sbguy: folds
+bbguy: calls $0.20
+*** FLOP *** [Kc 7h 2d]
+bbguy: checks
+Hero: bets $0.40
+bbguy: calls $0.40
+*** TURN *** [Kc 7h 2d] [5s]
+bbguy: checks
+Hero: bets $1
+bbguy: raises $2 to $3
+Hero: calls $2
+*** RIVER *** [Kc 7h 2d 5s] [Jd]
+bbguy: bets $6.30 and is all-in
+Hero: calls $6.30 and is all-in
+*** SHOW DOWN ***
+bbguy: shows [7c 7d] (three of a kind, Sevens)
+Hero: shows [Ah Kd] (a pair of Kings)
+bbguy collected $19.45 from pot
+*** SUMMARY ***
+Total pot $20.05 | Rake $0.60
+Board [Kc 7h 2d 5s Jd]
+Seat 2: Hero showed [Ah Kd] and lost with a pair of Kings
+Seat 5: bbguy (big blind) showed [7c 7d] and won ($19.45) with three of a kind, Sevens
+
+
+
+PokerStars Hand #243587445679:  Hold'em No Limit ($0.05/$0.10 USD) - 2023/03/14 19:24:30 ET
+Table 'Aludra III' 6-max Seat #4 is the button
+Seat 1: villain1 ($10.23 in chips)
+Seat 2: Hero ($9.70 in chips)
+Seat 4: sbguy ($9.75 in chips)
+Seat 5: bbguy ($20.15 in chips)
+bbguy: posts small blind $0.05
+villain1: posts big blind $0.10
+*** HOLE CARDS ***
+Dealt to Hero [9s 9c]
+Hero: raises $0.15 to $0.25
+sbguy: folds
+bbguy: folds
+villain1: folds
+Uncalled bet ($0.15) returned to Hero
+Hero collected $0.25 from pot
+Hero: doesn't show hand
+*** SUMMARY ***
+Total pot $0.25 | Rake $0
+Seat 2: Hero collected ($0.25)
+
+Poker Hand #RC1234567890: Hold'em No Limit ($0.01/$0.02) - 2023/05/01 08:00:01
+Table 'RushAndCash123' 6-max Seat #2 is the button
+Seat 1: Hero ($2.00 in chips)
+Seat 2: abc123 ($2.50 in chips)
+abc123: posts small blind $0.01
+Hero: posts big blind $0.02
+*** HOLE CARDS ***
+Dealt to Hero [Qs Js]
+Dealt to abc123 
+abc123: calls $0.01
+Hero: checks
+*** FLOP *** [Ts 9s 2c]
+Hero: bets $0.04
+abc123: folds
+Uncalled bet ($0.04) returned to Hero
+*** SHOWDOWN ***
+Hero collected $0.04 from pot
+*** SUMMARY ***
+Total pot $0.04 | Rake $0 | Jackpot $0 | Bingo $0
+Board [Ts 9s 2c]
+
+garbage line outside hand
+PokerStars Hand #1: broken header without stakes
+Dealt to Hero [Xx Yy]
+"""
+
+
+def _parse():
+    parser = HandHistoryParser()
+    return parser, list(parser.parse(io.StringIO(SAMPLE)))
+
+
+def test_table_positions():
+    """Button'a göre pozisyonlar, heads-up ve dead button."""
+    assert table_positions([1, 2, 3, 4, 5, 6], 3) == {
+        3: Position.BTN, 4: Position.SB, 5: Position.BB,
+        6: Position.UTG, 1: Position.MP, 2: Position.CO
+    }
+    assert table_positions([2, 7], 7) == {7: Position.BTN, 2: Position.BB}
+    # Boş koltuktaki button: önceki oyuncu button sayılır
+    positions = table_positions([1, 4, 6], 5)
+    assert positions[4] == Position.BTN and positions[6] == Position.SB and positions[1] == Position.BB
+
+
+def test_parse_hands():
+    """Showdown'lu 6-max el, preflop fold ve GG heads-up el; bozuk el atlanır."""
+    parser, (showdown, steal, gg) = _parse()
+    assert parser.get_stats() == {"hands": 3, "skipped": 1}
+
+    state = showdown.state
+    assert showdown.hand_id == "243587445678" and showdown.hero == "Hero"
+    assert str(state.hero_hand) == "AhKd" and len(state.board.indices) == 5
+    assert state.hero_position == Position.CO and state.villain_position == Position.BB
+    assert state.street == Street.RIVER and state.pot == 20.05 and showdown.rake == 0.6
+    assert showdown.net == -10.0 and showdown.net_bb == -100.0 and showdown.showdown
+    assert showdown.players == 5 and showdown.timestamp == 1678821825
+    # Flop başı: 2 x 0.30 + SB 0.05; efektif stack 10 - 0.30
+    assert abs(showdown.flop_pot - 0.65) < 1e-9 and abs(showdown.flop_stack - 9.7) < 1e-9
+    turn = [(a.action, a.amount, a.description) for a in state.actions_turn]
+    assert turn == [
+        (ActionType.CHECK, 0.0, "bbguy"), (ActionType.BET, 1.0, "Hero"),
+        (ActionType.RAISE, 3.0, "bbguy"), (ActionType.CALL, 2.0, "Hero")
+    ]
+    assert state.actions_river[0].action == ActionType.ALL_IN
+
+    # Uncalled bet iadesi: net = kazanılan blind'lar
+    assert abs(steal.net - 0.15) < 1e-9 and not steal.showdown and steal.flop_pot == 0.0
+    assert steal.state.hero_position == Position.CO and steal.state.villain_position == Position.BB
+    assert [a.action for a in steal.state.actions_preflop] == [ActionType.RAISE] + [ActionType.FOLD] * 3
+
+    assert gg.hand_id == "RC1234567890" and gg.players == 2
+    assert gg.state.hero_position == Position.BB and gg.state.villain_position == Position.BTN
+    # GG her elde SHOWDOWN başlığı yazar; rakip fold ettiyse showdown yok
+    assert abs(gg.net - 0.02) < 1e-9 and gg.state.street == Street.FLOP and not gg.showdown
+
+
+def test_history_store():
+    """Chunk'lara yazma, id ile erişim, tarih sorgusu, tekrar ayıklama ve yeniden açma."""
+    path = tempfile.mkdtemp()
+    try:
+        # Sadece tam chunk'lar yazılır; kuyruk flush() ile pending.npz'e
+        store = HistoryStore(path, chunk_size=2)
+        assert store.ingest(io.StringIO(SAMPLE)) == 3
+        assert len(store) == 3 and len(store.manifest) == 1 and store.get_stats()["pending"] == 1
+        assert store.ingest(io.StringIO(SAMPLE)) == 0 and store.duplicates == 3
+        assert len(HistoryStore(path, chunk_size=2)) == 2
+        store.flush()
+        assert len(store.manifest) == 1
+
+        _, records = _parse()
+        reopened = HistoryStore(path, chunk_size=2)
+        assert len(reopened) == 3 and "RC1234567890" in reopened and "1" not in reopened
+        for original in records:
+            loaded = reopened.get(original.hand_id)
+            assert loaded.state.hero_hand == original.state.hero_hand
+            assert loaded.state.board.indices == original.state.board.indices
+            assert loaded.state.hero_position == original.state.hero_position
+            assert (loaded.net, loaded.showdown, loaded.flop_pot) == (original.net, original.showdown, original.flop_pot)
+            assert [(a.action, a.amount) for a in loaded.state.actions_turn] == \
+                [(a.action, a.amount) for a in original.state.actions_turn]
+        assert reopened.get("243587445678").state.actions_turn[2].description == "BB"
+
+        # 2023/03 elleri ilk chunk'ta; GG eli (2023/05) kuyrukta
+        march = reopened.query(1678800000, 1678900000, columns=('hand_id', 'net'))
+        assert list(march['hand_id']) == ["243587445678", "243587445679"]
+        assert list(reopened.query(start=1680000000)['hand_id']) == ["RC1234567890"]
+        assert [c for c, _ in reopened.chunks(start=0, columns=('net',))] == [0]
+        assert list(reopened.tail(('hand_id',))['hand_id']) == ["RC1234567890"]
+    finally:
+        shutil.rmtree(path)
+
+
+def test_index_segments():
+    """Her chunk yeni bir index segmenti ekler; eşit boyutlu segmentler birleştirilir."""
+    path = tempfile.mkdtemp()
+    try:
+        store = HistoryStore(path, chunk_size=1)
+        assert store.ingest(io.StringIO(SAMPLE)) == 3 and len(store.manifest) == 3
+        # Segment boyutları ikili sayaç gibi: 1 -> 2 -> 2 + 1
+        assert [(info['first'], info['last']) for info in store.index] == [(0, 1), (2, 2)]
+        files = sorted(name for name in os.listdir(path) if name.startswith("index"))
+        assert files == ["index_00000_00001.npz", "index_00002_00002.npz"]
+
+        reopened = HistoryStore(path, chunk_size=1)
+        for hand_id, chunk in (("243587445678", 0), ("243587445679", 1), ("RC1234567890", 2)):
+            assert reopened._find(hand_key(hand_id)) == (chunk, 0)
+        assert reopened.ingest(io.StringIO(SAMPLE)) == 0 and reopened.duplicates == 3
+    finally:
+        shutil.rmtree(path)
+
+
+def test_column_blocks():
+    """Satır seçimi ve birleştirme aksiyon offset'lerini korur."""
+    from history_store import records_to_columns
+    _, records = _parse()
+    columns = records_to_columns(records)
+    assert list(np.diff(columns['act_offsets'])) == [14, 4, 4]
+    tail = take_rows(columns, np.array([1, 2]))
+    assert list(tail['act_offsets']) == [0, 4, 8]
+    merged = concat_columns([take_rows(columns, np.array([0])), tail])
+    for name, column in columns.items():
+        assert np.array_equal(merged[name], column), name
+
+
+def test_leak_report():
+    """Pozisyon / texture / SPR / line grupları ve sadece yeni chunk'ları işleyen artımlı güncelleme."""
+    from leak_report import LeakAnalyzer, line_label
+    path = tempfile.mkdtemp()
+    try:
+        store = HistoryStore(path, chunk_size=2)
+        store.ingest(io.StringIO(SAMPLE))
+        analyzer = LeakAnalyzer(store)
+        # İlk chunk işlenir; kuyruktaki GG eli rapora eklenir ama kaydedilmez
+        assert analyzer.update() == 2 and analyzer.update() == 0
+        report = analyzer.report()
+        print(f"\n{report}")
+
+        assert report.total.hands == 3 and report.total.showdown_hands == 1
+        assert abs(report.total.bb_per_100 - 100 * (-100 + 1.5 + 1) / 3) < 1e-3
+        positions = {s.label: s.hands for s in report.by_position}
+        assert positions == {"CO": 2, "BB": 1}
+        # Flop gören iki el: Kc7h2d ve Ts9s2c; SPR 9.7 / 0.65 ~ 14.9 ve 1.98 / 0.04
+        assert sum(s.hands for s in report.by_texture) == 2
+        assert {s.label: s.hands for s in report.by_spr} == {"SPR 10-20": 1, "SPR 20+": 1}
+        lines = {s.label: s.bb_per_100 for s in report.by_line}
+        assert set(lines) == {"PF:R F:B T:BC R:C", "PF:R", "PF:X F:B"}
+        assert abs(lines["PF:R"] - 150) < 1e-3
+        assert line_label(0) == "(aksiyon yok)"
+
+        # Yeni session: sadece yeni chunk okunur, sonuç sıfırdan hesapla aynı
+        session = SAMPLE.split("\n\n\n")[0].replace("#243587445678", "#243587445700")
+        assert store.ingest(io.StringIO(session)) == 1
+        assert analyzer.update() == 2 and len(analyzer.chunk_rows) == 2
+        reopened = LeakAnalyzer(HistoryStore(path, chunk_size=2))
+        assert reopened.update() == 0
+        fresh = LeakAnalyzer(store, path=path + "/fresh.npz")
+        assert str(fresh.report()) == str(reopened.report()) == str(analyzer.report())
+        assert reopened.report().total.hands == 4
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == "__main__":
+    test_table_positions()
+    test_parse_hands()
+    test_history_store()
+    test_index_segments()
+    test_column_blocks()
+    test_leak_report()
+    print("\nALL HAND HISTORY TESTS PASSED")
@@ -0,0 +1,135 @@
+"""
+POKER BOT V4.0 - RANGE TESTS
+============================
+Range sınıfı, tablo dönüşümleri ve equity API'leriyle uyumu.
+"""
+
+from constants import Position
+from data_classes import Board, HoleCards
+from preflop_ranges import (
+    get_rfi_range, get_bb_defense_range, calculate_range_percentage, range_to_combos
+)
+from ranges import Range, NUM_COMBOS, combo_index, rfi_range, bb_defense_range
+
+
+def test_range_from_tables():
+    """Notasyon tablolarından Range ve geri dönüşüm kayıpsız."""
+    for position in (Position.UTG, Position.CO, Position.BTN):
+        table = get_rfi_range(position)
+        hand_range = rfi_range(position)
+        assert hand_range.to_set() == table
+        assert Range.from_notation(hand_range.to_notation()) == hand_range
+        assert abs(hand_range.percentage() - calculate_range_percentage(table)) < 1e-9
+        print(f"\n{position.name} RFI: {hand_range}")
+
+    assert Range.from_notation({'AA'}).num_combos() == 6
+    assert Range.from_notation({'AKs'}).num_combos() == 4
+    assert Range.from_notation({'AKo': 0.5}).num_combos() == 6
+    assert Range.full().num_combos() == NUM_COMBOS
+    assert combo_index(51, 50) == combo_index(50, 51) == NUM_COMBOS - 1
+
+
+def test_range_operations():
+    """Birleşim, kesişim, fark, ölçekleme ve ölü kart çıkarma."""
+    pairs = Range.from_notation({'AA', 'KK', 'QQ'})
+    aces = Range.from_notation({'AA': 0.5, 'AKs': 1.0})
+
+    union = pairs | aces
+    assert union.to_notation() == {'AA': 1.0, 'KK': 1.0, 'QQ': 1.0, 'AKs': 1.0}
+    assert (pairs & aces).to_notation() == {'AA': 0.5}
+    assert (pairs - aces).to_set() == {'KK', 'QQ'}
+    assert (pairs * 0.25).num_combos() == 18 * 0.25
+    assert (pairs * 3).num_combos() == 18  # 0-1 aralığına kırpılır
+    assert 'AKs' in aces and 'AKo' not in aces
+
+    # Board'da bir as: AA 3, AKs 3 kombinasyona iner
+    board = Board.from_strings(["Ah", "7d", "2c"]).indices
+    assert Range.from_notation({'AA'}).num_combos(dead=board) == 3
+    assert aces.num_combos(dead=board) == 3 * 0.5 + 3
+    removed = aces.remove_cards(board)
+    assert removed.num_combos() == aces.num_combos(dead=board)
+    assert removed.to_notation()['AKs'] == 0.75
+
+    # Değer nesnesi: eşit range'ler aynı hash
+    assert hash(Range.from_notation({'KK', 'AA'})) == hash(Range.from_notation({'AA', 'KK'}))
+    assert len({pairs, Range.from_notation({'QQ', 'KK', 'AA'})}) == 1
+
+
+def test_range_in_equity_apis():
+    """Range, notasyon kümesiyle aynı sonuçları verir."""
+    from equity import RangeEquity
+    from hand_evaluator import HandEvaluator
+    from preflop_equity import get_preflop_table
+
+    flop = Board.from_strings(["Ah", "7d", "2c"])
+    utg, bb = get_rfi_range(Position.UTG), get_bb_defense_range(Position.UTG)
+    engine = RangeEquity()
+    expected = engine.equity(utg, bb, flop.indices)
+    result = engine.equity(rfi_range(Position.UTG), bb_defense_range(Position.UTG), flop.indices)
+    print(f"\nUTG vs BB (Range): {result}")
+    assert abs(result.equity - expected.equity) < 1e-12
+
+    assert sorted(range_to_combos(rfi_range(Position.UTG))) == sorted(
+        (min(c1, c2), max(c1, c2), w) for c1, c2, w in range_to_combos(utg)
+    )
+
+    hole = HoleCards.from_strings(["Kh", "Kd"])
+    table = get_preflop_table()
+    assert abs(
+        table.hand_vs_range(hole.indices, rfi_range(Position.UTG))
+        - table.hand_vs_range(hole.indices, utg)
+    ) < 1e-9
+
+    evaluator = HandEvaluator()
+    weighted = {'AA': 0.5, 'AKs': 1.0, 'T9s': 1.0}
+    assert evaluator.calculate_draw_equity(hole, flop, Range.from_notation(weighted)).equity == \
+        evaluator.calculate_draw_equity(hole, flop, weighted).equity
+
+
+def test_range_parser():
+    """Kısa notasyon: aralıklar, ağırlıklar, memoization ve hatalar."""
+    import os
+    import tempfile
+    from preflop_ranges import is_hand_in_range
+    from ranges import parse_range, load_ranges
+
+    assert parse_range("77+, ATs+, KQs, AQo+") == rfi_range(Position.UTG)
+    assert parse_range("77+").to_set() == {'77', '88', '99', 'TT', 'JJ', 'QQ', 'KK', 'AA'}
+    assert parse_range("55-77") == parse_range("77-55") == parse_range("55, 66, 77")
+    assert parse_range("KTo+").to_set() == {'KTo', 'KJo', 'KQo'}
+    assert parse_range("AK").num_combos() == 16
+    assert parse_range("AhKh").num_combos() == 1
+
+    mixed = parse_range("77+, ATs+, KQo, A5s-A2s:0.5")
+    print(f"\n77+, ATs+, KQo, A5s-A2s:0.5 -> {mixed}")
+    assert mixed.to_notation()['A3s'] == 0.5
+    assert mixed.num_combos() == 8 * 6 + 4 * 4 + 12 + 4 * 4 * 0.5
+
+    # Aynı metin (boşluk farkı dahil) aynı derlenmiş nesne
+    assert parse_range("77+,  ATs+") is parse_range("77+, ATs+")
+    assert is_hand_in_range("A4s", "A5s-A2s") and not is_hand_in_range("A6s", "A5s-A2s")
+
+    for bad in ("AKx", "77s", "A5s-K2s", "A5s-A2o", "AA:2", "AhAh"):
+        try:
+            parse_range(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"Hata bekleniyordu: {bad}")
+
+    # Metin dosyasından kütüphane
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        f.write("# örnek\nUTG_RFI = 77+, ATs+, KQs, AQo+\nBTN_3BET = TT+, AQs+, AKo, A5s-A2s:0.5\n")
+    try:
+        library = load_ranges(f.name)
+    finally:
+        os.remove(f.name)
+    assert library['UTG_RFI'] == rfi_range(Position.UTG)
+    assert library['BTN_3BET'].num_combos() == 5 * 6 + 2 * 4 + 12 + 4 * 4 * 0.5
+
+
+if __name__ == "__main__":
+    test_range_from_tables()
+    test_range_operations()
+    test_range_in_equity_apis()
+    test_range_parser()
+    print("\nALL RANGE TESTS PASSED")
@@ -0,0 +1,169 @@
+"""
+POKER BOT V4.0 - SIMULATOR TESTS
+================================
+Heads-up el motoru, pot dağıtımı ve shard'lı self-play simülasyonu.
+"""
+
+import random
+
+from constants import ActionType, Street
+from data_classes import Board, HoleCards, PokerAction
+from simulator import HeadsUpEngine, SelfPlaySimulator, award_pots, make_policy
+
+
+class _Scripted:
+    """Sırayla verilen aksiyonları oynar, bitince check / call."""
+
+    def __init__(self, *actions):
+        self.actions = list(actions)
+
+    def decide(self, state):
+        if self.actions:
+            return self.actions.pop(0)
+        return PokerAction(ActionType.CALL, state.get_call_amount())
+
+
+def _deal(hole0, hole1, board):
+    return (
+        (tuple(HoleCards.from_strings(hole0).indices), tuple(HoleCards.from_strings(hole1).indices)),
+        tuple(Board.from_strings(board).indices)
+    )
+
+
+def test_award_pots():
+    """Ana pot, side pot, uncalled bet iadesi ve split."""
+    assert award_pots([10, 10], [5, 3]) == [20, 0]
+    assert award_pots([10, 10], [5, 5]) == [10, 10]
+    # Kısa stack kazanır: sadece karşıladığı kısmı alır, fazlası geri döner
+    assert award_pots([30, 100], [9, 1]) == [60, 70]
+    # Fold: pot kalan oyuncunun
+    assert award_pots([2.5, 1.0], [0, None]) == [3.5, 0]
+    # Üç oyunculu side pot: en kısa stack ana potu, ortanca side pot'u alır
+    assert award_pots([10, 50, 50], [9, 5, 1]) == [30, 80, 0]
+
+
+def test_engine_legal_actions():
+    """Bedava fold check'e, min altı raise min-raise'e, stack üstü all-in'e çevrilir."""
+    engine = HeadsUpEngine()
+    deal = _deal(["Ah", "As"], ["7c", "2d"], ["Kc", "8h", "3s", "9d", "Jc"])
+
+    # Koltuk 1 (BB) limp'e karşı fold -> check; postflop herkes check
+    outcome = engine.play_hand(
+        (_Scripted(PokerAction(ActionType.CALL, 0.5)), _Scripted(PokerAction(ActionType.FOLD))),
+        button=0, deal=deal
+    )
+    kinds = [a.action for _, street, a in outcome.actions if street == Street.PREFLOP]
+    assert kinds == [ActionType.CALL, ActionType.CHECK]
+    assert outcome.showdown and outcome.profits == (1.0, -1.0)
+
+    # 1.5 bb'ye raise -> min-raise 2 bb; 500'e raise -> all-in (100 bb)
+    outcome = engine.play_hand(
+        (_Scripted(PokerAction(ActionType.RAISE, 1.5)), _Scripted(PokerAction(ActionType.RAISE, 500))),
+        button=0, deal=deal
+    )
+    first, second, call = [a for _, _, a in outcome.actions[:3]]
+    assert (first.action, first.amount) == (ActionType.RAISE, 2.0)
+    assert (second.action, second.amount) == (ActionType.ALL_IN, 100.0)
+    assert call.action == ActionType.CALL and outcome.all_in_street == Street.PREFLOP
+    assert outcome.profits == (100.0, -100.0) and len(outcome.board) == 5
+
+    # Bet karşısında check -> fold
+    outcome = engine.play_hand(
+        (_Scripted(PokerAction(ActionType.RAISE, 3)), _Scripted(PokerAction(ActionType.CHECK))),
+        button=0, deal=deal
+    )
+    assert outcome.actions[-1][2].action == ActionType.FOLD
+    assert outcome.profits == (1.0, -1.0) and not outcome.showdown and outcome.board == ()
+
+
+def test_engine_side_pot():
+    """Eşit olmayan stack'ler: uncalled kısım büyük stack'e döner."""
+    engine = HeadsUpEngine()
+    deal = _deal(["7c", "2d"], ["Ah", "As"], ["Kc", "8h", "3s", "9d", "Jc"])
+    shove = PokerAction(ActionType.ALL_IN)
+    outcome = engine.play_hand((_Scripted(shove), _Scripted(shove)), button=0, deal=deal, stacks=(100, 30))
+    assert outcome.profits == (-30.0, 30.0)
+    assert outcome.pot == 60.0
+
+    rng = random.Random(7)
+    policies = (make_policy('random'), make_policy('pushfold'))
+    for i in range(300):
+        outcome = engine.play_hand(policies, button=i % 2, rng=rng, stacks=(100, 40 + i % 50))
+        assert abs(sum(outcome.profits)) < 1e-9
+        assert -100 <= outcome.profits[0] <= 40 + i % 50
+
+
+def test_self_play_simulator():
+    """Shard'lı sonuç worker sayısından bağımsız ve seed ile tekrarlanabilir."""
+    simulator = SelfPlaySimulator('strategy', 'station', workers=1, shard_size=100)
+    result = simulator.run(300, seed=11)
+    print(f"\nstrategy vs station: {result}")
+    assert result.hands == 300
+    assert result.ci_low < result.bb_per_100 < result.ci_high
+    assert abs(result.bb_per_100 - 100 * result.profit / result.hands) < 1e-9
+
+    parallel = SelfPlaySimulator('strategy', 'station', workers=2, shard_size=100).run(300, seed=11)
+    assert parallel == result
+
+    try:
+        make_policy('unknown')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Bilinmeyen politika hata vermeli")
+
+
+def test_all_in_ev():
+    """All-in EV: tam sayım ve örnekleme, sonuç yerine equity x pot."""
+    from equity import RangeEquity
+    from simulator import all_in_equity
+    deal = _deal(["Ah", "As"], ["Kc", "Kd"], ["Ks", "7c", "2d", "9h", "3c"])
+    flop = deal[1][:3]
+    # Flop'ta 990 runout tam sayılır
+    exact = all_in_equity(deal[0], flop)
+    assert abs(exact - RangeEquity().equity(deal[0][0], deal[0][1], flop).equity) < 1e-12
+    assert exact < 0.1
+    preflop = all_in_equity(deal[0], (), seed=1)
+    assert abs(preflop - 0.82) < 0.03
+    assert all_in_equity(deal[0], (), seed=1) == preflop
+
+    engine = HeadsUpEngine()
+    shove = PokerAction(ActionType.ALL_IN)
+    outcome = engine.play_hand((_Scripted(shove), _Scripted(shove)), button=0, deal=deal)
+    assert outcome.all_in_street == Street.PREFLOP and outcome.profits == (-100.0, 100.0)
+    expected = engine.all_in_ev(outcome, seed=1)
+    assert abs(expected[0] - (preflop * 200 - 100)) < 1e-9 and expected[0] == -expected[1]
+
+
+def test_variance_reduction():
+    """Duplicate + all-in EV standart hatayı düşürür; aynı politika farkı sıfırdır."""
+    raw = SelfPlaySimulator('pushfold', 'station', workers=1).run(400, seed=3)
+    reduced = SelfPlaySimulator(
+        'pushfold', 'station', workers=1, duplicate=True, all_in_ev=True
+    ).run(400, seed=3)
+    print(f"\nraw: {raw}\nduplicate + all-in EV: {reduced}")
+    assert reduced.hands == 800 and reduced.duplicate and reduced.all_in_ev
+    assert reduced.std_error < raw.std_error / 3
+
+    # Common random numbers: aynı politika aynı deal ve kararları görür
+    simulator = SelfPlaySimulator('strategy', 'random', workers=1, shard_size=50)
+    same = simulator.compare('strategy', 'strategy', 100, seed=4)
+    assert same.difference == 0.0 and same.std_error == 0.0 and not same.significant
+    assert same.baseline == same.candidate
+
+    comparison = simulator.compare('pushfold', 'station', 200, seed=4)
+    print(f"station - pushfold (vs random): {comparison}")
+    assert comparison.ci_low < comparison.difference < comparison.ci_high
+    assert abs(
+        comparison.difference - (comparison.candidate.bb_per_100 - comparison.baseline.bb_per_100)
+    ) < 1e-6
+
+
+if __name__ == "__main__":
+    test_award_pots()
+    test_engine_legal_actions()
+    test_engine_side_pot()
+    test_self_play_simulator()
+    test_all_in_ev()
+    test_variance_reduction()
+    print("\nALL SIMULATOR TESTS PASSED")
@@ -0,0 +1,199 @@
+"""
+POKER BOT V4.0 - TEXTURE TABLE
+==============================
+Tüm kanonik flop / turn (isteğe bağlı river) board'ları için önceden
+hesaplanmış BoardAnalysis özellikleri. Kolonlar NumPy dizileri olarak
+texture_table.npz dosyasında tutulur; BoardAnalyzer.analyze tek bir
+tablo erişimine iner ve toplu sorgular mümkün olur:
+
+    table = get_texture_table()
+    rows = table.query(num_cards=3, same_suit_count=3, danger_level=(7, None))
+    flops = table.boards(rows)
+
+Kullanım (tabloyu yeniden üretmek için):
+    python texture_table.py [--rivers]
+"""
+
+import os
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from constants import RANKS, BoardTexture, TEXTURE_TABLE_FILE
+from data_classes import BoardAnalysis
+from isomorphism import canonical_board, canonical_boards
+
+# Bool kolonlar ve küçük tam sayı kolonları (BoardAnalysis alan adlarıyla)
+_BOOL_COLUMNS = (
+    'flush_possible', 'flush_draw_possible', 'straight_possible',
+    'straight_draw_possible', 'is_paired', 'is_double_paired', 'is_trips'
+)
+_INT_COLUMNS = ('same_suit_count', 'connected_count', 'broadway_count', 'danger_level')
+
+
+def _board_mask(cards: Sequence[int]) -> int:
+    mask = 0
+    for c in cards:
+        mask |= 1 << c
+    return mask
+
+
+def build_texture_table(street_sizes: Sequence[int] = (3, 4)) -> Dict[str, np.ndarray]:
+    """
+    Kanonik board'ların analiz kolonlarını üretir.
+
+    Args:
+        street_sizes: Board uzunlukları (3 = flop, 4 = turn, 5 = river)
+
+    Returns:
+        Kolon adı -> dizi sözlüğü (satırlar mask'a göre sıralı)
+    """
+    from hand_evaluator import BoardAnalyzer
+
+    analyzer = BoardAnalyzer(use_table=False)
+    boards = [board for size in street_sizes for board in canonical_boards(size)]
+    analyses = [analyzer.analyze_cards(list(board)) for board in boards]
+
+    masks = np.array([_board_mask(board) for board in boards], dtype=np.int64)
+    order = np.argsort(masks)
+
+    cards = np.full((len(boards), 5), -1, dtype=np.int8)
+    for i, board in enumerate(boards):
+        cards[i, :len(board)] = board
+
+    descriptions = sorted({a.description for a in analyses})
+    description_ids = {d: i for i, d in enumerate(descriptions)}
+
+    columns: Dict[str, np.ndarray] = {
+        'mask': masks,
+        'cards': cards,
+        'num_cards': np.array([len(b) for b in boards], dtype=np.int8),
+        'texture': np.array([a.texture.value for a in analyses], dtype=np.int8),
+        'pair_rank': np.array(
+            [RANKS.index(a.pair_rank) if a.pair_rank else -1 for a in analyses], dtype=np.int8
+        ),
+        'description_id': np.array(
+            [description_ids[a.description] for a in analyses], dtype=np.int16
+        ),
+        'descriptions': np.array(descriptions),
+    }
+    for name in _BOOL_COLUMNS:
+        columns[name] = np.array([getattr(a, name) for a in analyses], dtype=bool)
+    for name in _INT_COLUMNS:
+        columns[name] = np.array([getattr(a, name) for a in analyses], dtype=np.int8)
+
+    return {
+        name: column if name == 'descriptions' else column[order]
+        for name, column in columns.items()
+    }
+
+
+def default_table_path() -> str:
+    """Modülün yanındaki tablo dosyası."""
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), TEXTURE_TABLE_FILE)
+
+
+class TextureTable:
+    """
+    Kolon tabanlı board texture tablosu.
+
+    Satırlar kanonik board maskesine göre sıralıdır; tekil sorgular
+    dict ile, toplu sorgular NumPy maskeleriyle yapılır.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self.columns = columns
+        self._rows = {mask: row for row, mask in enumerate(columns['mask'].tolist())}
+        self._fields: Dict[int, dict] = {}
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> 'TextureTable':
+        with np.load(path or default_table_path()) as data:
+            return cls({name: data[name] for name in data.files})
+
+    def save(self, path: Optional[str] = None) -> None:
+        np.savez_compressed(path or default_table_path(), **self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns['mask'])
+
+    def row(self, cards: Sequence[int]) -> Optional[int]:
+        """Board'un satır indeksi (tabloda yoksa None)."""
+        canonical, _ = canonical_board(cards)
+        return self._rows.get(_board_mask(canonical))
+
+    def analysis(self, row: int) -> BoardAnalysis:
+        """
+        Satırdan BoardAnalysis üretir.
+        Suit'e bağlı alanlar (flush_suit, highest_card) boş döner; gerçek
+        board'dan çağıran doldurur.
+        """
+        fields = self._fields.get(row)
+        if fields is None:
+            col = self.columns
+            pair_rank = int(col['pair_rank'][row])
+            fields = {name: bool(col[name][row]) for name in _BOOL_COLUMNS}
+            fields.update({name: int(col[name][row]) for name in _INT_COLUMNS})
+            fields.update(
+                texture=BoardTexture(int(col['texture'][row])),
+                pair_rank=RANKS[pair_rank] if pair_rank >= 0 else None,
+                description=str(col['descriptions'][col['description_id'][row]])
+            )
+            self._fields[row] = fields
+        return BoardAnalysis(**fields)
+
+    def query(self, **conditions) -> np.ndarray:
+        """
+        Koşulları sağlayan satır indeksleri.
+
+        Her koşul kolon adı = değer (eşitlik) veya (alt, üst) aralığıdır
+        (uçlar dahil, None = sınırsız). BoardTexture değerleri kabul edilir.
+
+        Örn: query(num_cards=3, same_suit_count=3, danger_level=(7, None))
+        """
+        selected = np.ones(len(self), dtype=bool)
+        for name, condition in conditions.items():
+            column = self.columns[name]
+            if isinstance(condition, tuple):
+                low, high = condition
+                if low is not None:
+                    selected &= column >= low
+                if high is not None:
+                    selected &= column <= high
+            else:
+                if isinstance(condition, BoardTexture):
+                    condition = condition.value
+                selected &= column == condition
+        return np.flatnonzero(selected)
+
+    def boards(self, rows: Sequence[int]) -> List[Tuple[int, ...]]:
+        """Satırların kanonik board kartları."""
+        return [
+            tuple(int(c) for c in self.columns['cards'][row] if c >= 0) for row in rows
+        ]
+
+
+_default_table: Optional[TextureTable] = None
+
+
+def get_texture_table() -> Optional[TextureTable]:
+    """Paketteki tablo (dosya yoksa None)."""
+    global _default_table
+    if _default_table is None and os.path.exists(default_table_path()):
+        _default_table = TextureTable.load()
+    return _default_table
+
+
+if __name__ == "__main__":
+    import sys
+
+    sizes = (3, 4, 5) if "--rivers" in sys.argv else (3, 4)
+    start = time.time()
+    table = TextureTable(build_texture_table(sizes))
+    table.save()
+    print(f"{len(table)} board, {time.time() - start:.1f}s -> {default_table_path()}")
+    for size in sizes:
+        print(f"  {size} kart: {len(table.query(num_cards=size))}")
+    monotone = table.query(num_cards=3, same_suit_count=3, danger_level=(7, None))
+    print(f"Monotone flop, danger >= 7: {len(monotone)}")